@@ -0,0 +1,30 @@
+"""add keyset pagination indexes on events
+
+They supersede ``ix_events_starts_at`` and ``ix_events_sport_starts_at``, their leading
+columns. No migration creates those, but databases built from the earlier models have them.
+
+Revision ID: 202610170900
+Revises: 202511081000
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "202610170900"
+down_revision: str | None = "202511081000"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_starts_at_id", "events", ["starts_at", "id"], unique=False)
+    op.create_index("ix_events_sport_id_starts_at_id", "events", ["sport_id", "starts_at", "id"], unique=False)
+    op.execute("DROP INDEX IF EXISTS ix_events_starts_at")
+    op.execute("DROP INDEX IF EXISTS ix_events_sport_starts_at")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_sport_id_starts_at_id", table_name="events")
+    op.drop_index("ix_events_starts_at_id", table_name="events")
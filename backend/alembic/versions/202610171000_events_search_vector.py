@@ -0,0 +1,143 @@
+"""add trigger-maintained full-text search vector on events
+
+A generated column cannot read other tables, and participant team names live in
+``event_participants``/``teams``, so the vector is kept current by triggers instead:
+
+* a row trigger on ``events`` recomputes it when title or description change;
+* statement triggers on ``event_participants`` (insert/update/delete) and on team renames
+  recompute it for the affected events once per statement, so COPY batches stay cheap.
+
+Revision ID: 202610171000
+Revises: 202610170900
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "202610171000"
+down_revision: str | None = "202610170900"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        CREATE FUNCTION events_search_document(p_event_id uuid, p_title text, p_description text)
+        RETURNS tsvector
+        LANGUAGE sql STABLE
+        AS $$
+            SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+                || setweight(to_tsvector('english', coalesce((
+                       SELECT string_agg(t.name, ' ')
+                       FROM event_participants p
+                       JOIN teams t ON t.id = p.team_id
+                       WHERE p.event_id = p_event_id
+                   ), '')), 'B')
+                || setweight(to_tsvector('english', coalesce(p_description, '')), 'C')
+        $$
+        """)
+    op.execute("""
+        CREATE FUNCTION events_search_vector_refresh() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            NEW.search_vector := events_search_document(NEW.id, NEW.title, NEW.description);
+            RETURN NEW;
+        END
+        $$
+        """)
+    op.execute("""
+        CREATE TRIGGER events_search_vector_refresh
+        BEFORE INSERT OR UPDATE OF title, description ON events
+        FOR EACH ROW EXECUTE FUNCTION events_search_vector_refresh()
+        """)
+
+    op.execute("""
+        CREATE FUNCTION event_participants_search_refresh() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (SELECT event_id FROM new_rows);
+            ELSIF TG_OP = 'UPDATE' THEN
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (SELECT event_id FROM new_rows UNION SELECT event_id FROM old_rows);
+            ELSE
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (SELECT event_id FROM old_rows);
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """)
+    # Transition tables need one trigger per event type.
+    op.execute("""
+        CREATE TRIGGER event_participants_search_insert
+        AFTER INSERT ON event_participants
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION event_participants_search_refresh()
+        """)
+    op.execute("""
+        CREATE TRIGGER event_participants_search_update
+        AFTER UPDATE ON event_participants
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION event_participants_search_refresh()
+        """)
+    op.execute("""
+        CREATE TRIGGER event_participants_search_delete
+        AFTER DELETE ON event_participants
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION event_participants_search_refresh()
+        """)
+
+    op.execute("""
+        CREATE FUNCTION teams_search_refresh() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE events e
+            SET search_vector = events_search_document(e.id, e.title, e.description)
+            WHERE e.id IN (
+                SELECT p.event_id
+                FROM event_participants p
+                JOIN new_rows n ON n.id = p.team_id
+                JOIN old_rows o ON o.id = n.id
+                WHERE n.name IS DISTINCT FROM o.name
+            );
+            RETURN NULL;
+        END
+        $$
+        """)
+    op.execute("""
+        CREATE TRIGGER teams_search_refresh
+        AFTER UPDATE ON teams
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION teams_search_refresh()
+        """)
+
+    op.execute("UPDATE events SET search_vector = events_search_document(id, title, description)")
+    op.create_index("ix_events_search_vector", "events", ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_search_vector", table_name="events", postgresql_using="gin")
+    op.execute("DROP TRIGGER IF EXISTS teams_search_refresh ON teams")
+    op.execute("DROP FUNCTION IF EXISTS teams_search_refresh()")
+    op.execute("DROP TRIGGER IF EXISTS event_participants_search_delete ON event_participants")
+    op.execute("DROP TRIGGER IF EXISTS event_participants_search_update ON event_participants")
+    op.execute("DROP TRIGGER IF EXISTS event_participants_search_insert ON event_participants")
+    op.execute("DROP FUNCTION IF EXISTS event_participants_search_refresh()")
+    op.execute("DROP TRIGGER IF EXISTS events_search_vector_refresh ON events")
+    op.execute("DROP FUNCTION IF EXISTS events_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS events_search_document(uuid, text, text)")
+    op.drop_column("events", "search_vector")
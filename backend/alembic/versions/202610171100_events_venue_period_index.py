@@ -0,0 +1,33 @@
+"""add GiST index on (venue_id, booked period) for venue overlap probes
+
+Revision ID: 202610171100
+Revises: 202610171000
+Create Date: 2026-10-17 11:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "202610171100"
+down_revision: str | None = "202610171000"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # btree_gist provides the GiST operator class for the uuid equality column.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_index(
+        "ix_events_venue_period",
+        "events",
+        ["venue_id", sa.text("tstzrange(starts_at, ends_at, '[)')")],
+        unique=False,
+        postgresql_using="gist",
+        postgresql_where=sa.text("venue_id IS NOT NULL AND status <> 'cancelled'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_venue_period", table_name="events", postgresql_using="gist")
@@ -0,0 +1,133 @@
+"""copy each event's period onto its participants and index team schedules
+
+``event_participants`` gains ``starts_at``/``ends_at``, kept equal to the event's by triggers,
+so a team's fixtures can be read in start order straight from ``(team_id, starts_at)`` and
+team double-bookings can be probed with a GiST range index, without visiting ``events`` first.
+
+Revision ID: 202610171200
+Revises: 202610171100
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "202610171200"
+down_revision: str | None = "202610171100"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_SEARCH_REFRESH_BODY = """
+        CREATE OR REPLACE FUNCTION event_participants_search_refresh() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (SELECT event_id FROM new_rows);
+            ELSIF TG_OP = 'UPDATE' THEN
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (%s);
+            ELSE
+                UPDATE events e
+                SET search_vector = events_search_document(e.id, e.title, e.description)
+                WHERE e.id IN (SELECT event_id FROM old_rows);
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+_ALL_UPDATED_EVENTS = "SELECT event_id FROM new_rows UNION SELECT event_id FROM old_rows"
+# Period copies from events must not re-rank every participant's event.
+_RELINKED_EVENTS = """
+                    SELECT e2.event_id
+                    FROM new_rows n
+                    JOIN old_rows o ON o.id = n.id
+                    CROSS JOIN LATERAL (VALUES (n.event_id), (o.event_id)) AS e2(event_id)
+                    WHERE (n.event_id, n.team_id) IS DISTINCT FROM (o.event_id, o.team_id)
+                """
+
+
+def upgrade() -> None:
+    op.add_column("event_participants", sa.Column("starts_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("event_participants", sa.Column("ends_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute(_SEARCH_REFRESH_BODY % _RELINKED_EVENTS)
+
+    op.execute("""
+        CREATE FUNCTION event_participants_copy_period() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            SELECT e.starts_at, e.ends_at INTO NEW.starts_at, NEW.ends_at
+            FROM events e
+            WHERE e.id = NEW.event_id;
+            RETURN NEW;
+        END
+        $$
+        """)
+    op.execute("""
+        CREATE TRIGGER event_participants_copy_period
+        BEFORE INSERT OR UPDATE OF event_id, starts_at, ends_at ON event_participants
+        FOR EACH ROW EXECUTE FUNCTION event_participants_copy_period()
+        """)
+    op.execute("""
+        CREATE FUNCTION events_propagate_period() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE event_participants
+            SET starts_at = NEW.starts_at, ends_at = NEW.ends_at
+            WHERE event_id = NEW.id;
+            RETURN NULL;
+        END
+        $$
+        """)
+    op.execute("""
+        CREATE TRIGGER events_propagate_period
+        AFTER UPDATE OF starts_at, ends_at ON events
+        FOR EACH ROW
+        WHEN (OLD.starts_at IS DISTINCT FROM NEW.starts_at OR OLD.ends_at IS DISTINCT FROM NEW.ends_at)
+        EXECUTE FUNCTION events_propagate_period()
+        """)
+
+    op.execute("""
+        UPDATE event_participants p
+        SET starts_at = e.starts_at, ends_at = e.ends_at
+        FROM events e
+        WHERE e.id = p.event_id
+        """)
+    op.alter_column("event_participants", "starts_at", nullable=False)
+    op.alter_column("event_participants", "ends_at", nullable=False)
+
+    # Supersedes ix_event_participants_team_id, which is its leading column. No migration creates
+    # that index, but databases built from the models before this revision have it.
+    op.create_index(
+        "ix_event_participants_team_id_starts_at",
+        "event_participants",
+        ["team_id", "starts_at", "event_id"],
+        unique=False,
+    )
+    op.execute("DROP INDEX IF EXISTS ix_event_participants_team_id")
+    op.create_index(
+        "ix_event_participants_team_period",
+        "event_participants",
+        ["team_id", sa.text("tstzrange(starts_at, ends_at, '[)')")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_participants_team_period", table_name="event_participants", postgresql_using="gist")
+    op.drop_index("ix_event_participants_team_id_starts_at", table_name="event_participants")
+    op.execute("DROP TRIGGER IF EXISTS events_propagate_period ON events")
+    op.execute("DROP FUNCTION IF EXISTS events_propagate_period()")
+    op.execute("DROP TRIGGER IF EXISTS event_participants_copy_period ON event_participants")
+    op.execute("DROP FUNCTION IF EXISTS event_participants_copy_period()")
+    op.execute(_SEARCH_REFRESH_BODY % _ALL_UPDATED_EVENTS)
+    op.drop_column("event_participants", "ends_at")
+    op.drop_column("event_participants", "starts_at")
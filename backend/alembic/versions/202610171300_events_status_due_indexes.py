@@ -0,0 +1,42 @@
+"""add partial indexes for events due a status transition
+
+The status scheduler looks for scheduled events whose start has passed and unfinished
+events whose end has passed; these partial indexes hold only those candidates, so each
+tick reads a short index range instead of scanning ``events``.
+
+Revision ID: 202610171300
+Revises: 202610171200
+Create Date: 2026-10-17 13:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "202610171300"
+down_revision: str | None = "202610171200"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_due_live",
+        "events",
+        ["starts_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'scheduled'"),
+    )
+    op.create_index(
+        "ix_events_due_finished",
+        "events",
+        ["ends_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('scheduled', 'live')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_due_finished", table_name="events")
+    op.drop_index("ix_events_due_live", table_name="events")
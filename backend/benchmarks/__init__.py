@@ -0,0 +1 @@
+"""Ad-hoc performance benchmarks that run against a local Postgres."""
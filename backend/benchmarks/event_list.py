@@ -0,0 +1,105 @@
+"""Compare the ORM and json_agg read paths of ``EventRepository`` at one page size.
+
+Usage (from ``backend/``, with ``DATABASE_URL`` pointing at a disposable database)::
+
+    python -m benchmarks.event_list --events 2000 --page-size 100 --iterations 50
+
+Fixture rows are inserted inside a transaction that is rolled back at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.seeds import seed_reference_data
+from app.db.session import async_session_factory, build_engine
+from app.models import Event, EventParticipant, EventParticipantRole, Sport, Team
+from app.repositories import EventRepository
+from app.schemas import EventRead
+from app.services.event_filters import EventListParams, Pagination
+
+
+async def _insert_fixture(session: AsyncSession, count: int) -> Sport:
+    sport = (await session.scalars(select(Sport).order_by(Sport.name))).first()
+    teams = list((await session.scalars(select(Team).where(Team.sport_id == sport.id).limit(2))).all())
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    rows = [
+        {
+            "sport_id": sport.id,
+            "title": f"Benchmark fixture {idx}",
+            "description": "Benchmark fixture " * 10,
+            "starts_at": start + timedelta(hours=idx),
+            "ends_at": start + timedelta(hours=idx, minutes=90),
+        }
+        for idx in range(count)
+    ]
+    ids = (await session.scalars(insert(Event).returning(Event.id), rows)).all()
+    if len(teams) == 2:
+        await session.execute(
+            insert(EventParticipant),
+            [
+                {"event_id": event_id, "team_id": team.id, "role": role}
+                for event_id in ids
+                for team, role in zip(teams, (EventParticipantRole.HOME, EventParticipantRole.AWAY), strict=True)
+            ],
+        )
+    return sport
+
+
+async def _time(label: str, iterations: int, fn: Callable[[], Awaitable[bytes]]) -> None:
+    await fn()  # warm up statement and compilation caches
+    samples = []
+    size = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        size = len(await fn())
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{label:<6} median={statistics.median(samples):7.2f}ms  p95={p95:7.2f}ms  body={size} bytes")
+
+
+async def _main(args: argparse.Namespace) -> None:
+    repository = EventRepository()
+    async with async_session_factory()() as session:
+        await seed_reference_data(session)
+        sport = await _insert_fixture(session, args.events)
+        params = EventListParams(sport_id=sport.id, pagination=Pagination(page=args.page, page_size=args.page_size))
+
+        async def orm_path() -> bytes:
+            session.expunge_all()
+            page = await repository.list_page(session, params=params)
+            payload = [EventRead.model_validate(e) for e in page.items]
+            return json.dumps(jsonable_encoder(payload)).encode()
+
+        async def json_path() -> bytes:
+            page = await repository.list_json(session, params=params)
+            return page.items
+
+        await _time("orm", args.iterations, orm_path)
+        await _time("json", args.iterations, json_path)
+        await session.rollback()
+    await build_engine().dispose()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2000, help="fixture events to insert")
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
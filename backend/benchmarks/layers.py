@@ -0,0 +1,348 @@
+"""Time each layer of the event read and write paths separately.
+
+Listing ``EventRepository.list_page`` at every ``--page-sizes`` x ``--participants`` combination:
+
+* ``query.build``     - listing statement lookup and bind values (per request)
+* ``query.compile``   - compiling that statement from scratch (a compiled-cache miss)
+* ``db.execute``      - time inside cursor execution, page query plus relationship loads
+* ``orm.hydrate``     - the rest of ``list_page``: result processing, identity map, loaders
+* ``schema.validate`` - ``list[EventRead]`` validated from the ORM rows, as handlers do
+* ``json.encode``     - ``dump_json`` of the validated page
+
+and ``EventService.create_event`` per participant count as ``service.create_event`` (total)
+and ``service.create_event.db`` (its cursor time). Reference data is seeded if missing;
+fixture rows are inserted inside a transaction that is rolled back at the end. On a
+database loaded with ``scripts.generate_data`` they sit among realistic volumes, so the
+execution numbers are realistic too.
+
+Usage (from ``backend/``, with ``DATABASE_URL`` pointing at a disposable, migrated database)::
+
+    python -m benchmarks.layers --output before.json
+    python -m benchmarks.layers --baseline before.json --output after.json
+
+With ``--baseline``, medians are compared per layer and combination and the exit status is
+1 when any is slower than the baseline by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.db.seeds import seed_reference_data
+from app.db.session import async_session_factory, build_engine
+from app.models import Event, EventParticipant, EventParticipantRole, Sport, Team
+from app.repositories import EventRepository
+from app.repositories.event import _bind_values
+from app.schemas import EventCreate, EventParticipantCreate, EventRead
+from app.services import EventService
+from app.services.event_filters import EventListParams, Pagination
+
+_EVENT_LIST = TypeAdapter(list[EventRead])
+_WARMUP = 3
+
+
+class _CursorClock:
+    """Sums time spent between ``before_cursor_execute`` and ``after_cursor_execute``.
+
+    asyncpg fetches all rows during execute, so this covers the round trip, server work
+    and record decoding, but none of SQLAlchemy's result processing.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.seconds = 0.0
+        self._engine = engine.sync_engine
+        self._started: list[float] = []
+
+    def __enter__(self) -> _CursorClock:
+        event.listen(self._engine, "before_cursor_execute", self._before)
+        event.listen(self._engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._before)
+        event.remove(self._engine, "after_cursor_execute", self._after)
+
+    def _before(self, *args: Any) -> None:
+        self._started.append(time.perf_counter())
+
+    def _after(self, *args: Any) -> None:
+        self.seconds += time.perf_counter() - self._started.pop()
+
+
+def _summary(layer: str, samples: list[float], **labels: Any) -> dict[str, Any]:
+    ordered = sorted(samples)
+    return {
+        "layer": layer,
+        **labels,
+        "iterations": len(ordered),
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+    }
+
+
+def _time_sync(iterations: int, fn: Callable[[], object]) -> list[float]:
+    for _ in range(_WARMUP):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _time_split(
+    iterations: int,
+    clock: _CursorClock,
+    fn: Callable[[], Awaitable[object]],
+    *,
+    setup: Callable[[], object] = lambda: None,
+) -> tuple[list[float], list[float]]:
+    """Wall and cursor seconds per call of ``fn``; ``setup`` runs untimed before each call."""
+
+    for _ in range(_WARMUP):
+        setup()
+        await fn()
+    walls, cursors = [], []
+    for _ in range(iterations):
+        setup()
+        clock.seconds = 0.0
+        started = time.perf_counter()
+        await fn()
+        walls.append(time.perf_counter() - started)
+        cursors.append(clock.seconds)
+    return walls, cursors
+
+
+async def _insert_fixture(session: AsyncSession, participants: int, events: int) -> tuple[Sport, list[Team]]:
+    """A throwaway sport whose ``events`` events each have ``participants`` teams."""
+
+    sport = Sport(code=f"benchmark-{uuid4().hex[:12]}", name=f"Benchmark ({participants} participants)")
+    session.add(sport)
+    await session.flush()
+    teams = [Team(sport_id=sport.id, name=f"Benchmark team {idx}", abbr=f"B{idx}") for idx in range(participants)]
+    session.add_all(teams)
+    await session.flush()
+
+    start = datetime(2031, 1, 1, tzinfo=UTC)
+    rows = [
+        {
+            "sport_id": sport.id,
+            "title": f"Benchmark fixture {idx}",
+            "description": "Benchmark fixture " * 10,
+            "starts_at": start + timedelta(hours=idx),
+            "ends_at": start + timedelta(hours=idx, minutes=90),
+            "ticket_url": f"https://tickets.example.com/{idx}",
+        }
+        for idx in range(events)
+    ]
+    ids = (await session.scalars(insert(Event).returning(Event.id), rows)).all()
+    roles = _roles(participants)
+    await session.execute(
+        insert(EventParticipant),
+        [
+            {"event_id": event_id, "team_id": team.id, "role": role}
+            for event_id in ids
+            for team, role in zip(teams, roles, strict=True)
+        ],
+    )
+    return sport, teams
+
+
+def _roles(participants: int) -> list[EventParticipantRole]:
+    if participants == 2:
+        return [EventParticipantRole.HOME, EventParticipantRole.AWAY]
+    return [EventParticipantRole.PARTICIPANT] * participants
+
+
+async def _bench_list(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    clock: _CursorClock,
+    sport: Sport,
+    *,
+    page_size: int,
+    participants: int,
+    iterations: int,
+) -> list[dict[str, Any]]:
+    repository = EventRepository()
+    params = EventListParams(
+        sport_id=sport.id, pagination=Pagination(page=1, page_size=page_size, max_page_size=page_size)
+    )
+    labels = {"page_size": page_size, "participants": participants}
+
+    def build() -> object:
+        return repository._list_query(params), _bind_values(params, limit=page_size + 1)
+
+    statement = repository._list_query(params)
+    build_samples = _time_sync(iterations, build)
+    compile_samples = _time_sync(iterations, lambda: statement.compile(dialect=engine.dialect))
+
+    async def list_page() -> object:
+        return await repository.list_page(session, params=params)
+
+    # Emptying the identity map makes every call hydrate fresh objects, as a request session would.
+    walls, cursors = await _time_split(iterations, clock, list_page, setup=session.expunge_all)
+    events = (await repository.list_page(session, params=params)).items
+    validated = _EVENT_LIST.validate_python(events, from_attributes=True)
+    validate_samples = _time_sync(iterations, lambda: _EVENT_LIST.validate_python(events, from_attributes=True))
+    encode_samples = _time_sync(iterations, lambda: _EVENT_LIST.dump_json(validated))
+
+    return [
+        _summary("query.build", build_samples, **labels),
+        _summary("query.compile", compile_samples, **labels),
+        _summary("db.execute", cursors, **labels),
+        _summary("orm.hydrate", [wall - cursor for wall, cursor in zip(walls, cursors, strict=True)], **labels),
+        _summary("schema.validate", validate_samples, **labels),
+        {**_summary("json.encode", encode_samples, **labels), "body_bytes": len(_EVENT_LIST.dump_json(validated))},
+    ]
+
+
+async def _bench_create(
+    session: AsyncSession,
+    clock: _CursorClock,
+    sport: Sport,
+    teams: list[Team],
+    *,
+    participants: int,
+    iterations: int,
+) -> list[dict[str, Any]]:
+    service = EventService()
+    starts_at = datetime(2040, 1, 1, tzinfo=UTC)
+    data = EventCreate(
+        sport_id=sport.id,
+        title="Benchmark create",
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=2),
+        participants=[
+            EventParticipantCreate(team_id=team.id, role=role)
+            for team, role in zip(teams, _roles(participants), strict=True)
+        ],
+    )
+
+    async def create() -> object:
+        savepoint = await session.begin_nested()
+        try:
+            return await service.create_event(session, data)
+        finally:
+            await savepoint.rollback()
+            session.expunge_all()
+
+    walls, cursors = await _time_split(iterations, clock, create)
+    labels = {"page_size": None, "participants": participants}
+    return [
+        _summary("service.create_event", walls, **labels),
+        _summary("service.create_event.db", cursors, **labels),
+    ]
+
+
+def _git_revision() -> str | None:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False)
+    return result.stdout.strip() or None
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    engine = build_engine()
+    results: list[dict[str, Any]] = []
+    async with async_session_factory()() as session:
+        await seed_reference_data(session)
+        server_version = await session.scalar(text("SHOW server_version"))
+        with _CursorClock(engine) as clock:
+            for participants in args.participants:
+                sport, teams = await _insert_fixture(session, participants, max(args.page_sizes) + 1)
+                for page_size in args.page_sizes:
+                    results += await _bench_list(
+                        session,
+                        engine,
+                        clock,
+                        sport,
+                        page_size=page_size,
+                        participants=participants,
+                        iterations=args.iterations,
+                    )
+                results += await _bench_create(
+                    session, clock, sport, teams, participants=participants, iterations=args.iterations
+                )
+        await session.rollback()
+    await engine.dispose()
+    return {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "postgres": server_version,
+            "packages": {name: version(name) for name in ("sqlalchemy", "asyncpg", "pydantic")},
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+
+
+def _key(result: dict[str, Any]) -> tuple[str, int | None, int]:
+    return result["layer"], result["page_size"], result["participants"]
+
+
+def _report(report: dict[str, Any], baseline: dict[str, Any] | None, threshold: float) -> int:
+    """Print the results (against ``baseline`` when given); the number of regressions."""
+
+    previous = {_key(result): result for result in baseline["results"]} if baseline else {}
+    regressions = 0
+    print(f"{'layer':<26}{'page':>6}{'parts':>7}{'median ms':>12}{'p95 ms':>10}{'baseline':>11}{'change':>9}")
+    for result in report["results"]:
+        line = (
+            f"{result['layer']:<26}{result['page_size'] or '-':>6}{result['participants']:>7}"
+            f"{result['median_ms']:>12.3f}{result['p95_ms']:>10.3f}"
+        )
+        before = previous.get(_key(result))
+        if before and before["median_ms"] > 0:
+            change = result["median_ms"] / before["median_ms"] - 1
+            regressed = change > threshold
+            regressions += regressed
+            line += f"{before['median_ms']:>11.3f}{change:>+9.1%}" + ("  REGRESSION" if regressed else "")
+        print(line)
+    if baseline:
+        print(f"\n{regressions} regression(s) beyond {threshold:.0%} against {baseline['meta'].get('git_revision')}")
+    return regressions
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--participants", type=int, nargs="+", default=[2, 10], help="participants per event")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="median slowdown counted as a regression")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    report = asyncio.run(_run(args))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    return 1 if _report(report, baseline, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
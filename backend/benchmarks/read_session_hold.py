@@ -0,0 +1,83 @@
+"""Measure how long ``GET /events`` keeps a pooled connection checked out.
+
+Compares the committing request session (``get_db_session``) with the read-only session
+(``get_read_db_session``), using the hold-time numbers from the instrumented pool.
+
+Usage (from ``backend/``, with ``DATABASE_URL`` pointing at a disposable database)::
+
+    python -m benchmarks.read_session_hold --events 500 --page-size 100 --requests 200
+
+Fixture rows are committed so every request can see them and are deleted at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from app.api.deps import get_db_session, get_read_db_session
+from app.db.seeds import seed_reference_data
+from app.db.session import async_session_factory, build_engine
+from app.main import app
+from app.models import Event
+from benchmarks.event_list import _insert_fixture
+
+_FIXTURE_PREFIX = "Benchmark fixture"
+
+
+async def _run(client: AsyncClient, label: str, args: argparse.Namespace) -> None:
+    pool = build_engine().pool
+    params = {"page_size": args.page_size}
+    await client.get("/api/v1/events", params=params)  # warm up
+    pool.metrics.reset()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            (await client.get("/api/v1/events", params=params)).raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    stats = pool.stats()
+    print(
+        f"{label:<10} hold avg={stats.hold_ms_avg:6.2f}ms max={stats.hold_ms_max:7.2f}ms  "
+        f"wait max={stats.wait_ms_max:7.2f}ms  throughput={args.requests / elapsed:7.1f} req/s"
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    async with async_session_factory()() as session:
+        await seed_reference_data(session)
+        await _insert_fixture(session, args.events)
+        await session.commit()
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            app.dependency_overrides[get_read_db_session] = get_db_session
+            await _run(client, "commit", args)
+            app.dependency_overrides.pop(get_read_db_session)
+            await _run(client, "read-only", args)
+    finally:
+        app.dependency_overrides.clear()
+        async with async_session_factory()() as session:
+            await session.execute(delete(Event).where(Event.title.startswith(_FIXTURE_PREFIX)))
+            await session.commit()
+        await build_engine().dispose()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=500, help="fixture events to insert")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
@@ -0,0 +1,105 @@
+"""Compare ways of turning a page of ORM-shaped events into a JSON response body.
+
+* ``stdlib``  - ``model_validate`` per row, ``jsonable_encoder`` and ``json.dumps``
+* ``fastapi`` - ``model_validate`` per row, then FastAPI's response-model pass
+  (validate against ``list[EventRead]``, then ``dump_json``), as handlers used to do
+* ``single``  - ``orm_json_response``: one validation from attributes, one ``dump_json``
+
+No database is needed; rows are plain objects with the attributes the ORM would load.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.serialization --page-sizes 20 100 --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.responses import orm_json_response
+from app.models.event import EventParticipantRole, EventStatus
+from app.schemas import EventRead
+
+_EVENT_LIST = TypeAdapter(list[EventRead])
+
+
+def _rows(count: int) -> list[SimpleNamespace]:
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            sport_id=uuid4(),
+            sport_name="Football",
+            venue_id=uuid4(),
+            title=f"Benchmark fixture {idx}",
+            description="Benchmark fixture " * 10,
+            starts_at=start + timedelta(hours=idx),
+            ends_at=start + timedelta(hours=idx, minutes=90),
+            status=EventStatus.SCHEDULED,
+            ticket_url=f"https://tickets.example.com/{idx}",
+            participants=[
+                SimpleNamespace(team_id=uuid4(), role=EventParticipantRole.HOME, team_name="Home side"),
+                SimpleNamespace(team_id=uuid4(), role=EventParticipantRole.AWAY, team_name="Away side"),
+            ],
+        )
+        for idx in range(count)
+    ]
+
+
+def _time(label: str, iterations: int, fn: Callable[[], bytes]) -> float:
+    size = len(fn())  # warm up
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    median = statistics.median(samples)
+    print(f"  {label:<8} median={median:8.1f}us  body={size} bytes")
+    return median
+
+
+def _compare(page_size: int, iterations: int) -> None:
+    rows = _rows(page_size)
+
+    def stdlib() -> bytes:
+        return json.dumps(jsonable_encoder([EventRead.model_validate(r) for r in rows])).encode()
+
+    def fastapi() -> bytes:
+        models = [EventRead.model_validate(r) for r in rows]
+        return _EVENT_LIST.dump_json(_EVENT_LIST.validate_python(models))
+
+    def single() -> bytes:
+        return orm_json_response(_EVENT_LIST, rows).body
+
+    print(f"page_size={page_size}")
+    _time("stdlib", iterations, stdlib)
+    baseline = _time("fastapi", iterations, fastapi)
+    fast = _time("single", iterations, single)
+    # Handlers used the fastapi path before; stdlib is shown for reference only.
+    print(f"  single takes {fast / baseline:.0%} of the fastapi time ({1 - fast / baseline:.1%} saved)")
+
+
+def _main(args: argparse.Namespace) -> None:
+    for page_size in args.page_sizes:
+        _compare(page_size, args.iterations)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--iterations", type=int, default=2000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    _main(_parse_args())
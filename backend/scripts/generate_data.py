@@ -0,0 +1,95 @@
+"""Load deterministic synthetic sports, teams, venues, events and participants through COPY.
+
+Usage (from ``backend/``, with ``DATABASE_URL`` pointing at a migrated, disposable database)::
+
+    python -m scripts.generate_data --events 5000000 --teams-per-sport 400 --seed 7 --truncate
+
+The same arguments always produce the same rows and ids. Without ``--as-of``, statuses are
+decided relative to the middle of the generated seasons rather than the wall clock.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.notify import notify_reference_changes
+from app.db.session import async_session_factory, build_engine
+from app.db.synthetic import SyntheticData, SyntheticDataSpec, load_synthetic_data
+
+_TABLES = ("sports", "venues", "teams", "events")
+
+
+async def _is_empty(session: AsyncSession) -> bool:
+    for table in _TABLES:
+        if await session.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {table})")):
+            return False
+    return True
+
+
+async def _main(args: argparse.Namespace) -> None:
+    spec = SyntheticDataSpec(
+        sports=args.sports,
+        teams_per_sport=args.teams_per_sport,
+        venues=args.venues,
+        events=args.events,
+        seasons=args.seasons,
+        first_season=args.first_season,
+        field_size=args.field_size,
+        venue_ratio=args.venue_ratio,
+        cancelled_ratio=args.cancelled_ratio,
+        seed=args.seed,
+        as_of=args.as_of,
+    )
+    data = SyntheticData(spec)
+    started = time.perf_counter()
+
+    def progress(events: int) -> None:
+        rate = events / (time.perf_counter() - started)
+        print(f"{events:>12,} / {spec.events:,} events  ({rate:,.0f}/s)", flush=True)
+
+    async with async_session_factory()() as session:
+        if args.truncate:
+            await session.execute(text("TRUNCATE event_participants, events, teams, venues, sports"))
+            await session.commit()
+        elif not await _is_empty(session):
+            raise SystemExit("Reference or event tables already hold rows; rerun with --truncate to replace them.")
+        counts = await load_synthetic_data(session, data, batch_size=args.batch_size, on_batch=progress)
+        # Running API workers drop their cached sports, teams and venues.
+        await notify_reference_changes(session)
+        await session.commit()
+    await build_engine().dispose()
+    print(
+        f"Loaded {counts.sports} sports, {counts.venues} venues, {counts.teams} teams, {counts.events:,} events "
+        f"and {counts.participants:,} participants in {time.perf_counter() - started:.1f}s "
+        f"(statuses as of {spec.reference_time.isoformat()})"
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sports", type=int, default=6)
+    parser.add_argument("--teams-per-sport", type=int, default=400)
+    parser.add_argument("--venues", type=int, default=1200)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--seasons", type=int, default=3)
+    parser.add_argument("--first-season", type=int, default=2024, help="year the first season starts in")
+    parser.add_argument("--field-size", type=int, default=20, help="participants per event in non head-to-head sports")
+    parser.add_argument("--venue-ratio", type=float, default=0.85, help="share of events at the home venue, when free")
+    parser.add_argument("--cancelled-ratio", type=float, default=0.03)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--as-of", type=datetime.fromisoformat, default=None, help="timezone-aware ISO time deciding statuses"
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="events per COPY transaction")
+    parser.add_argument("--truncate", action="store_true", help="empty the domain tables first")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db.session import async_session_factory
+from app.services.status_scheduler import StatusScheduler
+
+
+async def _main() -> None:
+    scheduler = StatusScheduler(
+        async_session_factory(),
+        interval=settings.STATUS_SCHEDULER_INTERVAL_SECONDS,
+        batch_size=settings.STATUS_SCHEDULER_BATCH_SIZE,
+    )
+    await scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
@@ -0,0 +1,76 @@
+"""Helpers for ``ETag`` / ``Last-Modified`` validators and conditional GETs."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from uuid import UUID
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+
+def build_validators(
+    versions: Iterable[tuple[UUID, datetime]], *, variant: str = "", collection: bool = False
+) -> Validators:
+    """Derive a strong ETag from the ``(id, updated_at)`` of every row in a response.
+
+    ``variant`` separates representations of the same rows (e.g. different encoders)
+    so each keeps its own byte-exact validator. A ``collection`` gets no ``Last-Modified``:
+    rows can leave a filtered page and older ones shift in without the newest ``updated_at``
+    changing, so only the ETag tells the pages apart.
+    """
+
+    digest = hashlib.blake2b(variant.encode(), digest_size=16)
+    last_modified: datetime | None = None
+    for event_id, updated_at in versions:
+        digest.update(f"|{event_id}:{updated_at.isoformat()}".encode())
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    return Validators(etag=f'"{digest.hexdigest()}"', last_modified=None if collection else last_modified)
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """Evaluate ``If-None-Match`` (preferred) or ``If-Modified-Since`` per RFC 9110."""
+
+    if request.method not in ("GET", "HEAD"):
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or validators.etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return validators.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def apply_validators(response: Response, validators: Validators) -> None:
+    response.headers["ETag"] = validators.etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if validators.last_modified:
+        response.headers["Last-Modified"] = format_datetime(validators.last_modified.astimezone(UTC), usegmt=True)
+
+
+def not_modified(validators: Validators) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    apply_validators(response, validators)
+    return response
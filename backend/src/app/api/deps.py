@@ -1,10 +1,217 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.session import get_async_session
+from app.core.config import settings
+from app.db.notify import EVENT_CHANGES_CHANNEL, REFERENCE_CHANGES_CHANNEL, EventChange, PgListener, listen_dsn
+from app.db.session import (
+    async_session_factory,
+    build_read_only_engine,
+    get_async_read_session,
+    get_async_session,
+    open_read_session,
+)
+from app.models.event import Event
+from app.services import EventService
+from app.services.batching import BatchLoader
+from app.services.cache import ResponseCache, event_list_cache, invalidate_reference_data
+from app.services.event_cache import EventCache
+from app.services.event_filters import EventScope
+from app.services.live import EventBroadcaster
+
+_event_broadcaster: EventBroadcaster | None = None
+_event_loader: BatchLoader[UUID, Event] | None = None
+_event_cache: EventCache | None = None
+_reference_listener: asyncio.Task | None = None
+_listing_listener: PgListener | None = None
+_listing_listener_task: asyncio.Task | None = None
+
+logger = logging.getLogger(__name__)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_async_session():
         yield session
+
+
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for work that outlives the request handler, such as streamed responses."""
+
+    return async_session_factory()
+
+
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session for GET handlers; served by a read replica when one is configured.
+
+    It never commits. Declare it with ``Depends(..., scope="function")`` so the connection goes
+    back to the pool as soon as the handler returns, not after the response has been sent.
+    Replicas lag the primary, so anything that must see its own writes uses ``get_db_session``.
+    """
+
+    async for session in get_async_read_session():
+        yield session
+
+
+def get_read_db_session_factory() -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    """Read-side counterpart of ``get_db_session_factory`` for streamed responses."""
+
+    return open_read_session
+
+
+async def _load_event_documents(ids: Sequence[UUID]) -> dict[UUID, str]:
+    # The primary, not a replica: a notification can arrive before a replica has replayed the commit.
+    async with async_session_factory()(bind=build_read_only_engine()) as session:
+        return await EventService().get_event_documents(session, ids)
+
+
+def _open_event_session() -> AbstractAsyncContextManager[AsyncSession]:
+    if settings.EVENT_CACHE_TTL_SECONDS > 0:
+        # These loads fill the event cache, whose entries NOTIFY evicts as soon as a write commits;
+        # a lagging replica could answer the refill with the old row and have it cached for the TTL.
+        return async_session_factory()(bind=build_read_only_engine())
+    return open_read_session()
+
+
+async def _load_events(ids: Sequence[UUID]) -> dict[UUID, Event]:
+    async with _open_event_session() as session:
+        return await EventService().get_events(session, ids)
+
+
+def get_event_loader() -> BatchLoader[UUID, Event]:
+    """This worker's loader for single-event lookups; concurrent requests share one batched query."""
+
+    global _event_loader
+    if _event_loader is None:
+        _event_loader = BatchLoader(
+            _load_events,
+            window=settings.EVENT_LOADER_WINDOW_MS / 1000,
+            max_batch=settings.EVENT_LOADER_MAX_BATCH,
+        )
+    return _event_loader
+
+
+def _listen_dsn() -> str:
+    return listen_dsn(settings.EVENT_STREAM_DATABASE_URL or settings.async_database_url)
+
+
+def get_event_cache() -> EventCache | None:
+    """This worker's single-event cache, or None when it is disabled; it starts listening on first use."""
+
+    global _event_cache
+    if _event_cache is None and settings.EVENT_CACHE_TTL_SECONDS > 0:
+        _event_cache = EventCache(
+            ttl=settings.EVENT_CACHE_TTL_SECONDS,
+            max_entries=settings.EVENT_CACHE_MAX_ENTRIES,
+            listen_dsn=_listen_dsn(),
+        )
+    return _event_cache
+
+
+async def shutdown_event_cache() -> None:
+    global _event_cache
+    if _event_cache is not None:
+        await _event_cache.stop()
+        _event_cache = None
+
+
+def _reference_change(payload: str) -> None:
+    invalidate_reference_data(*(key for key in payload.split(",") if key))
+
+
+async def watch_reference_changes() -> None:
+    """Start this worker's ``LISTEN reference_changes`` on first use.
+
+    Writers such as the seed and data-generation scripts notify on commit, so every worker
+    drops its cached sports, teams and venues then rather than when their TTL runs out.
+    Notifications sent while the connection is down are lost; everything is dropped on
+    reconnect, and the TTL bounds staleness until then.
+    """
+
+    global _reference_listener
+    if _reference_listener is None:
+        listener = PgListener(
+            _listen_dsn(), REFERENCE_CHANGES_CHANNEL, _reference_change, on_reconnect=invalidate_reference_data
+        )
+        _reference_listener = asyncio.create_task(listener.run(), name="reference-cache-listen")
+
+
+async def shutdown_reference_listener() -> None:
+    global _reference_listener
+    if _reference_listener is not None:
+        _reference_listener.cancel()
+        await asyncio.gather(_reference_listener, return_exceptions=True)
+        _reference_listener = None
+
+
+def _listing_change(payload: str) -> None:
+    """Drop this worker's cached listings that could show the event named by one notification."""
+
+    if event_list_cache is None:
+        return
+    try:
+        change = EventChange.from_payload(payload)
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Flushing event listings after malformed change notification: %.200s", payload)
+        event_list_cache.clear()
+        return
+    if change.starts_at is None:
+        event_list_cache.clear()
+        return
+    scope = EventScope(change.sport_id, change.venue_id, change.starts_at, id=change.id)
+    event_list_cache.invalidate_where(lambda key: key.params.may_include(scope))
+
+
+async def get_event_list_cache() -> ResponseCache | None:
+    """This worker's cache of rendered event listings; None when it is disabled or not yet coherent.
+
+    Every committed event write sends ``NOTIFY event_changes``; the first call starts a
+    ``LISTEN`` that drops the listings other workers' writes could change. Notifications
+    sent while that connection is down are lost, so listings bypass the cache until it is
+    up and the cache is cleared on every reconnect.
+    """
+
+    global _listing_listener, _listing_listener_task
+    if event_list_cache is None:
+        return None
+    if _listing_listener is None:
+        _listing_listener = PgListener(
+            _listen_dsn(), EVENT_CHANGES_CHANNEL, _listing_change, on_reconnect=event_list_cache.clear
+        )
+        _listing_listener_task = asyncio.create_task(_listing_listener.run(), name="event-list-cache-listen")
+    return event_list_cache if _listing_listener.connected else None
+
+
+async def shutdown_listing_listener() -> None:
+    global _listing_listener, _listing_listener_task
+    if _listing_listener_task is not None:
+        _listing_listener_task.cancel()
+        await asyncio.gather(_listing_listener_task, return_exceptions=True)
+        _listing_listener_task = None
+    _listing_listener = None
+    if event_list_cache is not None:
+        event_list_cache.clear()
+
+
+def get_event_broadcaster() -> EventBroadcaster:
+    """This worker's broadcaster; its LISTEN connection opens with the first subscriber."""
+
+    global _event_broadcaster
+    if _event_broadcaster is None:
+        _event_broadcaster = EventBroadcaster(
+            _load_event_documents,
+            listen_dsn=_listen_dsn(),
+            max_subscribers=settings.EVENT_STREAM_MAX_SUBSCRIBERS,
+            max_pending=settings.EVENT_STREAM_MAX_PENDING,
+        )
+    return _event_broadcaster
+
+
+async def shutdown_event_broadcaster() -> None:
+    global _event_broadcaster
+    if _event_broadcaster is not None:
+        await _event_broadcaster.stop()
+        _event_broadcaster = None
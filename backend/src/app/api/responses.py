@@ -0,0 +1,45 @@
+"""JSON responses encoded once by Pydantic's serializer.
+
+Handlers keep ``response_model`` so the OpenAPI schema documents the payload, but return
+a ready :class:`~fastapi.Response`, which FastAPI sends as is. That skips its second
+validation pass against the response model: payloads are validated once, when they are
+built (usually from ORM rows), and encoded straight to bytes by ``TypeAdapter.dump_json``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(
+    adapter: TypeAdapter[T],
+    content: T,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """``content`` (already of the adapter's type) as a JSON response."""
+
+    return Response(adapter.dump_json(content), status_code=status_code, headers=headers, media_type=JSON_MEDIA_TYPE)
+
+
+def orm_json_response(
+    adapter: TypeAdapter[T],
+    rows: Any,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Validate ORM ``rows`` into the adapter's type from their attributes, then encode them."""
+
+    return json_response(
+        adapter, adapter.validate_python(rows, from_attributes=True), status_code=status_code, headers=headers
+    )
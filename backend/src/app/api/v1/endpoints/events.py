@@ -1,25 +1,100 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from pydantic import AwareDatetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import AwareDatetime, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
-from app.models.event import EventStatus
-from app.schemas import EventCreate, EventRead
-from app.services import EventService, ValidationError
-from app.services.event_filters import EventListParams, Pagination
+from app.api.conditional import Validators, apply_validators, build_validators, is_not_modified, not_modified
+from app.api.deps import (
+    get_db_session,
+    get_event_broadcaster,
+    get_event_cache,
+    get_event_list_cache,
+    get_event_loader,
+    get_read_db_session_factory,
+)
+from app.api.responses import JSON_MEDIA_TYPE, json_response, orm_json_response
+from app.core.config import settings
+from app.models.event import Event, EventStatus
+from app.schemas import (
+    EventBulkError,
+    EventBulkResult,
+    EventCreate,
+    EventRead,
+    EventStatusResult,
+    EventStatusUpdate,
+)
+from app.schemas.event import event_read_subset
+from app.services import CapacityError, ConflictError, EventService, ValidationError
+from app.services.batching import BatchLoader
+from app.services.cache import ResponseCache
+from app.services.event_cache import EventCache
+from app.services.event_filters import (
+    EVENT_LIST_FIELDS,
+    CountStrategy,
+    EventCursor,
+    EventFieldSet,
+    EventListingKey,
+    EventListParams,
+    EventPage,
+    ExportFormat,
+    Pagination,
+)
+from app.services.live import EventBroadcaster, EventStreamFilter, SubscriptionResetError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+# Sent on connect: how long browsers wait before reconnecting a dropped stream.
+_STREAM_PREAMBLE = b"retry: 3000\n: connected\n\n"
+_STREAM_KEEPALIVE = b": keep-alive\n\n"
+_STREAM_RESET = b"event: reset\ndata: {}\n\n"
+EXPORT_MEDIA_TYPES = {ExportFormat.ndjson: NDJSON_MEDIA_TYPE, ExportFormat.csv: "text/csv; charset=utf-8"}
+EVENT_MULTI_GET_MAX_IDS = 100
+_EVENT_CREATE = TypeAdapter(EventCreate)
+_EVENT_READ = TypeAdapter(EventRead)
+_BULK_RESULT = TypeAdapter(EventBulkResult)
+_STATUS_RESULT = TypeAdapter(EventStatusResult)
+
+
+@lru_cache(maxsize=256)
+def _event_list_adapter(field_set: EventFieldSet) -> TypeAdapter:
+    return TypeAdapter(list[event_read_subset(field_set.response_fields)])
+
+
+@dataclass(frozen=True)
+class _RenderedListing:
+    """One ``GET /events`` response as sent, so the list cache can replay it."""
+
+    body: bytes
+    validators: Validators
+    total: int | None
+    next_cursor: str | None
+    prev_cursor: str | None
+
 
-def get_event_service() -> EventService:
-    return EventService()
+ListCacheDep = Annotated[ResponseCache[EventListingKey, _RenderedListing] | None, Depends(get_event_list_cache)]
+
+
+def get_event_service(list_cache: ListCacheDep) -> EventService:
+    return EventService(list_cache=list_cache)
 
 
 def _describe_integrity_error(exc: IntegrityError) -> str:
@@ -65,14 +140,128 @@ def _describe_integrity_error(exc: IntegrityError) -> str:
     return "Constraint violation while creating event."
 
 
+def _set_total_header(response: Response, total: int | None) -> None:
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+
+
+def _describe_validation_error(exc: PydanticValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in err['loc']) or 'body'}: {err['msg']}" for err in exc.errors())
+
+
+def _bulk_too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=detail)
+
+
+async def _bulk_body_chunks(request: Request) -> AsyncIterator[bytes]:
+    """The request body, refused as soon as it grows past ``EVENT_BULK_MAX_BYTES``."""
+
+    limit = settings.EVENT_BULK_MAX_BYTES
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise _bulk_too_large(f"Bulk request bodies are limited to {limit} bytes.")
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            raise _bulk_too_large(f"Bulk request bodies are limited to {limit} bytes.")
+        yield chunk
+
+
+async def _read_bulk_items(request: Request) -> list[object]:
+    """Decode a JSON array body, or stream an NDJSON body line by line.
+
+    Bodies over ``EVENT_BULK_MAX_BYTES`` and NDJSON streams over ``EVENT_BULK_MAX_ROWS`` lines
+    get a 413 without reading the rest.
+    """
+
+    max_rows = settings.EVENT_BULK_MAX_ROWS
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        items: list[object] = []
+        buffer = b""
+        async for chunk in _bulk_body_chunks(request):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            items.extend(_parse_ndjson_line(line, len(items)) for line in lines if line.strip())
+            if len(items) > max_rows:
+                raise _bulk_too_large(f"At most {max_rows} events per request.")
+        if buffer.strip():
+            items.append(_parse_ndjson_line(buffer, len(items)))
+    else:
+        try:
+            items = json.loads(b"".join([chunk async for chunk in _bulk_body_chunks(request)]))
+        except json.JSONDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Body must be valid JSON."
+            ) from exc
+        if not isinstance(items, list):
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Body must be a JSON array.")
+    if len(items) > max_rows:
+        raise _bulk_too_large(f"At most {max_rows} events per request.")
+    return items
+
+
+def _parse_ndjson_line(line: bytes, index: int) -> object:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Line {index + 1} is not valid JSON.",
+        ) from exc
+
+
 SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadSessionFactoryDep = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_read_db_session_factory),
+]
 ServiceDep = Annotated[EventService, Depends(get_event_service)]
+BroadcasterDep = Annotated[EventBroadcaster, Depends(get_event_broadcaster)]
+EventLoaderDep = Annotated[BatchLoader[UUID, Event], Depends(get_event_loader)]
+EventCacheDep = Annotated[EventCache | None, Depends(get_event_cache)]
 
 SportIdQuery = Annotated[UUID | None, Query(alias="sport_id", description="Filter by sport UUID")]
 VenueIdQuery = Annotated[UUID | None, Query(alias="venue_id", description="Filter by venue UUID")]
+TeamIdQuery = Annotated[UUID | None, Query(alias="team_id", description="Filter by participating team UUID")]
 StatusQuery = Annotated[EventStatus | None, Query(alias="status", description="Filter by event status")]
 DateFromQuery = Annotated[AwareDatetime | None, Query(description="Filter: start >= date_from (ISO 8601 with tz)")]
 DateToQuery = Annotated[AwareDatetime | None, Query(description="Filter: start <= date_to (ISO 8601 with tz)")]
+CursorQuery = Annotated[
+    str | None,
+    Query(description="Opaque keyset cursor from X-Next-Cursor / X-Prev-Cursor; overrides page"),
+]
+SearchQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=200,
+        description='Full-text search over title, description and team names (web-search syntax, e.g. "derby -cup")',
+    ),
+]
+
+
+FieldsQuery = Annotated[
+    str | None,
+    Query(
+        description=f"Comma-separated event fields to return (id is always included): {', '.join(EVENT_LIST_FIELDS)}"
+    ),
+]
+IdsQuery = Annotated[
+    list[UUID] | None,
+    Query(
+        max_length=EVENT_MULTI_GET_MAX_IDS,
+        description=(
+            f"Return only these events (repeat the parameter, up to {EVENT_MULTI_GET_MAX_IDS}); "
+            "all matches come back in one page and unknown ids are skipped"
+        ),
+    ),
+]
+IncludeQuery = Annotated[
+    str | None,
+    Query(description="Comma-separated expansions to embed: participants, sport; defaults to both"),
+]
 
 
 class OrderDirection(str, Enum):
@@ -83,24 +272,59 @@ class OrderDirection(str, Enum):
 def get_event_list_params(
     sport_id: SportIdQuery = None,
     venue_id: VenueIdQuery = None,
+    team_id: TeamIdQuery = None,
     status_filter: StatusQuery = None,
     date_from: DateFromQuery = None,
     date_to: DateToQuery = None,
     order: Annotated[OrderDirection, Query(description="Sort by starts_at")] = OrderDirection.asc,
     page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: CursorQuery = None,
+    q: SearchQuery = None,
+    fields: FieldsQuery = None,
+    include: IncludeQuery = None,
+    ids: IdsQuery = None,
 ) -> EventListParams:
     if date_from and date_to and date_from > date_to:
         # 400 here reads nicer than a server error deeper down
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="date_from must be <= date_to")
+    try:
+        decoded_cursor = EventCursor.decode(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    try:
+        field_set = EventFieldSet.parse(fields, include)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    pagination = Pagination(page=page, page_size=page_size)
+    if ids is not None:
+        if decoded_cursor:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="cursor cannot be combined with ids",
+            )
+        ids = list(dict.fromkeys(ids))
+        pagination = Pagination(page_size=len(ids) or 1)
+    search = q.strip() if q else None
+    if search and decoded_cursor:
+        # Search results are ordered by rank, which has no stable keyset to seek on.
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="cursor cannot be combined with q; use page instead",
+        )
     return EventListParams(
         sport_id=sport_id,
         venue_id=venue_id,
+        team_id=team_id,
         status=status_filter,
         date_from=date_from,
         date_to=date_to,
         order_desc=(order == OrderDirection.desc),
-        pagination=Pagination(page=page, page_size=page_size),
+        pagination=pagination,
+        cursor=decoded_cursor,
+        q=search or None,
+        ids=tuple(ids) if ids is not None else None,
+        field_set=field_set,
     )
 
 
@@ -112,8 +336,7 @@ async def create_event(
     payload: EventCreate,
     session: SessionDep,
     service: ServiceDep,
-    response: Response,
-) -> EventRead:
+) -> Response:
     try:
         event = await service.create_event(session, payload)
     except ValidationError as exc:
@@ -121,36 +344,264 @@ async def create_event(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=str(exc),
         ) from exc
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_describe_integrity_error(exc),
+        ) from exc
+
+    return orm_json_response(
+        _EVENT_READ, event, status_code=status.HTTP_201_CREATED, headers={"Location": f"/events/{event.id}"}
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=EventBulkResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/EventCreate"}}
+                },
+                NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/EventCreate"}},
+            },
+        }
+    },
+)
+async def bulk_create_events(
+    request: Request,
+    session: SessionDep,
+    service: ServiceDep,
+) -> Response:
+    """Create many events in one transaction; invalid rows are reported by index and skipped."""
+
+    items = await _read_bulk_items(request)
+
+    rows: list[tuple[int, EventCreate]] = []
+    parse_errors: list[EventBulkError] = []
+    for index, item in enumerate(items):
+        try:
+            rows.append((index, _EVENT_CREATE.validate_python(item)))
+        except PydanticValidationError as exc:
+            parse_errors.append(EventBulkError(index=index, detail=_describe_validation_error(exc)))
+
+    try:
+        result = await service.bulk_create_events(session, rows)
     except IntegrityError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=_describe_integrity_error(exc),
         ) from exc
 
-    response.headers["Location"] = f"/events/{event.id}"
-    return EventRead.model_validate(event)
+    result.errors = sorted([*parse_errors, *result.errors], key=lambda err: err.index)
+    return json_response(_BULK_RESULT, result)
+
+
+@router.post("/status", response_model=EventStatusResult)
+async def transition_events(
+    payload: EventStatusUpdate,
+    session: SessionDep,
+    service: ServiceDep,
+) -> Response:
+    """Move many events to one status; ids that cannot make the transition are reported and skipped."""
+
+    try:
+        result = await service.transition_events(session, payload.ids, payload.status)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        ) from exc
+    return json_response(_STATUS_RESULT, result)
+
+
+async def _load_page(session: AsyncSession, service: EventService, params: EventListParams) -> EventPage:
+    if settings.EVENT_LIST_READ_PATH == "json":
+        return await service.list_events_json(session, params=params)
+    return await service.list_events_page(session, params=params)
+
+
+def _render_listing(
+    page: EventPage,
+    params: EventListParams,
+    total: int | None,
+    validators: Validators,
+) -> _RenderedListing:
+    # Runs after the read session has closed: ORM rows are fully loaded (relationships are eager,
+    # everything else raises), so encoding them issues no SQL and holds no pooled connection.
+    if settings.EVENT_LIST_READ_PATH == "json":
+        body = page.items
+    else:
+        adapter = _event_list_adapter(params.field_set)
+        body = adapter.dump_json(adapter.validate_python(page.items, from_attributes=True))
+    return _RenderedListing(
+        body=body,
+        validators=validators,
+        total=total,
+        next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+        prev_cursor=page.prev_cursor.encode() if page.prev_cursor else None,
+    )
+
+
+async def _probe_listing(
+    session: AsyncSession,
+    service: EventService,
+    params: EventListParams,
+    count: CountStrategy | None,
+) -> tuple[Validators, int | None]:
+    # Cheap (id, updated_at) probe of the page rows. The total rides along with it and is part
+    # of the ETag, so a changed total is never a 304. Read sessions are REPEATABLE READ, so the
+    # page loaded afterwards in the same session matches these validators.
+    versions, total = await service.list_event_versions(session, params=params, count=count)
+    variant = f"{settings.EVENT_LIST_READ_PATH}:{total}:{params.field_set.key}"
+    return build_validators(versions, variant=variant, collection=True), total
 
 
 @router.get("", response_model=list[EventRead])
 async def list_events(
-    session: SessionDep,
+    session_factory: ReadSessionFactoryDep,
     service: ServiceDep,
     params: ParamsDep,
-) -> list[EventRead]:
-    events = await service.list_events(session, params=params)
-    return [EventRead.model_validate(e) for e in events]
+    request: Request,
+    list_cache: ListCacheDep,
+    count: Annotated[
+        CountStrategy | None,
+        Query(description="Return the filtered total in X-Total-Count: exact, estimated (planner) or cached"),
+    ] = None,
+) -> Response:
+    if list_cache is None:
+        async with session_factory() as session:
+            validators, total = await _probe_listing(session, service, params, count)
+            # Unchanged pages never get loaded or serialized.
+            if is_not_modified(request, validators):
+                cached = not_modified(validators)
+                _set_total_header(cached, total)
+                return cached
+            page = await _load_page(session, service, params)
+        listing = _render_listing(page, params, total, validators)
+    else:
+
+        async def load() -> _RenderedListing:
+            async with session_factory() as session:
+                validators, total = await _probe_listing(session, service, params, count)
+                page = await _load_page(session, service, params)
+            return _render_listing(page, params, total, validators)
+
+        listing = await list_cache.get_or_load(EventListingKey(params, count, settings.EVENT_LIST_READ_PATH), load)
+        if is_not_modified(request, listing.validators):
+            cached = not_modified(listing.validators)
+            _set_total_header(cached, listing.total)
+            return cached
+
+    response = Response(content=listing.body, media_type=JSON_MEDIA_TYPE)
+    if listing.next_cursor:
+        response.headers["X-Next-Cursor"] = listing.next_cursor
+    if listing.prev_cursor:
+        response.headers["X-Prev-Cursor"] = listing.prev_cursor
+    _set_total_header(response, listing.total)
+    apply_validators(response, listing.validators)
+    return response
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, "text/csv": {}}}},
+)
+async def export_events(
+    session_factory: ReadSessionFactoryDep,
+    service: ServiceDep,
+    params: ParamsDep,
+    fmt: Annotated[ExportFormat, Query(alias="format", description="Output format")] = ExportFormat.ndjson,
+) -> StreamingResponse:
+    """Stream every event matching the list filters; ``page``, ``page_size`` and ``cursor`` are ignored."""
+
+    async def body() -> AsyncIterator[bytes]:
+        # The session lives inside the generator so the server-side cursor is held only while streaming.
+        async with session_factory() as session:
+            try:
+                async for chunk in service.export_events(session, params=params, fmt=fmt):
+                    yield chunk
+            except asyncio.CancelledError:
+                logger.info("Event export cancelled by client disconnect.")
+                raise
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="events.{fmt.value}"'},
+    )
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}, "description": "Server-Sent Events stream"}},
+)
+async def stream_events(
+    broadcaster: BroadcasterDep,
+    sport_id: SportIdQuery = None,
+    venue_id: VenueIdQuery = None,
+    status_filter: StatusQuery = None,
+) -> StreamingResponse:
+    """Push ``created``/``updated`` events matching the filters as they are committed.
+
+    Each message's ``data`` is an ``EventRead`` document. A ``reset`` event means messages were
+    missed (the client fell behind or the database feed dropped): refetch, then reconnect.
+    """
+
+    try:
+        subscription = broadcaster.subscribe(
+            EventStreamFilter(sport_id=sport_id, venue_id=venue_id, status=status_filter)
+        )
+    except CapacityError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+
+    async def frames() -> AsyncIterator[bytes]:
+        try:
+            yield _STREAM_PREAMBLE
+            while True:
+                try:
+                    message = await subscription.next(settings.EVENT_STREAM_HEARTBEAT_SECONDS)
+                except SubscriptionResetError:
+                    yield _STREAM_RESET
+                    return
+                yield message.frame if message else _STREAM_KEEPALIVE
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        frames(),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{event_id}", response_model=EventRead)
 async def get_event(
     event_id: UUID,
-    session: SessionDep,
-    service: ServiceDep,
-) -> EventRead:
-    event = await service.get_event(session, event_id)
+    loader: EventLoaderDep,
+    cache: EventCacheDep,
+    request: Request,
+) -> Response:
+    """One event, from this worker's cache when warm; concurrent misses share one batched query."""
+
+    event = await cache.get(event_id, loader.load) if cache else await loader.load(event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found.",
         )
-    return EventRead.model_validate(event)
+    validators = build_validators([(event.id, event.updated_at)])
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response = orm_json_response(_EVENT_READ, event)
+    apply_validators(response, validators)
+    return response
@@ -1,5 +1,12 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter
 
+from app.api.deps import get_event_cache
+from app.db.pool_metrics import InstrumentedAsyncPool
+from app.db.session import build_engine, replica_router
+from app.services.cache import event_count_cache, event_list_cache, reference_cache
+
 router = APIRouter()
 
 
@@ -8,3 +15,36 @@ async def readiness() -> dict[str, str]:
     """Simple endpoint to confirm the API is up."""
 
     return {"status": "ok"}
+
+
+@router.get("/health/caches", tags=["Health"], summary="In-process cache statistics")
+async def cache_stats() -> dict[str, dict[str, float]]:
+    """Hit/miss counters for this worker's in-process caches."""
+
+    stats = {
+        "reference": asdict(reference_cache.stats()),
+        "event_counts": asdict(event_count_cache.stats()),
+    }
+    if event_list_cache is not None:
+        stats["event_lists"] = asdict(event_list_cache.stats())
+    event_cache = get_event_cache()
+    if event_cache is not None:
+        stats["events"] = asdict(event_cache.stats())
+    return stats
+
+
+@router.get("/health/pool", tags=["Health"], summary="Database connection pool statistics")
+async def pool_stats() -> dict[str, float]:
+    """Checkout wait, hold time, overflow and connection lifetime for this worker's pool."""
+
+    pool = build_engine().pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return {}
+    return asdict(pool.stats())
+
+
+@router.get("/health/replicas", tags=["Health"], summary="Read replica routing state")
+async def replica_stats() -> list[dict[str, str | bool | float]]:
+    """Configured read replicas and whether this worker is currently routing reads to them."""
+
+    return [asdict(status) for status in replica_router().status()]
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
+from app.api.deps import get_read_db_session_factory, watch_reference_changes
+from app.api.responses import json_response
 from app.schemas import SportRead
 from app.services import SportService
 
 router = APIRouter(prefix="/sports", tags=["Sports"])
 
+_SPORT_LIST = TypeAdapter(list[SportRead])
+
 
 def get_sport_service() -> SportService:
     return SportService()
 
 
-SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadSessionFactoryDep = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_read_db_session_factory),
+]
 ServiceDep = Annotated[SportService, Depends(get_sport_service)]
 
 
-@router.get("", response_model=list[SportRead])
-async def list_sports(session: SessionDep, service: ServiceDep) -> list[SportRead]:
-    sports = await service.list_sports(session)
-    return [SportRead.model_validate(s) for s in sports]
+@router.get("", response_model=list[SportRead], dependencies=[Depends(watch_reference_changes)])
+async def list_sports(open_session: ReadSessionFactoryDep, service: ServiceDep) -> Response:
+    return json_response(_SPORT_LIST, await service.list_sports(open_session))
@@ -1,31 +1,88 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
-from app.schemas import TeamRead
-from app.services import TeamService
+from app.api.deps import get_read_db_session_factory, watch_reference_changes
+from app.api.responses import json_response, orm_json_response
+from app.schemas import EventRead, TeamRead
+from app.services import EventService, TeamService
+from app.services.event_filters import EventCursor, Pagination, ScheduleWindow
 
 router = APIRouter(prefix="/teams", tags=["Teams"])
 
+_TEAM_LIST = TypeAdapter(list[TeamRead])
+_EVENT_LIST = TypeAdapter(list[EventRead])
+
 
 def get_team_service() -> TeamService:
     return TeamService()
 
 
-SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+def get_event_service() -> EventService:
+    return EventService()
+
+
+ReadSessionFactoryDep = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_read_db_session_factory),
+]
 ServiceDep = Annotated[TeamService, Depends(get_team_service)]
+EventServiceDep = Annotated[EventService, Depends(get_event_service)]
 
 
-@router.get("", response_model=list[TeamRead])
+@router.get("", response_model=list[TeamRead], dependencies=[Depends(watch_reference_changes)])
 async def list_teams(
-    session: SessionDep,
+    open_session: ReadSessionFactoryDep,
     service: ServiceDep,
     sport_id: Annotated[UUID | None, Query(description="Filter by sport UUID")] = None,
-) -> list[TeamRead]:
-    teams = await service.list_teams(session, sport_id=sport_id)
-    return [TeamRead.model_validate(team) for team in teams]
+) -> Response:
+    return json_response(_TEAM_LIST, await service.list_teams(open_session, sport_id=sport_id))
+
+
+@router.get("/{team_id}/events", response_model=list[EventRead])
+async def list_team_events(
+    team_id: UUID,
+    open_session: ReadSessionFactoryDep,
+    service: EventServiceDep,
+    window: Annotated[
+        ScheduleWindow,
+        Query(description="upcoming (soonest first), past (most recent first) or all (by start time)"),
+    ] = ScheduleWindow.upcoming,
+    page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
+    page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="Opaque keyset cursor from X-Next-Cursor / X-Prev-Cursor; overrides page"),
+    ] = None,
+) -> Response:
+    try:
+        decoded_cursor = EventCursor.decode(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    async with open_session() as session:
+        page_result = await service.list_team_events_page(
+            session,
+            team_id,
+            window=window,
+            pagination=Pagination(page=page, page_size=page_size),
+            cursor=decoded_cursor,
+        )
+    # Encoded after the session has closed, so the connection is back in the pool meanwhile.
+    if page_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Team not found.",
+        )
+    response = orm_json_response(_EVENT_LIST, page_result.items)
+    if page_result.next_cursor:
+        response.headers["X-Next-Cursor"] = page_result.next_cursor.encode()
+    if page_result.prev_cursor:
+        response.headers["X-Prev-Cursor"] = page_result.prev_cursor.encode()
+    return response
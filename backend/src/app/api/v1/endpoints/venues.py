@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import AwareDatetime, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db_session, get_read_db_session_factory, watch_reference_changes
+from app.api.responses import json_response
+from app.schemas import VenueAvailability, VenueRead
+from app.services import ValidationError, VenueService
+
+router = APIRouter(prefix="/venues", tags=["Venues"])
+
+_VENUE_LIST = TypeAdapter(list[VenueRead])
+_AVAILABILITY = TypeAdapter(VenueAvailability)
+
+
+def get_venue_service() -> VenueService:
+    return VenueService()
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session, scope="function")]
+ReadSessionFactoryDep = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_read_db_session_factory),
+]
+ServiceDep = Annotated[VenueService, Depends(get_venue_service)]
+
+
+@router.get("", response_model=list[VenueRead], dependencies=[Depends(watch_reference_changes)])
+async def list_venues(open_session: ReadSessionFactoryDep, service: ServiceDep) -> Response:
+    return json_response(_VENUE_LIST, await service.list_venues(open_session))
+
+
+@router.get("/{venue_id}/availability", response_model=VenueAvailability)
+async def get_venue_availability(
+    venue_id: UUID,
+    session: ReadSessionDep,
+    service: ServiceDep,
+    date_from: Annotated[AwareDatetime, Query(description="Window start (inclusive)")],
+    date_to: Annotated[AwareDatetime, Query(description="Window end (exclusive)")],
+) -> Response:
+    try:
+        availability = await service.get_availability(session, venue_id, date_from=date_from, date_to=date_to)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        ) from exc
+    if availability is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Venue not found.",
+        )
+    return json_response(_AVAILABILITY, availability)
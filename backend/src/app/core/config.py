@@ -1,4 +1,5 @@
 from functools import cached_property
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,6 +16,59 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str | None = None  # connection string
     SYNC_DATABASE_URL: str | None = None  # connection string for Alembic/tests
+    # Optional replicas for GET traffic; READ_DATABASE_URLS takes a JSON list
+    READ_DATABASE_URL: str | None = None
+    READ_DATABASE_URLS: list[str] = Field(default_factory=list)
+    READ_REPLICA_RETRY_SECONDS: float = 30.0
+    # Per-worker pool; total connections = workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 disables
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100.0
+    # Compiled SQL kept per engine (SQLAlchemy query_cache_size); each listing filter combination is one entry
+    DB_QUERY_CACHE_SIZE: int = 1000
+    # Server-side prepared statements kept per connection by the asyncpg dialect
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Behind PgBouncer in transaction mode: no per-connection prepared statement caches, unique names
+    DB_PGBOUNCER: bool = False
+    # Switches every relationship to lazy="raise" so unplanned lazy loads fail instead of adding N+1s
+    DB_STRICT_LOADING: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    REQUEST_QUERY_BUDGET: int = 10  # statements per request before a warning is logged
+    # "json" lets Postgres render list pages with json_agg instead of hydrating ORM objects
+    EVENT_LIST_READ_PATH: Literal["orm", "json"] = "orm"
+    EVENT_BULK_MAX_ROWS: int = 50_000
+    EVENT_BULK_MAX_BYTES: int = 64 * 1024 * 1024  # request body cap for POST /events/bulk
+    EVENT_COUNT_CACHE_TTL_SECONDS: float = 30.0
+    EVENT_COUNT_CACHE_MAX_ENTRIES: int = 1024
+    # Live event stream: one LISTEN connection per worker, fanned out in memory.
+    # EVENT_STREAM_DATABASE_URL must reach Postgres directly (LISTEN does not survive transaction pooling).
+    EVENT_STREAM_DATABASE_URL: str | None = None
+    EVENT_STREAM_MAX_SUBSCRIBERS: int = 10_000
+    EVENT_STREAM_MAX_PENDING: int = 256  # messages buffered per subscriber before it is reset
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    # Moves events to live/finished as their times pass; safe to enable on every worker
+    # (an advisory lock lets one run each tick), or run scripts/run_status_scheduler.py instead.
+    STATUS_SCHEDULER_ENABLED: bool = False
+    STATUS_SCHEDULER_INTERVAL_SECONDS: float = 30.0
+    STATUS_SCHEDULER_BATCH_SIZE: int = 1000
+    # Rendered GET /events responses, per normalized listing; 0 disables. Entries are dropped after
+    # local writes commit and, for other workers' writes, by the event_changes LISTEN feed.
+    EVENT_LIST_CACHE_TTL_SECONDS: float = 5.0
+    EVENT_LIST_CACHE_STALE_SECONDS: float = 10.0  # served while one background reload runs
+    EVENT_LIST_CACHE_MAX_ENTRIES: int = 1024
+    EVENT_LIST_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # Single events kept in memory by GET /events/{id}; 0 disables. Entries are evicted by the
+    # event_changes LISTEN feed, so TTL only bounds what the feed misses.
+    EVENT_CACHE_TTL_SECONDS: float = 30.0
+    EVENT_CACHE_MAX_ENTRIES: int = 10_000
+    # GET /events/{id} lookups arriving within this window are loaded together in one batch
+    EVENT_LOADER_WINDOW_MS: float = 2.0
+    EVENT_LOADER_MAX_BATCH: int = 100
+    REFERENCE_CACHE_TTL_SECONDS: float = 300.0
+    REFERENCE_CACHE_MAX_ENTRIES: int = 64
     BACKEND_CORS_ORIGINS: list[str] = Field(
         default_factory=lambda: [
             "http://localhost:3000",
@@ -31,6 +85,11 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @cached_property
+    def read_database_urls(self) -> list[str]:
+        urls = [self.READ_DATABASE_URL] if self.READ_DATABASE_URL else []
+        return list(dict.fromkeys([*urls, *self.READ_DATABASE_URLS]))
+
     @cached_property
     def sync_database_url(self) -> str:
         if self.SYNC_DATABASE_URL:
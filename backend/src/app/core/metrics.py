@@ -0,0 +1,289 @@
+"""Process-local request and database metrics rendered in Prometheus text format.
+
+Histograms use fixed buckets so recording a sample is a bisect plus two additions.
+Each worker process keeps its own registry; scrape every worker (or aggregate upstream).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+MAX_STATEMENT_SERIES = 500
+OTHER_STATEMENT = ("other", "other")
+UNMATCHED_ROUTE = "unmatched"
+
+Gauge = tuple[str, str, dict[str, str], float]
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        running = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            running += count
+            yield _format_value(bound), running
+        yield "+Inf", running + self.counts[-1]
+
+
+@dataclass
+class RequestDbStats:
+    """Database work attributed to the request currently being served."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class StatementStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+_request_db_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self, *, max_statement_series: int = MAX_STATEMENT_SERIES) -> None:
+        self._max_statement_series = max_statement_series
+        self.request_latency: dict[tuple[str, str, str], Histogram] = {}
+        self.request_db_seconds: dict[tuple[str, str], Histogram] = {}
+        self.request_queries: dict[tuple[str, str], Histogram] = {}
+        self.statements: dict[tuple[str, str], StatementStats] = {}
+        self.compiled_cache: dict[str, int] = {}
+        self._collectors: list[Callable[[], Iterable[Gauge]]] = []
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        db: RequestDbStats,
+    ) -> None:
+        key = (method, route, str(status))
+        histogram = self.request_latency.get(key)
+        if histogram is None:
+            histogram = self.request_latency[key] = Histogram(LATENCY_BUCKETS)
+        histogram.observe(seconds)
+
+        route_key = (method, route)
+        db_seconds = self.request_db_seconds.get(route_key)
+        if db_seconds is None:
+            db_seconds = self.request_db_seconds[route_key] = Histogram(LATENCY_BUCKETS)
+            self.request_queries[route_key] = Histogram(QUERY_COUNT_BUCKETS)
+        db_seconds.observe(db.seconds)
+        self.request_queries[route_key].observe(db.queries)
+
+    def observe_statement(self, fingerprint: tuple[str, str], seconds: float) -> None:
+        stats = self.statements.get(fingerprint)
+        if stats is None:
+            if len(self.statements) >= self._max_statement_series:
+                fingerprint = OTHER_STATEMENT
+                stats = self.statements.setdefault(fingerprint, StatementStats())
+            else:
+                stats = self.statements[fingerprint] = StatementStats()
+        stats.calls += 1
+        stats.seconds += seconds
+
+        request = _request_db_stats.get()
+        if request is not None:
+            request.queries += 1
+            request.seconds += seconds
+
+    def observe_compiled_cache(self, result: str) -> None:
+        """Count one execution by how its SQL was obtained: ``hit``, ``miss``, ``uncached``..."""
+
+        self.compiled_cache[result] = self.compiled_cache.get(result, 0) + 1
+
+    def register_collector(self, collector: Callable[[], Iterable[Gauge]]) -> None:
+        """Add a callable producing ``(name, help, labels, value)`` gauges at scrape time."""
+
+        self._collectors.append(collector)
+
+    def reset(self) -> None:
+        self.request_latency.clear()
+        self.request_db_seconds.clear()
+        self.request_queries.clear()
+        self.statements.clear()
+        self.compiled_cache.clear()
+
+    def render(self) -> str:
+        lines: list[str] = []
+        _render_histograms(
+            lines,
+            "http_request_duration_seconds",
+            "HTTP request latency by route template and status code.",
+            ("method", "route", "status"),
+            self.request_latency,
+        )
+        _render_histograms(
+            lines,
+            "http_request_db_seconds",
+            "Time spent executing SQL per HTTP request.",
+            ("method", "route"),
+            self.request_db_seconds,
+        )
+        _render_histograms(
+            lines,
+            "http_request_db_queries",
+            "Number of SQL statements executed per HTTP request.",
+            ("method", "route"),
+            self.request_queries,
+        )
+
+        lines.append("# HELP db_statement_calls_total SQL executions by statement fingerprint.")
+        lines.append("# TYPE db_statement_calls_total counter")
+        for (digest, statement), stats in self.statements.items():
+            labels = _labels(("fingerprint", "statement"), (digest, statement))
+            lines.append(f"db_statement_calls_total{labels} {stats.calls}")
+        lines.append("# HELP db_statement_seconds_total SQL execution time by statement fingerprint.")
+        lines.append("# TYPE db_statement_seconds_total counter")
+        for (digest, statement), stats in self.statements.items():
+            labels = _labels(("fingerprint", "statement"), (digest, statement))
+            lines.append(f"db_statement_seconds_total{labels} {_format_value(stats.seconds)}")
+
+        lines.append("# HELP db_compiled_cache_total SQL executions by compiled-statement cache outcome.")
+        lines.append("# TYPE db_compiled_cache_total counter")
+        for result, count in self.compiled_cache.items():
+            lines.append(f"db_compiled_cache_total{_labels(('result',), (result,))} {count}")
+
+        declared: set[str] = set()
+        for collector in self._collectors:
+            for name, help_text, label_map, value in collector():
+                if name not in declared:
+                    declared.add(name)
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} gauge")
+                labels = _labels(tuple(label_map), tuple(label_map.values()))
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing each HTTP request and the SQL it issued.
+
+    The route label is the matched path template (``/api/v1/events/{event_id}``), never the
+    raw path, so the number of series stays bounded. Requests issuing more than
+    ``query_budget`` statements are logged, which is usually an N+1 in the making.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry | None = None,
+        *,
+        query_budget: int | None = None,
+    ) -> None:
+        self.app = app
+        self.registry = registry or metrics
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        db_stats = RequestDbStats()
+        token = _request_db_stats.set(db_stats)
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_db_stats.reset(token)
+            route = _route_template(scope)
+            self.registry.observe_request(scope["method"], route, status_code, elapsed, db_stats)
+            if self.query_budget is not None and db_stats.queries > self.query_budget:
+                logger.warning(
+                    "%s %s ran %d SQL statements (budget %d)",
+                    scope["method"],
+                    route,
+                    db_stats.queries,
+                    self.query_budget,
+                )
+
+
+def _route_template(scope: Scope) -> str:
+    # Recent FastAPI releases resolve included routers lazily; the route in scope then only
+    # knows its own path, while the effective context carries the prefixed template.
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+def _render_histograms(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    label_names: tuple[str, ...],
+    histograms: dict,
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for label_values, histogram in histograms.items():
+        for bound, count in histogram.cumulative():
+            labels = _labels((*label_names, "le"), (*label_values, bound))
+            lines.append(f"{name}_bucket{labels} {count}")
+        labels = _labels(label_names, label_values)
+        lines.append(f"{name}_sum{labels} {_format_value(histogram.sum)}")
+        lines.append(f"{name}_count{labels} {histogram.count}")
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,39 @@
+"""Bulk write helpers that bypass per-row ORM work."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def copy_rows(
+    session: AsyncSession,
+    table: Table,
+    columns: Sequence[str],
+    records: Sequence[tuple[Any, ...]],
+) -> None:
+    """Write ``records`` into ``table`` inside the session's current transaction.
+
+    Uses ``COPY ... FROM STDIN`` when the session runs on asyncpg and falls back to
+    a batched multi-row ``INSERT`` for other drivers. Omitted columns get their
+    server defaults either way.
+    """
+
+    if not records:
+        return
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if hasattr(driver, "copy_records_to_table"):
+        # SQLAlchemy's asyncpg adapter opens the transaction lazily on the first statement;
+        # COPY must not run before that or it would autocommit on its own.
+        if not driver.is_in_transaction():
+            await connection.exec_driver_sql("SELECT 1")
+        await driver.copy_records_to_table(table.name, columns=list(columns), records=records, schema_name=table.schema)
+        return
+
+    await session.execute(insert(table), [dict(zip(columns, record, strict=True)) for record in records])
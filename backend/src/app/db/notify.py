@@ -0,0 +1,158 @@
+"""Postgres ``NOTIFY`` for event and reference-data changes, and the ``LISTEN`` side that receives them.
+
+Writers call :func:`notify_event_changes` inside their transaction; Postgres delivers the
+notifications only on commit, so listeners never hear about rolled-back writes. Each
+payload is a small JSON object (id plus the fields streams filter on); listeners load
+the full document themselves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import Text, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANGES_CHANNEL = "event_changes"
+# Payload: comma-separated reference cache keys, or empty for all of them.
+REFERENCE_CHANGES_CHANNEL = "reference_changes"
+
+
+class ChangeKind(str, Enum):
+    created = "created"
+    updated = "updated"
+
+
+@dataclass(frozen=True)
+class EventChange:
+    kind: ChangeKind
+    id: UUID
+    sport_id: UUID
+    venue_id: UUID | None
+    status: str
+    starts_at: datetime | None = None
+
+    def to_payload(self) -> str:
+        return json.dumps(
+            {
+                "k": self.kind.value,
+                "i": str(self.id),
+                "s": str(self.sport_id),
+                "v": str(self.venue_id) if self.venue_id else None,
+                "st": self.status,
+                "t": self.starts_at.isoformat() if self.starts_at else None,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> EventChange:
+        data = json.loads(payload)
+        return cls(
+            kind=ChangeKind(data["k"]),
+            id=UUID(data["i"]),
+            sport_id=UUID(data["s"]),
+            venue_id=UUID(data["v"]) if data.get("v") else None,
+            status=data["st"],
+            starts_at=datetime.fromisoformat(data["t"]) if data.get("t") else None,
+        )
+
+
+async def notify_event_changes(session: AsyncSession, changes: Sequence[EventChange]) -> None:
+    """Queue one notification per change in the session's transaction, with a single statement."""
+
+    if not changes:
+        return
+    payloads = literal([change.to_payload() for change in changes], ARRAY(Text))
+    notified = func.unnest(payloads).table_valued("payload").render_derived(name="changes")
+    await session.execute(select(func.pg_notify(EVENT_CHANGES_CHANNEL, notified.c.payload)).select_from(notified))
+
+
+async def notify_reference_changes(session: AsyncSession, keys: Sequence[str] = ()) -> None:
+    """Tell every worker to drop cached reference data (``keys``, or all of it) once this transaction commits."""
+
+    await session.execute(select(func.pg_notify(REFERENCE_CHANGES_CHANNEL, ",".join(keys))))
+
+
+def listen_dsn(url: str) -> str:
+    """Plain ``postgresql://`` DSN for asyncpg from a SQLAlchemy URL."""
+
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class PgListener:
+    """Holds one ``LISTEN`` connection and hands every payload to ``on_payload``.
+
+    The connection is re-established with exponential back-off when it drops, and is
+    probed every ``keepalive`` seconds so a silently dead socket is noticed. Notifications
+    sent while disconnected are lost; ``on_reconnect`` runs after every reconnect (not the
+    first connect) so consumers can resynchronise.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        on_payload: Callable[[str], None],
+        *,
+        on_reconnect: Callable[[], None] | None = None,
+        keepalive: float = 30.0,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        connect: Callable[[str], Awaitable[Any]] = asyncpg.connect,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._on_payload = on_payload
+        self._on_reconnect = on_reconnect
+        self._keepalive = keepalive
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._connect = connect
+        self.connected = False
+        self.reconnects = 0
+
+    async def run(self) -> None:
+        backoff = self._min_backoff
+        first = True
+        while True:
+            try:
+                connection = await self._connect(self._dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("LISTEN %s: connect failed (%s); retrying in %.1fs", self._channel, exc, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+                continue
+            try:
+                await connection.add_listener(self._channel, self._dispatch)
+                self.connected = True
+                backoff = self._min_backoff
+                if not first:
+                    self.reconnects += 1
+                    if self._on_reconnect:
+                        self._on_reconnect()
+                first = False
+                while True:
+                    await asyncio.sleep(self._keepalive)
+                    await asyncio.wait_for(connection.execute("SELECT 1"), timeout=self._keepalive)
+            except (OSError, TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                logger.warning("LISTEN %s: connection lost (%s); reconnecting", self._channel, exc)
+            finally:
+                self.connected = False
+                connection.terminate()
+
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._on_payload(payload)
@@ -0,0 +1,180 @@
+"""Connection pool instrumentation.
+
+``InstrumentedAsyncPool`` times how long callers wait for a connection and, together
+with the pool events registered by :func:`install_pool_metrics`, how long connections
+stay checked out and how long they live before being closed.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+logger = logging.getLogger(__name__)
+
+_CHECKED_OUT_AT = "checked_out_at"
+_CONNECTED_AT = "connected_at"
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    overflow_checkouts: int
+    slow_checkouts: int
+    timeouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    hold_ms_avg: float
+    hold_ms_max: float
+    connections_opened: int
+    connections_closed: int
+    lifetime_s_avg: float
+    lifetime_s_max: float
+
+
+class PoolMetrics:
+    """Running totals for one pool; survives ``Pool.recreate()`` on engine dispose."""
+
+    def __init__(self, *, slow_checkout_ms: float = 100.0) -> None:
+        self.slow_checkout_ms = slow_checkout_ms
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.checkins = 0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.lifetime_total = 0.0
+        self.lifetime_max = 0.0
+
+    def record_wait(self, seconds: float, *, overflow: bool) -> bool:
+        """Record one checkout; returns True when it crossed the slow threshold."""
+
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        if overflow:
+            self.overflow_checkouts += 1
+        slow = seconds * 1000 >= self.slow_checkout_ms
+        if slow:
+            self.slow_checkouts += 1
+        return slow
+
+    def record_hold(self, seconds: float) -> None:
+        self.checkins += 1
+        self.hold_total += seconds
+        self.hold_max = max(self.hold_max, seconds)
+
+    def record_lifetime(self, seconds: float) -> None:
+        self.connections_closed += 1
+        self.lifetime_total += seconds
+        self.lifetime_max = max(self.lifetime_max, seconds)
+
+    def snapshot(self, pool: AsyncAdaptedQueuePool) -> PoolStats:
+        return PoolStats(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            checkouts=self.checkouts,
+            overflow_checkouts=self.overflow_checkouts,
+            slow_checkouts=self.slow_checkouts,
+            timeouts=self.timeouts,
+            wait_ms_avg=_avg(self.wait_total, self.checkouts) * 1000,
+            wait_ms_max=self.wait_max * 1000,
+            hold_ms_avg=_avg(self.hold_total, self.checkins) * 1000,
+            hold_ms_max=self.hold_max * 1000,
+            connections_opened=self.connections_opened,
+            connections_closed=self.connections_closed,
+            lifetime_s_avg=_avg(self.lifetime_total, self.connections_closed),
+            lifetime_s_max=self.lifetime_max,
+        )
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that measures the time spent waiting for a connection."""
+
+    def __init__(self, *args: Any, metrics: PoolMetrics | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def recreate(self) -> InstrumentedAsyncPool:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def stats(self) -> PoolStats:
+        return self.metrics.snapshot(self)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            logger.error("Connection pool exhausted: %s", self.stats())
+            raise
+        waited = time.perf_counter() - started
+        if self.metrics.record_wait(waited, overflow=self.overflow() > 0):
+            logger.warning(
+                "Slow connection checkout (%.1f ms): checked_out=%d overflow=%d",
+                waited * 1000,
+                self.checkedout(),
+                max(self.overflow(), 0),
+            )
+        return record
+
+
+def install_pool_metrics(engine: AsyncEngine) -> None:
+    """Track hold time and connection lifetime for an engine using ``InstrumentedAsyncPool``."""
+
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return
+    metrics = pool.metrics
+    target = engine.sync_engine
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        metrics.connections_opened += 1
+        record.info[_CONNECTED_AT] = time.monotonic()
+
+    @event.listens_for(target, "close")
+    def _on_close(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        connected_at = record.info.pop(_CONNECTED_AT, None)
+        if connected_at is not None:
+            metrics.record_lifetime(time.monotonic() - connected_at)
+
+    @event.listens_for(target, "checkout")
+    def _on_checkout(dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any) -> None:
+        record.info[_CHECKED_OUT_AT] = time.perf_counter()
+
+    @event.listens_for(target, "checkin")
+    def _on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            metrics.record_hold(time.perf_counter() - checked_out_at)
+
+
+def _avg(total: float, count: int) -> float:
+    return total / count if count else 0.0
@@ -0,0 +1,121 @@
+"""Cursor-execute hooks feeding SQL timings into :mod:`app.core.metrics`."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import MetricsRegistry, metrics
+
+logger = logging.getLogger(__name__)
+
+_STARTED_KEY = "query_started_at"
+_STATEMENT_LABEL_CHARS = 120
+_SLOW_LOG_CHARS = 2000
+
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_VALUES_ROWS = re.compile(r"\bVALUES\s*\(.*\)", re.IGNORECASE | re.DOTALL)
+_PARAM = re.compile(r"\$\d+(?:::[\w\[\]]+)?|%\(\w+\)s|%s|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_WHITESPACE = re.compile(r"\s+")
+# SQLAlchemy's compiled cache outcome per execution; "miss" means the statement was compiled in Python.
+_COMPILED_CACHE_RESULTS = {
+    CacheStats.CACHE_HIT: "hit",
+    CacheStats.CACHE_MISS: "miss",
+    CacheStats.CACHING_DISABLED: "disabled",
+    CacheStats.NO_CACHE_KEY: "uncacheable",
+    CacheStats.NO_DIALECT_SUPPORT: "unsupported",
+}
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> tuple[str, str]:
+    """Return ``(digest, normalized_sql)`` with literals, parameters and IN lists collapsed."""
+
+    normalized = _STRING.sub("?", statement)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_ROWS.sub("VALUES (...)", normalized)
+    normalized = _PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    digest = hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
+    return digest, normalized[:_STATEMENT_LABEL_CHARS]
+
+
+@dataclass
+class QueryLog:
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine | Engine) -> Iterator[QueryLog]:
+    """Collect every statement ``engine`` sends while the block runs (used for query budgets)."""
+
+    target = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    log = QueryLog()
+
+    def _record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        log.statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield log
+    finally:
+        event.remove(target, "before_cursor_execute", _record)
+
+
+def install_query_metrics(
+    engine: AsyncEngine,
+    registry: MetricsRegistry | None = None,
+    *,
+    slow_query_ms: float | None = None,
+) -> None:
+    """Time every cursor execution on ``engine`` and attribute it to the current request.
+
+    Statements slower than ``slow_query_ms`` are logged without their parameters. Each
+    execution is also counted by whether its SQL came from the compiled cache.
+    """
+
+    registry = registry or metrics
+    target = engine.sync_engine
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info[_STARTED_KEY].pop()
+        registry.observe_statement(fingerprint(statement), elapsed)
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is not None:
+            registry.observe_compiled_cache(_COMPILED_CACHE_RESULTS.get(cache_hit, "other"))
+        if slow_query_ms is not None and elapsed * 1000 >= slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms): %s",
+                elapsed * 1000,
+                " ".join(statement.split())[:_SLOW_LOG_CHARS],
+            )
+
+    @event.listens_for(target, "handle_error")
+    def _on_error(context: Any) -> None:
+        stack = context.connection.info.get(_STARTED_KEY) if context.connection else None
+        if stack:
+            stack.pop()
@@ -0,0 +1,63 @@
+"""Round-robin routing across read replicas with simple failure back-off."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+E = TypeVar("E")
+
+
+@dataclass(frozen=True)
+class ReplicaStatus:
+    name: str
+    healthy: bool
+    retry_in_seconds: float
+
+
+class ReplicaRouter(Generic[E]):
+    """Hands out replicas in rotation, skipping any marked unhealthy until ``retry_after`` elapses.
+
+    Callers try :meth:`candidates` in order and fall back to the primary when the list is
+    exhausted, so an outage of every replica degrades to primary-only reads.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[E],
+        *,
+        retry_after: float,
+        name: Callable[[E], str] = str,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._replicas = list(replicas)
+        self._retry_after = retry_after
+        self._name = name
+        self._clock = clock
+        self._down_until: dict[int, float] = {}
+        self._next = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._replicas)
+
+    def candidates(self) -> list[E]:
+        if not self._replicas:
+            return []
+        start = self._next
+        self._next = (start + 1) % len(self._replicas)
+        now = self._clock()
+        rotated = self._replicas[start:] + self._replicas[:start]
+        return [replica for replica in rotated if self._down_until.get(id(replica), 0.0) <= now]
+
+    def mark_unhealthy(self, replica: E) -> None:
+        self._down_until[id(replica)] = self._clock() + self._retry_after
+
+    def status(self) -> list[ReplicaStatus]:
+        now = self._clock()
+        result = []
+        for replica in self._replicas:
+            retry_in = max(self._down_until.get(id(replica), 0.0) - now, 0.0)
+            result.append(ReplicaStatus(self._name(replica), retry_in == 0.0, retry_in))
+        return result
@@ -5,7 +5,9 @@ from collections.abc import Mapping
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.notify import notify_reference_changes
 from app.models import Sport, Team, Venue
+from app.services.cache import invalidate_reference_data
 
 DEFAULT_SPORTS = (
     ("soccer", "Soccer"),
@@ -74,8 +76,11 @@ async def seed_reference_data(session: AsyncSession) -> None:
     await session.commit()
 
     await _seed_teams(session, sport_map)
+    await notify_reference_changes(session)
     await session.commit()
 
+    invalidate_reference_data()
+
 
 async def _seed_sports(session: AsyncSession) -> dict[str, Sport]:
     result = await session.execute(select(Sport))
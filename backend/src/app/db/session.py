@@ -5,8 +5,14 @@ See: https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import logging
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -15,9 +21,56 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncPool, PoolMetrics, install_pool_metrics
+from app.db.query_metrics import install_query_metrics
+from app.db.replicas import ReplicaRouter
+
+logger = logging.getLogger(__name__)
+
+# REPEATABLE READ gives every statement of a read transaction the same snapshot, so e.g. the ETag
+# probe of a listing and the page load that follows it always describe the same rows.
+READ_ONLY_OPTIONS = {"postgresql_readonly": True, "isolation_level": "REPEATABLE READ"}
 
 _engine: AsyncEngine | None = None
+_read_only_engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_router: ReplicaRouter[AsyncEngine] | None = None
+
+
+def _create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        **kwargs,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=_connect_args(),
+    )
+    engine.pool.metrics = PoolMetrics(slow_checkout_ms=settings.DB_POOL_SLOW_CHECKOUT_MS)
+    install_pool_metrics(engine)
+    install_query_metrics(engine, slow_query_ms=settings.SLOW_QUERY_THRESHOLD_MS)
+    return engine
+
+
+def _connect_args() -> dict[str, Any]:
+    """asyncpg prepared-statement settings.
+
+    A transaction-pooling PgBouncer hands each transaction a different server connection, so
+    statements prepared on one are missing (or clash by name) on the next: caching is turned
+    off and every statement gets a unique name.
+    """
+
+    if settings.DB_PGBOUNCER:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
 
 
 def build_engine() -> AsyncEngine:
@@ -26,10 +79,32 @@ def build_engine() -> AsyncEngine:
     if _engine is not None:
         return _engine
 
-    _engine = create_async_engine(settings.async_database_url, pool_pre_ping=True)
+    _engine = _create_engine(settings.async_database_url)
     return _engine
 
 
+def build_read_only_engine() -> AsyncEngine:
+    """The primary engine with every transaction opened ``READ ONLY``, ``REPEATABLE READ``; shares its pool."""
+
+    global _read_only_engine
+    if _read_only_engine is None:
+        _read_only_engine = build_engine().execution_options(**READ_ONLY_OPTIONS)
+    return _read_only_engine
+
+
+def replica_router() -> ReplicaRouter[AsyncEngine]:
+    """Engines for ``settings.read_database_urls``; empty when no replica is configured."""
+
+    global _replica_router
+    if _replica_router is None:
+        _replica_router = ReplicaRouter(
+            [_create_engine(url, execution_options=READ_ONLY_OPTIONS) for url in settings.read_database_urls],
+            retry_after=settings.READ_REPLICA_RETRY_SECONDS,
+            name=lambda engine: engine.url.render_as_string(hide_password=True),
+        )
+    return _replica_router
+
+
 def async_session_factory() -> async_sessionmaker[AsyncSession]:
     global _session_factory
     if _session_factory is None:
@@ -52,3 +127,43 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def open_read_session() -> AsyncIterator[AsyncSession]:
+    """Read-only session on a healthy replica, or on the primary when none is configured or reachable.
+
+    Transactions are opened ``READ ONLY`` at ``REPEATABLE READ``, so all of a session's statements
+    read one snapshot, and nothing is ever flushed or committed; closing the session ends the
+    transaction and returns the connection to the pool. Replica connections are
+    checked out up front so an unreachable replica is detected here, marked unhealthy and skipped
+    instead of failing the request halfway through; a replica whose pool is exhausted is skipped
+    for this session only.
+    """
+
+    session_maker = async_session_factory()
+    router = replica_router()
+    for engine in router.candidates():
+        session = session_maker(bind=engine)
+        try:
+            await session.connection()
+        except (OSError, DBAPIError) as exc:
+            await session.close()
+            router.mark_unhealthy(engine)
+            logger.warning("Read replica %s unavailable, skipping: %s", engine.url.host, exc)
+            continue
+        except PoolTimeoutError:
+            # Reachable but its pool is exhausted: try the next one without marking it unhealthy.
+            await session.close()
+            logger.warning("Read replica %s has no free connection, skipping", engine.url.host)
+            continue
+        break
+    else:
+        session = session_maker(bind=build_read_only_engine())
+    async with session:
+        yield session
+
+
+async def get_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with open_read_session() as session:
+        yield session
@@ -0,0 +1,436 @@
+"""Deterministic synthetic sports, teams, venues, events and participants at benchmark volume.
+
+The same :class:`SyntheticDataSpec` (seed included) always yields the same rows, ids and all,
+so a slow query or an EXPLAIN plan seen on generated data can be reproduced elsewhere.
+Schedules look like the ones the service writes: each sport plays seasons of matchdays,
+no team plays twice at once and no venue hosts two active events at the same time. Rows
+are yielded in start order across sports, as a live system would have inserted them, so
+the planner's physical-correlation statistics are realistic too.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.bulk import copy_rows
+from app.models import Event, EventParticipant, EventParticipantRole, EventStatus, Sport, Team, Venue
+
+SPORT_COLUMNS = ("id", "code", "name")
+VENUE_COLUMNS = ("id", "name", "city", "country", "timezone", "capacity")
+TEAM_COLUMNS = ("id", "sport_id", "name", "abbr", "founded_year")
+EVENT_COLUMNS = (
+    "id",
+    "sport_id",
+    "venue_id",
+    "title",
+    "description",
+    "starts_at",
+    "ends_at",
+    "status",
+    "ticket_url",
+)
+PARTICIPANT_COLUMNS = ("id", "event_id", "team_id", "role")
+
+# Matchdays start on this four-hourly UTC grid; an event starts up to the largest stagger
+# later and ends by the next slot, so one team's consecutive matchdays never overlap.
+_KICKOFF_HOURS = (12, 16, 20)
+_STAGGERS = (0, 15, 30)
+_MAX_MINUTES = 240 - max(_STAGGERS)
+_WEEKDAY_WEIGHTS = (1.0, 1.0, 1.0, 1.2, 2.0, 3.0, 3.0)
+_HOUR_WEIGHTS = {12: 1.0, 16: 1.5, 20: 2.0}
+
+
+@dataclass(frozen=True)
+class _SportProfile:
+    code: str
+    name: str
+    season_start: int  # month
+    season_months: int
+    minutes: int
+    head_to_head: bool = True
+
+
+_SPORT_PROFILES = (
+    _SportProfile("soccer", "Soccer", 8, 10, 110),
+    _SportProfile("basketball", "Basketball", 10, 8, 150),
+    _SportProfile("ice-hockey", "Ice Hockey", 10, 8, 160),
+    _SportProfile("baseball", "Baseball", 4, 7, 190),
+    _SportProfile("american-football", "American Football", 9, 5, 200),
+    _SportProfile("tennis", "Tennis", 1, 11, 180),
+    _SportProfile("motorsport", "Motorsport", 3, 9, 150, head_to_head=False),
+    _SportProfile("volleyball", "Volleyball", 10, 7, 120),
+    _SportProfile("rugby", "Rugby Union", 9, 9, 120),
+    _SportProfile("cycling", "Cycling", 2, 8, 210, head_to_head=False),
+    _SportProfile("handball", "Handball", 9, 9, 90),
+    _SportProfile("golf", "Golf", 1, 10, 210, head_to_head=False),
+)
+
+_CITIES = (
+    ("London", "UK", "Europe/London"),
+    ("Manchester", "UK", "Europe/London"),
+    ("Madrid", "Spain", "Europe/Madrid"),
+    ("Barcelona", "Spain", "Europe/Madrid"),
+    ("Paris", "France", "Europe/Paris"),
+    ("Lyon", "France", "Europe/Paris"),
+    ("Berlin", "Germany", "Europe/Berlin"),
+    ("Munich", "Germany", "Europe/Berlin"),
+    ("Milan", "Italy", "Europe/Rome"),
+    ("Rome", "Italy", "Europe/Rome"),
+    ("Amsterdam", "Netherlands", "Europe/Amsterdam"),
+    ("Lisbon", "Portugal", "Europe/Lisbon"),
+    ("New York", "USA", "America/New_York"),
+    ("Boston", "USA", "America/New_York"),
+    ("Chicago", "USA", "America/Chicago"),
+    ("Dallas", "USA", "America/Chicago"),
+    ("Denver", "USA", "America/Denver"),
+    ("Los Angeles", "USA", "America/Los_Angeles"),
+    ("Seattle", "USA", "America/Los_Angeles"),
+    ("Toronto", "Canada", "America/Toronto"),
+    ("Mexico City", "Mexico", "America/Mexico_City"),
+    ("Sao Paulo", "Brazil", "America/Sao_Paulo"),
+    ("Buenos Aires", "Argentina", "America/Argentina/Buenos_Aires"),
+    ("Tokyo", "Japan", "Asia/Tokyo"),
+    ("Seoul", "South Korea", "Asia/Seoul"),
+    ("Sydney", "Australia", "Australia/Sydney"),
+    ("Melbourne", "Australia", "Australia/Melbourne"),
+    ("Johannesburg", "South Africa", "Africa/Johannesburg"),
+)
+_VENUE_KINDS = (
+    ("Stadium", 30_000, 90_000),
+    ("Arena", 8_000, 25_000),
+    ("Park", 15_000, 45_000),
+    ("Dome", 40_000, 75_000),
+    ("Centre", 3_000, 15_000),
+    ("Field", 5_000, 30_000),
+)
+_NICKNAMES = (
+    "United",
+    "Rovers",
+    "Lions",
+    "Eagles",
+    "Wolves",
+    "Falcons",
+    "Rangers",
+    "Comets",
+    "Titans",
+    "Hawks",
+    "Storm",
+    "Bears",
+    "Sharks",
+    "Pioneers",
+    "Knights",
+    "Giants",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticDataSpec:
+    sports: int = 6
+    teams_per_sport: int = 400
+    venues: int = 1200
+    events: int = 1_000_000
+    seasons: int = 3
+    first_season: int = 2024
+    field_size: int = 20  # participants per event in sports without home/away pairings
+    venue_ratio: float = 0.85  # share of events at the home team's venue, when it is free
+    cancelled_ratio: float = 0.03
+    seed: int = 0
+    as_of: datetime | None = None  # decides finished/live/scheduled; defaults to mid-span
+
+    def __post_init__(self) -> None:
+        if self.sports < 1 or self.seasons < 1 or self.events < 0 or self.venues < 0:
+            raise ValueError("sports and seasons must be positive; events and venues must not be negative")
+        if self.teams_per_sport < 2 or self.field_size < 2:
+            raise ValueError("every event needs at least two teams")
+        if not (0 <= self.venue_ratio <= 1 and 0 <= self.cancelled_ratio <= 1):
+            raise ValueError("ratios must be between 0 and 1")
+
+    @property
+    def reference_time(self) -> datetime:
+        if self.as_of is not None:
+            return self.as_of
+        start = datetime(self.first_season, 1, 1, tzinfo=UTC)
+        end = datetime(self.first_season + self.seasons + 1, 1, 1, tzinfo=UTC)
+        return start + (end - start) / 2
+
+
+@dataclass(frozen=True)
+class SyntheticDataCounts:
+    sports: int
+    teams: int
+    venues: int
+    events: int
+    participants: int
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _split(total: int, parts: int) -> list[int]:
+    base, extra = divmod(total, parts)
+    return [base + (1 if idx < extra else 0) for idx in range(parts)]
+
+
+def _add_months(day: date, months: int) -> date:
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+class SyntheticData:
+    """Rows for one spec; reference rows are small lists, events stream in start order."""
+
+    def __init__(self, spec: SyntheticDataSpec) -> None:
+        self.spec = spec
+        rng = random.Random(f"{spec.seed}:reference")
+        self._profiles = [self._profile(idx, rng) for idx in range(spec.sports)]
+        self.sports = [(_uuid(rng), profile.code, profile.name) for profile in self._profiles]
+        self.venues = [self._venue(idx, rng) for idx in range(spec.venues)]
+        self.teams: list[tuple[Any, ...]] = []
+        self._team_venue: list[list[int | None]] = []
+        for sport_idx, (sport_id, _, _) in enumerate(self.sports):
+            # Each venue serves one sport, so cross-sport bookings never collide; within a
+            # sport, teams share home grounds evenly.
+            venues = list(range(sport_idx, spec.venues, spec.sports))
+            self._team_venue.append(
+                [venues[idx % len(venues)] if venues else None for idx in range(spec.teams_per_sport)]
+            )
+            self.teams.extend(self._team(sport_id, idx, rng) for idx in range(spec.teams_per_sport))
+        self._check_capacity()
+
+    def events(self) -> Iterator[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]:
+        """``(event row, participant rows)`` for every event, ordered by ``starts_at``."""
+
+        per_sport = _split(self.spec.events, self.spec.sports)
+        streams = [self._sport_events(idx, count) for idx, count in enumerate(per_sport) if count]
+        return heapq.merge(*streams, key=lambda item: item[0][5])
+
+    def batches(self, size: int) -> Iterator[tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]]:
+        events: list[tuple[Any, ...]] = []
+        participants: list[tuple[Any, ...]] = []
+        for event, rows in self.events():
+            events.append(event)
+            participants.extend(rows)
+            if len(events) >= size:
+                yield events, participants
+                events, participants = [], []
+        if events:
+            yield events, participants
+
+    def _season_days(self, profile: _SportProfile, season: int) -> tuple[date, date]:
+        first_day = date(self.spec.first_season + season, profile.season_start, 1)
+        return first_day, _add_months(first_day, profile.season_months)
+
+    def _event_size(self, profile: _SportProfile) -> int:
+        return 2 if profile.head_to_head else min(self.spec.field_size, self.spec.teams_per_sport)
+
+    def _check_capacity(self) -> None:
+        """Fail before anything is written when a season cannot hold its matchdays."""
+
+        for profile, count in zip(self._profiles, _split(self.spec.events, self.spec.sports), strict=True):
+            games = self.spec.teams_per_sport // self._event_size(profile)
+            for season, season_count in enumerate(_split(count, self.spec.seasons)):
+                first_day, last_day = self._season_days(profile, season)
+                matchdays = math.ceil(season_count / games)
+                slots = (last_day - first_day).days * len(_KICKOFF_HOURS)
+                if matchdays > slots:
+                    raise ValueError(
+                        f"{profile.name}: {matchdays} matchdays do not fit in one season's {slots} kickoff slots; "
+                        "raise teams per sport or seasons"
+                    )
+
+    def _profile(self, idx: int, rng: random.Random) -> _SportProfile:
+        if idx < len(_SPORT_PROFILES):
+            return _SPORT_PROFILES[idx]
+        number = idx + 1
+        return _SportProfile(
+            f"sport-{number}",
+            f"Sport {number}",
+            season_start=rng.randint(1, 12),
+            season_months=rng.randint(5, 10),
+            minutes=rng.randrange(90, _MAX_MINUTES + 1, 10),
+            head_to_head=rng.random() < 0.8,
+        )
+
+    def _venue(self, idx: int, rng: random.Random) -> tuple[Any, ...]:
+        city, country, timezone = _CITIES[idx % len(_CITIES)]
+        kind, smallest, largest = _VENUE_KINDS[(idx // len(_CITIES)) % len(_VENUE_KINDS)]
+        round_ = idx // (len(_CITIES) * len(_VENUE_KINDS))
+        name = f"{city} {kind}" + (f" {round_ + 1}" if round_ else "")
+        return (_uuid(rng), name, city, country, timezone, rng.randrange(smallest, largest, 500))
+
+    def _team(self, sport_id: uuid.UUID, idx: int, rng: random.Random) -> tuple[Any, ...]:
+        city = _CITIES[idx % len(_CITIES)][0]
+        nickname = _NICKNAMES[(idx // len(_CITIES)) % len(_NICKNAMES)]
+        round_ = idx // (len(_CITIES) * len(_NICKNAMES))
+        name = f"{city} {nickname}" + (f" {round_ + 1}" if round_ else "")
+        abbr = (city[:2] + nickname[0]).upper() + (str(round_ + 1) if round_ else "")
+        return (_uuid(rng), sport_id, name, abbr, rng.randint(1870, 2015))
+
+    def _sport_events(self, sport_idx: int, count: int) -> Iterator[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]:
+        spec = self.spec
+        profile = self._profiles[sport_idx]
+        sport_id = self.sports[sport_idx][0]
+        teams = self.teams[sport_idx * spec.teams_per_sport : (sport_idx + 1) * spec.teams_per_sport]
+        home_venues = self._team_venue[sport_idx]
+        size = self._event_size(profile)
+        games = len(teams) // size
+        rng = random.Random(f"{spec.seed}:events:{profile.code}")
+        now = spec.reference_time
+
+        for season, season_count in enumerate(_split(count, spec.seasons)):
+            first_day, last_day = self._season_days(profile, season)
+            label = f"{first_day.year}" if first_day.year == last_day.year else f"{first_day.year}/{last_day:%y}"
+            slots = self._season_slots(first_day, last_day, math.ceil(season_count / games), rng)
+            remaining = season_count
+            for round_idx, slot in enumerate(slots):
+                fixtures = self._fixtures(len(teams), size, round_idx, rng)[: min(games, remaining)]
+                remaining -= len(fixtures)
+                booked: set[int] = set()
+                day: list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]] = []
+                for fixture in fixtures:
+                    event_id = _uuid(rng)
+                    stagger = rng.choice(_STAGGERS)
+                    starts_at = slot + timedelta(minutes=stagger)
+                    minutes = min(profile.minutes + rng.randrange(-10, 11, 5), _MAX_MINUTES)
+                    ends_at = starts_at + timedelta(minutes=minutes)
+
+                    venue_idx = home_venues[fixture[0]]
+                    if venue_idx is None or venue_idx in booked or rng.random() >= spec.venue_ratio:
+                        venue_id = None
+                    else:
+                        booked.add(venue_idx)
+                        venue_id = self.venues[venue_idx][0]
+
+                    if ends_at <= now:
+                        status = EventStatus.FINISHED
+                    elif starts_at <= now:
+                        status = EventStatus.LIVE
+                    else:
+                        status = EventStatus.SCHEDULED
+                    if status is not EventStatus.LIVE and rng.random() < spec.cancelled_ratio:
+                        status = EventStatus.CANCELLED
+
+                    names = [teams[team][2] for team in fixture]
+                    if profile.head_to_head:
+                        title = f"{names[0]} vs {names[1]}"
+                        roles = (EventParticipantRole.HOME, EventParticipantRole.AWAY)
+                    else:
+                        title = f"{profile.name} {label} - Round {round_idx + 1}"
+                        roles = (EventParticipantRole.PARTICIPANT,) * len(fixture)
+                    description = (
+                        f"Round {round_idx + 1} of the {label} {profile.name} season." if rng.random() < 0.7 else None
+                    )
+                    ticket_url = (
+                        f"https://tickets.example.com/events/{event_id.hex}"
+                        if status is EventStatus.SCHEDULED and rng.random() < 0.6
+                        else None
+                    )
+                    event = (
+                        event_id,
+                        sport_id,
+                        venue_id,
+                        title,
+                        description,
+                        starts_at,
+                        ends_at,
+                        status.value,
+                        ticket_url,
+                    )
+                    participants = [
+                        (_uuid(rng), event_id, teams[team][0], role.value)
+                        for team, role in zip(fixture, roles, strict=True)
+                    ]
+                    day.append((event, participants))
+                day.sort(key=lambda item: item[0][5])
+                yield from day
+
+    @staticmethod
+    def _season_slots(first_day: date, last_day: date, count: int, rng: random.Random) -> list[datetime]:
+        """``count`` distinct kickoff slots in the season, busier at weekends, evenings and mid-season."""
+
+        days = (last_day - first_day).days
+        candidates = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            shape = 0.6 + 0.4 * math.sin(math.pi * (offset + 0.5) / days)
+            for hour in _KICKOFF_HOURS:
+                weight = shape * _WEEKDAY_WEIGHTS[day.weekday()] * _HOUR_WEIGHTS[hour]
+                candidates.append((datetime(day.year, day.month, day.day, hour, tzinfo=UTC), weight))
+        # Weighted sampling without replacement (Efraimidis-Spirakis keys).
+        keyed = heapq.nlargest(count, candidates, key=lambda item: rng.random() ** (1 / item[1]))
+        return sorted(slot for slot, _ in keyed)
+
+    @staticmethod
+    def _fixtures(teams: int, size: int, round_idx: int, rng: random.Random) -> list[tuple[int, ...]]:
+        """Disjoint team groups for one matchday; pairs follow a double round-robin."""
+
+        if size != 2:
+            order = rng.sample(range(teams), teams)
+            return [tuple(order[idx : idx + size]) for idx in range(0, teams - size + 1, size)]
+        # Circle method: team 0 stays put, the rest rotate; an odd team out sits the round.
+        ring = teams + teams % 2
+        rounds = ring - 1
+        turn = round_idx % rounds
+        rotated = [0] + [1 + (turn + idx) % rounds for idx in range(rounds)]
+        pairs = []
+        for idx in range(ring // 2):
+            home, away = rotated[idx], rotated[ring - 1 - idx]
+            if home >= teams or away >= teams:
+                continue
+            # Balances home games within each cycle; the return cycle swaps every pairing.
+            swap = turn % 2 if idx == 0 else idx % 2
+            if swap != (round_idx // rounds) % 2:
+                home, away = away, home
+            pairs.append((home, away))
+        return pairs
+
+
+async def load_synthetic_data(
+    session: AsyncSession,
+    data: SyntheticData,
+    *,
+    batch_size: int = 50_000,
+    on_batch: Callable[[int], None] | None = None,
+) -> SyntheticDataCounts:
+    """COPY ``data`` into the database, committing reference rows and then every event batch.
+
+    ``on_batch`` receives the running event count after each commit. The participant
+    insert trigger refreshes search vectors once per batch.
+    """
+
+    await copy_rows(session, Sport.__table__, SPORT_COLUMNS, data.sports)
+    await copy_rows(session, Venue.__table__, VENUE_COLUMNS, data.venues)
+    await copy_rows(session, Team.__table__, TEAM_COLUMNS, data.teams)
+    await session.commit()
+
+    events = participants = 0
+    for event_rows, participant_rows in data.batches(batch_size):
+        await copy_rows(session, Event.__table__, EVENT_COLUMNS, event_rows)
+        await copy_rows(session, EventParticipant.__table__, PARTICIPANT_COLUMNS, participant_rows)
+        await session.commit()
+        events += len(event_rows)
+        participants += len(participant_rows)
+        if on_batch:
+            on_batch(events)
+
+    for table in (Sport, Venue, Team, Event, EventParticipant):
+        await session.execute(text(f"ANALYZE {table.__tablename__}"))
+    await session.commit()
+    return SyntheticDataCounts(
+        sports=len(data.sports),
+        teams=len(data.teams),
+        venues=len(data.venues),
+        events=events,
+        participants=participants,
+    )
@@ -1,10 +1,54 @@
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.api.deps import (
+    get_event_broadcaster,
+    get_event_cache,
+    get_event_loader,
+    shutdown_event_broadcaster,
+    shutdown_event_cache,
+    shutdown_listing_listener,
+    shutdown_reference_listener,
+)
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.metrics import Gauge, MetricsMiddleware, metrics
+from app.db.pool_metrics import InstrumentedAsyncPool
+from app.db.session import async_session_factory, build_engine
+from app.services import EventService
+from app.services.cache import event_count_cache, event_list_cache, reference_cache
+from app.services.status_scheduler import StatusScheduler
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    scheduler = None
+    if settings.STATUS_SCHEDULER_ENABLED:
+        scheduler = StatusScheduler(
+            async_session_factory(),
+            interval=settings.STATUS_SCHEDULER_INTERVAL_SECONDS,
+            batch_size=settings.STATUS_SCHEDULER_BATCH_SIZE,
+            service=EventService(list_cache=event_list_cache),
+        )
+        scheduler.start()
+    yield
+    if scheduler:
+        await scheduler.stop()
+    await shutdown_event_broadcaster()
+    await shutdown_event_cache()
+    await shutdown_reference_listener()
+    await shutdown_listing_listener()
+    await build_engine().dispose()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,6 +56,65 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Prev-Cursor", "X-Total-Count"],
 )
+app.add_middleware(MetricsMiddleware, query_budget=settings.REQUEST_QUERY_BUDGET)
 
 app.include_router(api_router, prefix="/api")
+
+
+def _pool_gauges() -> Iterator[Gauge]:
+    pool = build_engine().pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return
+    for name, value in asdict(pool.stats()).items():
+        yield f"db_pool_{name}", "Connection pool statistics for this worker.", {}, value
+
+
+def _cache_gauges() -> Iterator[Gauge]:
+    for cache_name, cache in (("reference", reference_cache), ("event_counts", event_count_cache)):
+        stats = cache.stats()
+        labels = {"cache": cache_name}
+        yield "cache_hits", "In-process cache hits.", labels, stats.hits
+        yield "cache_misses", "In-process cache misses.", labels, stats.misses
+        yield "cache_evictions", "In-process cache evictions.", labels, stats.evictions
+        yield "cache_entries", "In-process cache size.", labels, stats.size
+    if event_list_cache is not None:
+        stats = event_list_cache.stats()
+        labels = {"cache": "event_lists"}
+        yield "cache_hits", "In-process cache hits.", labels, stats.hits + stats.stale_hits
+        yield "cache_misses", "In-process cache misses.", labels, stats.misses
+        yield "cache_evictions", "In-process cache evictions.", labels, stats.evictions
+        yield "cache_entries", "In-process cache size.", labels, stats.size
+        yield "cache_bytes", "In-process cache size in bytes.", labels, stats.bytes
+        yield "cache_invalidations", "In-process cache entries dropped by writes.", labels, stats.invalidations
+
+
+def _stream_gauges() -> Iterator[Gauge]:
+    for name, value in asdict(get_event_broadcaster().stats()).items():
+        yield f"event_stream_{name}", "Live event stream fan-out for this worker.", {}, value
+
+
+def _loader_gauges() -> Iterator[Gauge]:
+    for name, value in asdict(get_event_loader().stats()).items():
+        yield f"event_loader_{name}", "Coalesced single-event lookups for this worker.", {}, value
+
+
+def _event_cache_gauges() -> Iterator[Gauge]:
+    cache = get_event_cache()
+    if cache is None:
+        return
+    for name, value in asdict(cache.stats()).items():
+        yield f"event_cache_{name}", "Single-event cache for this worker.", {}, value
+
+
+metrics.register_collector(_pool_gauges)
+metrics.register_collector(_cache_gauges)
+metrics.register_collector(_stream_gauges)
+metrics.register_collector(_loader_gauges)
+metrics.register_collector(_event_cache_gauges)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
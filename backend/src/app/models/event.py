@@ -7,6 +7,7 @@ from enum import Enum
 from sqlalchemy import (
     CheckConstraint,
     DateTime,
+    FetchedValue,
     ForeignKey,
     Index,
     String,
@@ -15,10 +16,10 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import RELATIONSHIP_LAZY, Base
 
 
 def _utcnow() -> datetime:
@@ -36,8 +37,20 @@ class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
         CheckConstraint("starts_at < ends_at", name="events_starts_before_ends"),
-        Index("ix_events_sport_starts_at", "sport_id", "starts_at"),
-        Index("ix_events_starts_at", "starts_at"),
+        Index("ix_events_starts_at_id", "starts_at", "id"),
+        Index("ix_events_sport_id_starts_at_id", "sport_id", "starts_at", "id"),
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves venue overlap probes and availability windows; cancelled events never block a venue.
+        Index(
+            "ix_events_venue_period",
+            "venue_id",
+            text("tstzrange(starts_at, ends_at, '[)')"),
+            postgresql_using="gist",
+            postgresql_where=text("venue_id IS NOT NULL AND status <> 'cancelled'"),
+        ),
+        # Candidates for the status scheduler's scheduled -> live and -> finished transitions.
+        Index("ix_events_due_live", "starts_at", postgresql_where=text("status = 'scheduled'")),
+        Index("ix_events_due_finished", "ends_at", postgresql_where=text("status IN ('scheduled', 'live')")),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -74,6 +87,9 @@ class Event(Base):
 
     ticket_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
 
+    # Maintained by database triggers from title, description and participant team names.
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=_utcnow,
@@ -86,15 +102,20 @@ class Event(Base):
         server_default=text("timezone('utc', now())"),
     )
 
-    sport = relationship("Sport", back_populates="events")
-    venue = relationship("Venue", back_populates="events")
+    sport = relationship("Sport", back_populates="events", lazy=RELATIONSHIP_LAZY)
+    venue = relationship("Venue", back_populates="events", lazy=RELATIONSHIP_LAZY)
     participants = relationship(
         "EventParticipant",
         back_populates="event",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy=RELATIONSHIP_LAZY,
     )
 
+    @property
+    def sport_name(self) -> str | None:
+        return self.sport.name if self.sport else None
+
 
 class EventParticipantRole(str, Enum):
     HOME = "home"
@@ -113,7 +134,14 @@ class EventParticipant(Base):
             postgresql_where=text("role in ('home','away')"),
         ),
         Index("ix_event_participants_event_id", "event_id"),
-        Index("ix_event_participants_team_id", "team_id"),
+        # Team schedules in start order, and team overlap probes; the period is copied from the event.
+        Index("ix_event_participants_team_id_starts_at", "team_id", "starts_at", "event_id"),
+        Index(
+            "ix_event_participants_team_period",
+            "team_id",
+            text("tstzrange(starts_at, ends_at, '[)')"),
+            postgresql_using="gist",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -141,5 +169,13 @@ class EventParticipant(Base):
         server_default=EventParticipantRole.PARTICIPANT.value,
     )
 
-    event = relationship("Event", back_populates="participants")
-    team = relationship("Team", back_populates="participants")
+    # Maintained by the event_participants_copy_period / events_propagate_period triggers.
+    starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=FetchedValue())
+    ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=FetchedValue())
+
+    event = relationship("Event", back_populates="participants", lazy=RELATIONSHIP_LAZY)
+    team = relationship("Team", back_populates="participants", lazy=RELATIONSHIP_LAZY)
+
+    @property
+    def team_name(self) -> str | None:
+        return self.team.name if self.team else None
@@ -6,7 +6,7 @@ from sqlalchemy import String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import RELATIONSHIP_LAZY, Base
 
 
 class Sport(Base):
@@ -20,5 +20,5 @@ class Sport(Base):
     code: Mapped[str] = mapped_column(String(64), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(255))
 
-    teams = relationship("Team", back_populates="sport", cascade="all, delete-orphan")
-    events = relationship("Event", back_populates="sport", cascade="all, delete-orphan")
+    teams = relationship("Team", back_populates="sport", cascade="all, delete-orphan", lazy=RELATIONSHIP_LAZY)
+    events = relationship("Event", back_populates="sport", cascade="all, delete-orphan", lazy=RELATIONSHIP_LAZY)
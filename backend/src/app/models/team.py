@@ -6,7 +6,7 @@ from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import RELATIONSHIP_LAZY, Base
 
 
 class Team(Base):
@@ -23,5 +23,7 @@ class Team(Base):
     abbr: Mapped[str | None] = mapped_column(String(16), nullable=True)
     founded_year: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    sport = relationship("Sport", back_populates="teams")
-    participants = relationship("EventParticipant", back_populates="team", cascade="all, delete-orphan")
+    sport = relationship("Sport", back_populates="teams", lazy=RELATIONSHIP_LAZY)
+    participants = relationship(
+        "EventParticipant", back_populates="team", cascade="all, delete-orphan", lazy=RELATIONSHIP_LAZY
+    )
@@ -6,7 +6,7 @@ from sqlalchemy import Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import RELATIONSHIP_LAZY, Base
 
 
 class Venue(Base):
@@ -19,4 +19,4 @@ class Venue(Base):
     timezone: Mapped[str] = mapped_column(String(64))
     capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    events = relationship("Event", back_populates="venue")
+    events = relationship("Event", back_populates="venue", lazy=RELATIONSHIP_LAZY)
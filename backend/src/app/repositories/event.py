@@ -1,14 +1,100 @@
 from __future__ import annotations
 
+import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Row,
+    Select,
+    Text,
+    bindparam,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
-from app.models.event import Event, EventParticipant
+from app.db.bulk import copy_rows
+from app.db.explain import Explain, planned_rows
+from app.db.locks import advisory_xact_locks, uuid_lock_key
+from app.db.notify import ChangeKind, EventChange, notify_event_changes
+from app.models.event import Event, EventParticipant, EventStatus
+from app.models.sport import Sport
+from app.models.team import Team
 from app.schemas.event import EventCreate
-from app.services.event_filters import EventListParams
+from app.services.event_filters import (
+    EventCursor,
+    EventFieldSet,
+    EventInclude,
+    EventListParams,
+    EventPage,
+    EventScope,
+)
+
+_EMPTY_JSON_ARRAY = literal_column("'[]'")
+# Must match the configuration the search_vector triggers use, or the GIN index cannot serve @@.
+_SEARCH_CONFIG = literal_column("'english'::regconfig")
+_EVENT_COPY_COLUMNS = (
+    "id",
+    "sport_id",
+    "venue_id",
+    "title",
+    "description",
+    "starts_at",
+    "ends_at",
+    "status",
+    "ticket_url",
+)
+_PARTICIPANT_COPY_COLUMNS = ("id", "event_id", "team_id", "role")
+_HALF_OPEN = literal_column("'[)'")
+# Written exactly as in the ix_events_venue_period predicate so the planner can use the partial index.
+_ACTIVE = Event.status != literal_column("'cancelled'")
+_PERIOD = func.tstzrange(Event.starts_at, Event.ends_at, _HALF_OPEN)
+_PARTICIPANT_PERIOD = func.tstzrange(EventParticipant.starts_at, EventParticipant.ends_at, _HALF_OPEN)
+_TIMESTAMPTZ = DateTime(timezone=True)
+# Advisory lock namespaces ("VENU", "TEAM") serializing booking checks per venue and per team.
+VENUE_BOOKING_LOCK = 0x5645_4E55
+TEAM_BOOKING_LOCK = 0x5445_414D
+# Many-to-one sides ride along as joins, so an event page costs two statements at any page size.
+_EVENT_LOADERS = (
+    joinedload(Event.sport, innerjoin=True),
+    selectinload(Event.participants).joinedload(EventParticipant.team),
+)
+# Hot statements are built once (per listing shape) with bindparam() placeholders and reused, so
+# requests skip statement construction and cache-key generation, which SQLAlchemy memoizes on the
+# statement object; the compiled SQL then comes from the engine's compiled cache.
+_GET = select(Event).options(*_EVENT_LOADERS).where(Event.id == bindparam("event_id"))
+_GET_MANY = select(Event).options(*_EVENT_LOADERS).where(Event.id.in_(bindparam("ids", expanding=True)))
+_GET_STATUSES = select(Event.id, Event.status).where(Event.id.in_(bindparam("ids", expanding=True)))
+_LIST_STATEMENT_CACHE_SIZE = 256
+# Keys of the JSON event document, in EventRead order.
+_DOCUMENT_FIELDS = (
+    "id",
+    "sport_id",
+    "sport_name",
+    "venue_id",
+    "title",
+    "description",
+    "starts_at",
+    "ends_at",
+    "status",
+    "ticket_url",
+    "participants",
+)
 
 
 class EventRepository:
@@ -31,7 +117,103 @@ class EventRepository:
         )
         session.add(event)
         await session.flush()
-        return await self.get(session, event.id)
+        await notify_event_changes(session, [_change(ChangeKind.created, event.id, data)])
+        # The new rows are already in the identity map; refresh them so sport/team names get loaded too.
+        return await self.get(session, event.id, populate_existing=True)
+
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        *,
+        rows: Sequence[EventCreate],
+    ) -> list[UUID]:
+        """Insert already-validated events and participants with two COPY statements."""
+
+        ids = [uuid.uuid4() for _ in rows]
+        events = [
+            (
+                event_id,
+                data.sport_id,
+                data.venue_id,
+                data.title,
+                data.description,
+                data.starts_at,
+                data.ends_at,
+                data.status.value,
+                str(data.ticket_url) if data.ticket_url else None,
+            )
+            for event_id, data in zip(ids, rows, strict=True)
+        ]
+        participants = [
+            (uuid.uuid4(), event_id, p.team_id, p.role.value)
+            for event_id, data in zip(ids, rows, strict=True)
+            for p in data.participants
+        ]
+        await copy_rows(session, Event.__table__, _EVENT_COPY_COLUMNS, events)
+        await copy_rows(session, EventParticipant.__table__, _PARTICIPANT_COPY_COLUMNS, participants)
+        await notify_event_changes(
+            session, [_change(ChangeKind.created, event_id, data) for event_id, data in zip(ids, rows, strict=True)]
+        )
+        return ids
+
+    async def transition_status(
+        self,
+        session: AsyncSession,
+        *,
+        to: EventStatus,
+        sources: Sequence[EventStatus],
+        ids: Sequence[UUID] | None = None,
+        starts_by: datetime | None = None,
+        ends_by: datetime | None = None,
+        ends_after: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[EventScope]:
+        """Move events currently in one of ``sources`` to ``to`` with one ``UPDATE ... RETURNING``.
+
+        Candidates are the given ``ids`` or, for the scheduler, events whose ``starts_at``/
+        ``ends_at`` passed the given instants, oldest first. The time-based form skips rows
+        locked by other writers (the next tick picks them up) and the status predicate is
+        rendered literally so it matches the ``ix_events_due_*`` partial indexes. Returns the
+        scope of every moved event.
+        """
+
+        statuses = [literal_column(f"'{status.value}'") for status in sources]
+        due = select(Event.id).where(Event.status.in_(statuses))
+        if ids is not None:
+            due = due.where(Event.id.in_(ids)).order_by(Event.id).with_for_update()
+        else:
+            due = due.order_by(Event.ends_at if ends_by else Event.starts_at).with_for_update(skip_locked=True)
+        if starts_by is not None:
+            due = due.where(Event.starts_at <= starts_by)
+        if ends_by is not None:
+            due = due.where(Event.ends_at <= ends_by)
+        if ends_after is not None:
+            due = due.where(Event.ends_at > ends_after)
+        if limit is not None:
+            due = due.limit(limit)
+        due_cte = due.cte("due")
+
+        stmt = (
+            update(Event)
+            .where(Event.id == due_cte.c.id)
+            .values(status=to, updated_at=func.now())
+            .returning(Event.id, Event.sport_id, Event.venue_id, Event.starts_at)
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await session.execute(stmt)).all()
+        await notify_event_changes(
+            session,
+            [
+                EventChange(ChangeKind.updated, row.id, row.sport_id, row.venue_id, to.value, row.starts_at)
+                for row in rows
+            ],
+        )
+        return [EventScope(row.sport_id, row.venue_id, row.starts_at, id=row.id) for row in rows]
+
+    async def get_statuses(self, session: AsyncSession, ids: Sequence[UUID]) -> dict[UUID, EventStatus]:
+        if not ids:
+            return {}
+        return dict((await session.execute(_GET_STATUSES, {"ids": list(ids)})).tuples().all())
 
     async def list(
         self,
@@ -39,47 +221,589 @@ class EventRepository:
         *,
         params: EventListParams,
     ) -> list[Event]:
-        order_col = Event.starts_at.desc() if params.order_desc else Event.starts_at.asc()
-        q: Select[Event] = (
-            select(Event)
-            .options(
-                selectinload(Event.participants).selectinload(EventParticipant.team),
-                selectinload(Event.sport),
+        result = await session.scalars(self._list_query(params), _bind_values(params, limit=params.limit))
+        events = list(result.all())
+        if params.cursor and params.cursor.backward:
+            events.reverse()
+        return events
+
+    async def list_page(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+    ) -> EventPage[list[Event]]:
+        """Fetch one page together with keyset cursors for its neighbours.
+
+        One extra row is read past the page to learn whether another page follows,
+        so the cursors never point at an empty page.
+        """
+
+        limit = params.limit
+        result = await session.scalars(self._list_query(params), _bind_values(params, limit=limit + 1))
+        events = list(result.all())
+        has_more = len(events) > limit
+        events = events[:limit]
+        if params.cursor and params.cursor.backward:
+            events.reverse()
+
+        if not events:
+            return EventPage(items=events)
+        first, last = events[0], events[-1]
+        return self._page(
+            params,
+            events,
+            first=(first.starts_at, first.id),
+            last=(last.starts_at, last.id),
+            has_more=has_more,
+        )
+
+    async def list_json(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+    ) -> EventPage[bytes]:
+        """Build the ``list[EventRead]`` response body for one page inside Postgres.
+
+        A single statement filters, pages and nests participants/team names with
+        ``json_build_object``/``json_agg``, so nothing is hydrated into ORM objects.
+        The first and last keys come back alongside the body to build the cursors.
+        """
+
+        stmt = _json_page_statement(_ListShape.of(params))
+        values = _bind_values(params, limit=params.limit + 1, page_end=params.offset + params.limit)
+        body, fetched, starts, ids = (await session.execute(stmt, values)).one()
+        payload = body.encode()
+        if not starts:
+            return EventPage(items=payload)
+        return self._page(
+            params,
+            payload,
+            first=(starts[0], UUID(str(ids[0]))),
+            last=(starts[-1], UUID(str(ids[-1]))),
+            has_more=fetched > params.limit,
+        )
+
+    async def stream_json(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Yield every matching event as an ``EventRead``-shaped JSON document, ignoring pagination.
+
+        Rows come through a server-side cursor, so memory stays flat regardless of the row count.
+        """
+
+        shape = _ListShape.of(params)
+        q = self._apply_filters(select(cast(self._event_document(Event.__table__.c), Text)), shape)
+        q = q.order_by(*self._order_by(shape, params.order_desc)).execution_options(yield_per=batch_size)
+        result = await session.stream_scalars(q, _bind_values(params))
+        try:
+            async for doc in result:
+                yield doc
+        finally:
+            await result.close()
+
+    async def get_documents(self, session: AsyncSession, ids: Sequence[UUID]) -> dict[UUID, str]:
+        """``EventRead``-shaped JSON for each of ``ids`` that exists, rendered in one statement."""
+
+        if not ids:
+            return {}
+        q = select(Event.id, cast(self._event_document(Event.__table__.c), Text)).where(Event.id.in_(ids))
+        return dict((await session.execute(q)).tuples().all())
+
+    async def stream_rows(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        """Flat rows for tabular exports; participants are folded into ``role:team`` pairs."""
+
+        participants = (
+            select(
+                func.string_agg(
+                    aggregate_order_by(
+                        func.concat(cast(EventParticipant.role, Text), ":", Team.name),
+                        EventParticipant.id,
+                    ),
+                    ";",
+                )
             )
-            .order_by(order_col, Event.id)
+            .select_from(EventParticipant)
+            .join(Team, Team.id == EventParticipant.team_id)
+            .where(EventParticipant.event_id == Event.id)
+            .scalar_subquery()
+        )
+        sport_name = select(Sport.name).where(Sport.id == Event.sport_id).scalar_subquery()
+        q = select(
+            Event.id,
+            Event.sport_id,
+            sport_name.label("sport_name"),
+            Event.venue_id,
+            Event.title,
+            Event.description,
+            Event.starts_at,
+            Event.ends_at,
+            Event.status,
+            Event.ticket_url,
+            participants.label("participants"),
         )
+        shape = _ListShape.of(params)
+        q = self._apply_filters(q, shape).order_by(*self._order_by(shape, params.order_desc))
+        result = await session.stream(q.execution_options(yield_per=batch_size), _bind_values(params))
+        try:
+            async for row in result:
+                yield row
+        finally:
+            await result.close()
 
-        if params.sport_id:
-            q = q.where(Event.sport_id == params.sport_id)
-        if params.venue_id:
-            q = q.where(Event.venue_id == params.venue_id)
-        if params.status:
-            q = q.where(Event.status == params.status)
-        if params.date_from:
-            q = q.where(Event.starts_at >= params.date_from)
-        if params.date_to:
-            q = q.where(Event.starts_at <= params.date_to)
-
-        if params.limit:
-            q = q.limit(params.limit)
-        if params.offset:
-            q = q.offset(params.offset)
-
-        result = await session.scalars(q)
-        return list(result.all())
+    async def lock_bookings(
+        self,
+        session: AsyncSession,
+        *,
+        venue_ids: Iterable[UUID] = (),
+        team_ids: Iterable[UUID] = (),
+    ) -> None:
+        """Hold each venue and team until the transaction ends, so overlap probes and inserts do not race.
+
+        Call it before probing for conflicts: a concurrent booking of the same venue or team waits
+        here until this transaction commits, and its probe then sees the new event. Venues are
+        always locked before teams, so writers cannot deadlock on each other.
+        """
+
+        await advisory_xact_locks(session, VENUE_BOOKING_LOCK, map(uuid_lock_key, venue_ids))
+        await advisory_xact_locks(session, TEAM_BOOKING_LOCK, map(uuid_lock_key, team_ids))
+
+    async def find_venue_conflict(
+        self,
+        session: AsyncSession,
+        *,
+        venue_id: UUID,
+        starts_at: datetime,
+        ends_at: datetime,
+    ) -> UUID | None:
+        """Id of an active event booking ``venue_id`` during ``[starts_at, ends_at)``, if any."""
+
+        window = func.tstzrange(literal(starts_at, _TIMESTAMPTZ), literal(ends_at, _TIMESTAMPTZ), _HALF_OPEN)
+        q = select(Event.id).where(Event.venue_id == venue_id, _ACTIVE, _PERIOD.op("&&")(window)).limit(1)
+        return (await session.execute(q)).scalar_one_or_none()
+
+    async def find_venue_conflicts(
+        self,
+        session: AsyncSession,
+        *,
+        windows: Sequence[tuple[int, UUID, datetime, datetime]],
+    ) -> dict[int, UUID]:
+        """Batch form of ``find_venue_conflict``: ``(key, venue_id, starts_at, ends_at)`` in, key -> clash out.
+
+        The windows travel as four arrays unnested server-side, so the parameter count stays
+        fixed however large the batch is.
+        """
+
+        if not windows:
+            return {}
+        requested = _unnest_windows(windows, "venue_id")
+        window = func.tstzrange(requested.c.starts_at, requested.c.ends_at, _HALF_OPEN)
+        q = (
+            select(requested.c.key, func.min(cast(Event.id, Text)))
+            .select_from(requested)
+            .join(Event, (Event.venue_id == requested.c.venue_id) & _ACTIVE & _PERIOD.op("&&")(window))
+            .group_by(requested.c.key)
+        )
+        return {key: UUID(event_id) for key, event_id in (await session.execute(q)).all()}
+
+    async def find_team_conflicts(
+        self,
+        session: AsyncSession,
+        *,
+        windows: Sequence[tuple[int, UUID, datetime, datetime]],
+    ) -> dict[int, UUID]:
+        """Like ``find_venue_conflicts`` but for teams: ``(key, team_id, starts_at, ends_at)`` in.
+
+        Probes the participants' copy of the event period, so only the matches visit ``events``
+        (to skip cancelled ones).
+        """
+
+        if not windows:
+            return {}
+        requested = _unnest_windows(windows, "team_id")
+        window = func.tstzrange(requested.c.starts_at, requested.c.ends_at, _HALF_OPEN)
+        q = (
+            select(requested.c.key, func.min(cast(EventParticipant.event_id, Text)))
+            .select_from(requested)
+            .join(
+                EventParticipant,
+                (EventParticipant.team_id == requested.c.team_id) & _PARTICIPANT_PERIOD.op("&&")(window),
+            )
+            .join(Event, (Event.id == EventParticipant.event_id) & _ACTIVE)
+            .group_by(requested.c.key)
+        )
+        return {key: UUID(event_id) for key, event_id in (await session.execute(q)).all()}
+
+    async def list_venue_bookings(
+        self,
+        session: AsyncSession,
+        *,
+        venue_id: UUID,
+        starts_at: datetime,
+        ends_at: datetime,
+    ) -> list[Row]:
+        """``(id, starts_at, ends_at)`` of active events at the venue overlapping the window, by start."""
+
+        window = func.tstzrange(literal(starts_at, _TIMESTAMPTZ), literal(ends_at, _TIMESTAMPTZ), _HALF_OPEN)
+        q = (
+            select(Event.id, Event.starts_at, Event.ends_at)
+            .where(Event.venue_id == venue_id, _ACTIVE, _PERIOD.op("&&")(window))
+            .order_by(Event.starts_at, Event.id)
+        )
+        return list((await session.execute(q)).all())
+
+    async def list_versions(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+    ) -> list[tuple[UUID, datetime]]:
+        """``(id, updated_at)`` of the rows ``list_page`` would return, without loading them."""
+
+        q = _versions_statement(_ListShape.of(params), with_total=False)
+        result = await session.execute(q, _bind_values(params, limit=params.limit))
+        return [(row.id, row.updated_at) for row in result]
+
+    async def list_versions_with_total(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams,
+    ) -> tuple[list[tuple[UUID, datetime]], int]:
+        """``list_versions`` plus the exact filtered total from ``count(*) OVER ()`` in the same scan.
+
+        Keyset pages (and offsets past the end) cannot see the whole filtered set, so
+        they fall back to a separate ``count`` query.
+        """
+
+        if params.cursor:
+            return await self.list_versions(session, params=params), await self.count(session, params=params)
+
+        q = _versions_statement(_ListShape.of(params), with_total=True)
+        rows = (await session.execute(q, _bind_values(params, limit=params.limit))).all()
+        if rows:
+            return [(row.id, row.updated_at) for row in rows], rows[0].total
+        return [], (await self.count(session, params=params) if params.offset else 0)
+
+    async def count(self, session: AsyncSession, *, params: EventListParams) -> int:
+        return (await session.execute(_count_statement(_ListShape.of(params)), _bind_values(params))).scalar_one()
+
+    async def estimate_count(self, session: AsyncSession, *, params: EventListParams) -> int:
+        """Planner row estimate for the filtered set; free, but only as good as the table statistics."""
+
+        q = self._apply_filters(select(Event.id), _ListShape.of(params))
+        plan = (await session.execute(Explain(q), _bind_values(params))).scalar_one()
+        return planned_rows(plan)
 
     async def get(
         self,
         session: AsyncSession,
         event_id: UUID,
+        *,
+        populate_existing: bool = False,
     ) -> Event | None:
-        q = (
-            select(Event)
-            .options(
-                selectinload(Event.participants).selectinload(EventParticipant.team),
-                selectinload(Event.sport),
+        options = {"populate_existing": True} if populate_existing else {}
+        result = await session.scalars(_GET, {"event_id": event_id}, execution_options=options)
+        return result.one_or_none()
+
+    async def get_many(self, session: AsyncSession, ids: Sequence[UUID]) -> list[Event]:
+        """Events among ``ids`` that exist, with one ``IN`` query plus the batched relationship loads."""
+
+        if not ids:
+            return []
+        result = await session.scalars(_GET_MANY, {"ids": list(ids)})
+        return list(result.all())
+
+    def _list_query(self, params: EventListParams) -> Select[tuple[Event]]:
+        """ORM page statement for ``params``, bound with ``_bind_values(params, limit=...)``."""
+
+        return _list_statement(_ListShape.of(params))
+
+    @classmethod
+    def _keys_query(cls, shape: _ListShape) -> Select:
+        """Page rows as plain columns, numbered in fetch order; callers bind a look-ahead ``limit``."""
+
+        descending = cls._scans_descending(shape)
+        row_number = func.row_number().over(order_by=cls._order_by(shape, descending)).label("rn")
+        names = set(shape.field_set.columns) | {"id", "starts_at"}
+        if EventInclude.sport in shape.field_set.include:
+            names.add("sport_id")
+        q = select(*(column for column in Event.__table__.c if column.name in names), row_number)
+        return cls._seek(q, shape).limit(bindparam("limit"))
+
+    @classmethod
+    def _seek(cls, q: Select, shape: _ListShape) -> Select:
+        q = cls._apply_filters(q, shape)
+
+        # Walking backwards flips the scan direction; callers restore display order.
+        descending = cls._scans_descending(shape)
+        q = q.order_by(*cls._order_by(shape, descending))
+
+        if shape.backward is not None:
+            key = tuple_(Event.starts_at, Event.id)
+            position = tuple_(
+                bindparam("cursor_starts_at", type_=_TIMESTAMPTZ), bindparam("cursor_id", type_=PG_UUID(as_uuid=True))
             )
-            .where(Event.id == event_id)
+            q = q.where(key < position if descending else key > position)
+        elif shape.offset:
+            q = q.offset(bindparam("offset"))
+        return q
+
+    @staticmethod
+    def _event_document(cols, field_set: EventFieldSet | None = None):
+        """``json_build_object`` mirroring ``EventRead`` over ``events`` columns (or a subquery of them).
+
+        With a ``field_set`` only its fields are rendered, and skipped expansions cost no subquery.
+        """
+
+        fields = (field_set or EventFieldSet()).response_fields
+        parts = []
+        for name in _DOCUMENT_FIELDS:
+            if name not in fields:
+                continue
+            if name == "sport_name":
+                value = select(Sport.name).where(Sport.id == cols.sport_id).scalar_subquery()
+            elif name == "participants":
+                value = func.coalesce(_participants_document(cols.id), literal_column("'[]'::json"))
+            else:
+                value = getattr(cols, name)
+            parts.extend((name, value))
+        return func.json_build_object(*parts)
+
+    @staticmethod
+    def _scans_descending(shape: _ListShape) -> bool:
+        if shape.backward:
+            return not shape.order_desc
+        return shape.order_desc
+
+    @staticmethod
+    def _ordering(descending: bool):
+        if descending:
+            return Event.starts_at.desc(), Event.id.desc()
+        return Event.starts_at.asc(), Event.id.asc()
+
+    @classmethod
+    def _order_by(cls, shape: _ListShape, descending: bool):
+        """Keyset ordering, preceded by relevance when a search query is present."""
+
+        if "q" in shape.filters:
+            rank = func.ts_rank_cd(Event.search_vector, _websearch(bindparam("q")))
+            return rank.desc(), *cls._ordering(descending)
+        return cls._ordering(descending)
+
+    @staticmethod
+    def _page(
+        params: EventListParams,
+        items,
+        *,
+        first: tuple[datetime, UUID],
+        last: tuple[datetime, UUID],
+        has_more: bool,
+    ) -> EventPage:
+        if params.q:
+            # Rank-ordered results page by offset only; there is no keyset to hand out.
+            return EventPage(items=items)
+        if params.cursor and params.cursor.backward:
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, params.cursor is not None or params.offset > 0
+        return EventPage(
+            items=items,
+            next_cursor=EventCursor(*last) if has_next else None,
+            prev_cursor=EventCursor(*first, backward=True) if has_prev else None,
         )
-        result = await session.scalars(q)
-        return result.one_or_none()
+
+    @staticmethod
+    def _apply_filters(q: Select, shape: _ListShape) -> Select:
+        filters = shape.filters
+        if "sport_id" in filters:
+            q = q.where(Event.sport_id == bindparam("sport_id"))
+        if "venue_id" in filters:
+            q = q.where(Event.venue_id == bindparam("venue_id"))
+        if "team_id" in filters:
+            # Date bounds are repeated on the participants' copy of starts_at so the
+            # (team_id, starts_at) index scan only visits the requested range.
+            team_events = select(EventParticipant.event_id).where(EventParticipant.team_id == bindparam("team_id"))
+            if "date_from" in filters:
+                team_events = team_events.where(EventParticipant.starts_at >= bindparam("date_from"))
+            if "date_to" in filters:
+                team_events = team_events.where(EventParticipant.starts_at <= bindparam("date_to"))
+            q = q.where(Event.id.in_(team_events))
+        if "status" in filters:
+            q = q.where(Event.status == bindparam("status"))
+        if "date_from" in filters:
+            q = q.where(Event.starts_at >= bindparam("date_from"))
+        if "date_to" in filters:
+            q = q.where(Event.starts_at <= bindparam("date_to"))
+        if "ids" in filters:
+            q = q.where(Event.id.in_(bindparam("ids", expanding=True)))
+        if "q" in filters:
+            q = q.where(Event.search_vector.bool_op("@@")(_websearch(bindparam("q"))))
+        return q
+
+
+@dataclass(frozen=True)
+class _ListShape:
+    """Which filters, ordering and paging mode a listing uses, without their values.
+
+    Listing statements depend only on this, so they are built once per shape and executed
+    with the values from :func:`_bind_values`.
+    """
+
+    filters: frozenset[str] = frozenset()
+    order_desc: bool = False
+    backward: bool | None = None  # cursor direction; None without a cursor
+    offset: bool = False
+    field_set: EventFieldSet = EventFieldSet()
+
+    @classmethod
+    def of(cls, params: EventListParams) -> _ListShape:
+        return cls(
+            filters=frozenset(name for name, value in _filter_values(params).items() if value is not None),
+            order_desc=params.order_desc,
+            backward=params.cursor.backward if params.cursor else None,
+            offset=params.offset > 0,
+            field_set=params.field_set,
+        )
+
+
+def _filter_values(params: EventListParams) -> dict[str, Any]:
+    return {
+        "sport_id": params.sport_id,
+        "venue_id": params.venue_id,
+        "team_id": params.team_id,
+        "status": params.status,
+        "date_from": params.date_from,
+        "date_to": params.date_to,
+        "ids": list(params.ids) if params.ids is not None else None,
+        "q": params.q,
+    }
+
+
+def _bind_values(params: EventListParams, **extra: Any) -> dict[str, Any]:
+    """Values for the placeholders of ``params``' listing statements (unused keys are ignored)."""
+
+    values = {name: value for name, value in _filter_values(params).items() if value is not None}
+    if params.cursor:
+        values["cursor_starts_at"] = params.cursor.starts_at
+        values["cursor_id"] = params.cursor.id
+    values["offset"] = params.offset
+    values.update(extra)
+    return values
+
+
+@lru_cache(maxsize=_LIST_STATEMENT_CACHE_SIZE)
+def _list_statement(shape: _ListShape) -> Select[tuple[Event]]:
+    q: Select[tuple[Event]] = select(Event).options(*_list_loaders(shape.field_set))
+    return EventRepository._seek(q, shape).limit(bindparam("limit"))
+
+
+@lru_cache(maxsize=_LIST_STATEMENT_CACHE_SIZE)
+def _versions_statement(shape: _ListShape, *, with_total: bool) -> Select:
+    columns = [Event.id, Event.updated_at]
+    if with_total:
+        columns.append(func.count().over().label("total"))
+    return EventRepository._seek(select(*columns), shape).limit(bindparam("limit"))
+
+
+@lru_cache(maxsize=_LIST_STATEMENT_CACHE_SIZE)
+def _count_statement(shape: _ListShape) -> Select:
+    return EventRepository._apply_filters(select(func.count()).select_from(Event), shape)
+
+
+@lru_cache(maxsize=_LIST_STATEMENT_CACHE_SIZE)
+def _json_page_statement(shape: _ListShape) -> Select:
+    """The ``list_json`` statement; binds ``limit`` (page size plus look-ahead) and ``page_end``."""
+
+    page = EventRepository._keys_query(shape).subquery("page")
+    body_order = page.c.rn.desc() if shape.backward else page.c.rn.asc()
+    in_page = page.c.rn <= bindparam("page_end")
+
+    doc = EventRepository._event_document(page.c, shape.field_set)
+
+    return select(
+        func.coalesce(
+            cast(func.json_agg(aggregate_order_by(doc, body_order)).filter(in_page), Text), _EMPTY_JSON_ARRAY
+        ),
+        func.count(),
+        func.array_agg(aggregate_order_by(page.c.starts_at, body_order)).filter(in_page),
+        func.array_agg(aggregate_order_by(page.c.id, body_order)).filter(in_page),
+    ).select_from(page)
+
+
+def _participants_document(event_id):
+    return (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "team_id",
+                        EventParticipant.team_id,
+                        "role",
+                        EventParticipant.role,
+                        "team_name",
+                        Team.name,
+                    ),
+                    EventParticipant.id,
+                )
+            )
+        )
+        .select_from(EventParticipant)
+        .join(Team, Team.id == EventParticipant.team_id)
+        .where(EventParticipant.event_id == event_id)
+        .scalar_subquery()
+    )
+
+
+def _list_loaders(field_set: EventFieldSet) -> tuple:
+    """Loader options for a listing: only the requested columns, and only the requested relationships.
+
+    Unrequested columns raise on access instead of lazy-loading, so a trimmed response can
+    never quietly cost a query per row.
+    """
+
+    if field_set.is_full:
+        return _EVENT_LOADERS
+    # starts_at is always needed to build the page cursors.
+    columns = [getattr(Event, name) for name in field_set.columns if name != "starts_at"]
+    options: list = [load_only(Event.starts_at, *columns, raiseload=True)]
+    if EventInclude.sport in field_set.include:
+        options.append(_EVENT_LOADERS[0])
+    if EventInclude.participants in field_set.include:
+        options.append(_EVENT_LOADERS[1])
+    return tuple(options)
+
+
+def _change(kind: ChangeKind, event_id: UUID, data: EventCreate) -> EventChange:
+    return EventChange(kind, event_id, data.sport_id, data.venue_id, data.status.value, data.starts_at)
+
+
+def _unnest_windows(windows: Sequence[tuple[int, UUID, datetime, datetime]], owner: str):
+    """``(key, <owner>, starts_at, ends_at)`` rows as a derived table built from four array parameters."""
+
+    keys, owners, starts, ends = (list(col) for col in zip(*windows, strict=True))
+    return (
+        func.unnest(
+            literal(keys, ARRAY(Integer)),
+            literal(owners, ARRAY(PG_UUID(as_uuid=True))),
+            literal(starts, ARRAY(_TIMESTAMPTZ)),
+            literal(ends, ARRAY(_TIMESTAMPTZ)),
+        )
+        .table_valued("key", owner, "starts_at", "ends_at")
+        .render_derived(name="requested")
+    )
+
+
+def _websearch(text: str):
+    return func.websearch_to_tsquery(_SEARCH_CONFIG, text)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,3 +12,9 @@ class SportRepository:
     async def list_all(self, session: AsyncSession) -> list[Sport]:
         result = await session.scalars(select(Sport).order_by(Sport.name))
         return result.all()
+
+    async def get_by_ids(self, session: AsyncSession, ids: set[UUID]) -> list[Sport]:
+        if not ids:
+            return []
+        result = await session.scalars(select(Sport).where(Sport.id.in_(ids)))
+        return list(result.all())
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from uuid import UUID
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,3 +14,12 @@ class VenueRepository:
     async def list_all(self, session: AsyncSession) -> list[Venue]:
         result = await session.scalars(select(Venue).order_by(Venue.name))
         return result.all()
+
+    async def get(self, session: AsyncSession, venue_id: UUID) -> Venue | None:
+        return await session.get(Venue, venue_id)
+
+    async def get_by_ids(self, session: AsyncSession, ids: set[UUID]) -> list[Venue]:
+        if not ids:
+            return []
+        result = await session.scalars(select(Venue).where(Venue.id.in_(ids)))
+        return list(result.all())
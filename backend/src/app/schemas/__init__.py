@@ -1,13 +1,32 @@
 """Pydantic schemas for request/response payloads."""
 
-from app.schemas.event import EventCreate, EventParticipantCreate, EventRead
+from app.schemas.event import (
+    EventBulkError,
+    EventBulkResult,
+    EventCreate,
+    EventParticipantCreate,
+    EventRead,
+    EventStatusError,
+    EventStatusResult,
+    EventStatusUpdate,
+)
 from app.schemas.sport import SportRead
 from app.schemas.team import TeamRead
+from app.schemas.venue import BusyInterval, TimeInterval, VenueAvailability, VenueRead
 
 __all__ = [
+    "BusyInterval",
+    "EventBulkError",
+    "EventBulkResult",
     "EventCreate",
     "EventParticipantCreate",
     "EventRead",
+    "EventStatusError",
+    "EventStatusResult",
+    "EventStatusUpdate",
     "SportRead",
     "TeamRead",
+    "TimeInterval",
+    "VenueAvailability",
+    "VenueRead",
 ]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from uuid import UUID
 
-from pydantic import AnyUrl, AwareDatetime, ConfigDict, Field
+from pydantic import AnyUrl, AwareDatetime, ConfigDict, Field, create_model
 
 from app.models.event import EventParticipantRole, EventStatus
 from app.schemas.base import Schema
 
+EVENT_STATUS_MAX_IDS = 1000
+
 
 class EventParticipantCreate(Schema):
     team_id: UUID
@@ -44,3 +47,42 @@ class EventRead(Schema):
     status: EventStatus
     ticket_url: AnyUrl | None
     participants: list[EventParticipantRead] = Field(default_factory=list)
+
+
+@lru_cache(maxsize=256)
+def event_read_subset(fields: frozenset[str]) -> type[Schema]:
+    """``EventRead`` restricted to ``fields`` (sparse listings); ``EventRead`` itself when all are present."""
+
+    if fields >= EventRead.model_fields.keys():
+        return EventRead
+    return create_model(
+        "EventReadSubset",
+        __base__=Schema,
+        **{name: (info.annotation, info) for name, info in EventRead.model_fields.items() if name in fields},
+    )
+
+
+class EventBulkError(Schema):
+    index: int
+    detail: str
+
+
+class EventBulkResult(Schema):
+    created: int
+    ids: list[UUID] = Field(default_factory=list)
+    errors: list[EventBulkError] = Field(default_factory=list)
+
+
+class EventStatusUpdate(Schema):
+    ids: list[UUID] = Field(min_length=1, max_length=EVENT_STATUS_MAX_IDS)
+    status: EventStatus
+
+
+class EventStatusError(Schema):
+    id: UUID
+    detail: str
+
+
+class EventStatusResult(Schema):
+    updated: list[UUID] = Field(default_factory=list)
+    errors: list[EventStatusError] = Field(default_factory=list)
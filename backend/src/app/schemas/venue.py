@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from pydantic import AwareDatetime, Field
+
+from app.schemas.base import Schema
+
+
+class VenueRead(Schema):
+    id: UUID
+    name: str
+    city: str | None = None
+    country: str | None = None
+    timezone: str
+    capacity: int | None = None
+
+
+class TimeInterval(Schema):
+    starts_at: AwareDatetime
+    ends_at: AwareDatetime
+
+
+class BusyInterval(TimeInterval):
+    event_ids: list[UUID] = Field(default_factory=list)
+
+
+class VenueAvailability(Schema):
+    venue_id: UUID
+    date_from: AwareDatetime
+    date_to: AwareDatetime
+    busy: list[BusyInterval] = Field(default_factory=list)
+    free: list[TimeInterval] = Field(default_factory=list)
@@ -1,14 +1,18 @@
 """Business logic."""
 
 from app.services.events import EventService
-from app.services.exceptions import ServiceError, ValidationError
+from app.services.exceptions import CapacityError, ConflictError, ServiceError, ValidationError
 from app.services.sports import SportService
 from app.services.teams import TeamService
+from app.services.venues import VenueService
 
 __all__ = [
     "EventService",
     "SportService",
     "TeamService",
+    "VenueService",
+    "CapacityError",
+    "ConflictError",
     "ServiceError",
     "ValidationError",
 ]
@@ -0,0 +1,93 @@
+"""DataLoader-style coalescing of concurrent single-key lookups into batched loads."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class BatchLoaderStats:
+    loads: int  # calls to load()
+    keys: int  # distinct keys handed to the batch function
+    batches: int
+
+
+class BatchLoader(Generic[K, V]):
+    """Collects ``load(key)`` calls for ``window`` seconds and resolves them with one ``load_many``.
+
+    Calls for the same key within a window share one result. A batch is sent early once it
+    holds ``max_batch`` keys. Nothing is cached between batches, so every batch reads fresh
+    data; an exception from ``load_many`` is raised to every caller of that batch, and
+    cancelling the batch cancels every caller's wait.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[Sequence[K]], Awaitable[Mapping[K, V]]],
+        *,
+        window: float = 0.002,
+        max_batch: int = 100,
+    ) -> None:
+        self._load_many = load_many
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._loads = 0
+        self._keys = 0
+        self._batches = 0
+
+    async def load(self, key: K) -> V | None:
+        """The value for ``key``, or None when ``load_many`` did not return it."""
+
+        self._loads += 1
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self._window, self._dispatch)
+        # Shielded so one caller giving up does not cancel the result for the others.
+        return await asyncio.shield(future)
+
+    def stats(self) -> BatchLoaderStats:
+        return BatchLoaderStats(loads=self._loads, keys=self._keys, batches=self._batches)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self._batches += 1
+        self._keys += len(batch)
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[V | None]]) -> None:
+        try:
+            values = await self._load_many(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled mid-load (e.g. at shutdown): callers must not wait on a batch that never finishes.
+            for future in batch.values():
+                future.cancel()
+            raise
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,295 @@
+"""Small in-process caches shared by the service layer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache whose entries also expire ``ttl`` seconds after they were stored.
+
+    Not thread-safe; it is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K, default=None):
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING or entry[0] <= self._clock():
+            if entry is not _MISSING:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = await loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, *keys: K) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            ttl_seconds=self._ttl,
+        )
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    hits: int
+    stale_hits: int
+    misses: int
+    coalesced: int  # misses that waited for a load already in flight
+    refreshes: int
+    evictions: int
+    invalidations: int
+    size: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    size: int
+    fresh_until: float
+    stale_until: float
+
+
+class ResponseCache(Generic[K, V]):
+    """LRU cache of rendered responses, bounded by entry count and by total size.
+
+    * Entries are fresh for ``ttl`` seconds; for ``stale_ttl`` seconds after that they are
+      still served while one background load replaces them (stale-while-revalidate).
+    * Concurrent misses for one key share a single load (single-flight).
+    * :meth:`invalidate_where` drops matching entries and discards loads for them that are
+      still running, so a load that started before a write can never repopulate the cache.
+
+    Not thread-safe; it is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        size_of: Callable[[V], int],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must be >= 0")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be >= 1")
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+        self._superseded: set[K] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._start_load(key, loader).add_done_callback(_log_refresh_failure)
+            return entry.value
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_load(key, loader)
+        else:
+            self.coalesced += 1
+        # Shielded so one caller giving up does not cancel the load the others wait for.
+        return await asyncio.shield(task)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        """Drop every entry whose key matches; returns how many were dropped."""
+
+        dropped = [key for key in self._entries if predicate(key)]
+        for key in dropped:
+            self._remove(key)
+        self._superseded.update(key for key in self._inflight if predicate(key))
+        self.invalidations += len(dropped)
+        return len(dropped)
+
+    def clear(self) -> None:
+        self._superseded.update(self._inflight)
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self.hits,
+            stale_hits=self.stale_hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            refreshes=self.refreshes,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            size=len(self._entries),
+            bytes=self._bytes,
+            max_entries=self._max_entries,
+            max_bytes=self._max_bytes,
+        )
+
+    def _start_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> asyncio.Task[V]:
+        task = asyncio.ensure_future(self._load(key, loader))
+        self._inflight[key] = task
+        return task
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await loader()
+        finally:
+            del self._inflight[key]
+            superseded = key in self._superseded
+            self._superseded.discard(key)
+        if not superseded:
+            self._store(key, value)
+        return value
+
+    def _store(self, key: K, value: V) -> None:
+        size = self._size_of(value)
+        if key in self._entries:
+            self._remove(key)
+        if size > self._max_bytes:
+            return
+        now = self._clock()
+        self._entries[key] = _Entry(value, size, now + self._ttl, now + self._ttl + self._stale_ttl)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: K) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background cache refresh failed", exc_info=task.exception())
+
+
+# Sports, teams and venues change a few times a season but are read on every page.
+reference_cache: TTLCache[str, object] = TTLCache(
+    ttl=settings.REFERENCE_CACHE_TTL_SECONDS,
+    max_entries=settings.REFERENCE_CACHE_MAX_ENTRIES,
+)
+
+# Totals per filter combination for ``count=cached`` listings; short-lived by design.
+event_count_cache: TTLCache[Hashable, int] = TTLCache(
+    ttl=settings.EVENT_COUNT_CACHE_TTL_SECONDS,
+    max_entries=settings.EVENT_COUNT_CACHE_MAX_ENTRIES,
+)
+
+
+def invalidate_reference_data(*keys: str) -> None:
+    """Drop cached reference data after a write; without keys everything is dropped."""
+
+    if keys:
+        reference_cache.invalidate(*keys)
+    else:
+        reference_cache.clear()
+
+
+# Rendered ``GET /events`` responses per listing key; None when EVENT_LIST_CACHE_TTL_SECONDS is 0.
+event_list_cache: ResponseCache[Hashable, object] | None = (
+    ResponseCache(
+        ttl=settings.EVENT_LIST_CACHE_TTL_SECONDS,
+        stale_ttl=settings.EVENT_LIST_CACHE_STALE_SECONDS,
+        max_entries=settings.EVENT_LIST_CACHE_MAX_ENTRIES,
+        max_bytes=settings.EVENT_LIST_CACHE_MAX_BYTES,
+        size_of=lambda listing: len(listing.body),
+    )
+    if settings.EVENT_LIST_CACHE_TTL_SECONDS > 0
+    else None
+)
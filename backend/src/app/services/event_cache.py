@@ -0,0 +1,145 @@
+"""Per-worker cache of single events, kept coherent across workers by ``LISTEN event_changes``."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from app.db.notify import EVENT_CHANGES_CHANNEL, EventChange, PgListener
+from app.models.event import Event
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+EventLoad = Callable[[UUID], Awaitable[Event | None]]
+
+
+@dataclass(frozen=True)
+class EventCacheStats:
+    hits: int
+    misses: int
+    bypassed: int  # lookups sent straight to the database while the LISTEN connection was down
+    invalidations: int
+    flushes: int
+    size: int
+    listener_connected: bool
+    listener_reconnects: int
+
+
+class EventCache:
+    """Serves ``GET /events/{id}`` from memory for at most ``ttl`` seconds per entry.
+
+    Every committed event write already sends ``NOTIFY event_changes`` (see
+    :mod:`app.db.notify`); one ``LISTEN`` task per worker evicts the ids it hears about,
+    including ids whose load is still running. Notifications sent while that connection is
+    down are lost, so lookups bypass the cache until it is up and the cache is flushed on
+    every reconnect. ``ttl`` bounds what the feed does not cover, such as team renames or a
+    lagging read replica answering a reload.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_entries: int,
+        listen_dsn: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        connect: Callable[[str], Awaitable[Any]] = asyncpg.connect,
+    ) -> None:
+        self._entries: TTLCache[UUID, Event] = TTLCache(ttl=ttl, max_entries=max_entries, clock=clock)
+        self._listener = (
+            PgListener(listen_dsn, EVENT_CHANGES_CHANNEL, self.feed, on_reconnect=self.flush, connect=connect)
+            if listen_dsn
+            else None
+        )
+        self._task: asyncio.Task | None = None
+        self._loading: Counter[UUID] = Counter()
+        self._superseded: set[UUID] = set()
+        self.bypassed = 0
+        self.invalidations = 0
+        self.flushes = 0
+
+    @property
+    def listening(self) -> bool:
+        """Whether invalidations are being received; without a listener only ``ttl`` applies."""
+
+        return self._listener is None or self._listener.connected
+
+    async def get(self, event_id: UUID, load: EventLoad) -> Event | None:
+        """The cached event, or ``load(event_id)``, kept unless it was invalidated meanwhile."""
+
+        self._ensure_started()
+        if not self.listening:
+            self.bypassed += 1
+            return await load(event_id)
+        event = self._entries.get(event_id)
+        if event is not None:
+            return event
+
+        self._loading[event_id] += 1
+        try:
+            event = await load(event_id)
+        finally:
+            self._loading[event_id] -= 1
+            superseded = event_id in self._superseded
+            if not self._loading[event_id]:
+                del self._loading[event_id]
+                self._superseded.discard(event_id)
+        if event is not None and not superseded and self.listening:
+            self._entries.set(event_id, event)
+        return event
+
+    def feed(self, payload: str) -> None:
+        """Listener callback: evict the event named by one raw notification payload."""
+
+        try:
+            change = EventChange.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed event change notification: %.200s", payload)
+            return
+        self.invalidate(change.id)
+
+    def invalidate(self, event_id: UUID) -> None:
+        self.invalidations += 1
+        self._entries.invalidate(event_id)
+        if event_id in self._loading:
+            self._superseded.add(event_id)
+
+    def flush(self) -> None:
+        """Drop everything, e.g. after notifications may have been lost."""
+
+        self.flushes += 1
+        self._entries.clear()
+        self._superseded.update(self._loading)
+
+    def stats(self) -> EventCacheStats:
+        entries = self._entries.stats()
+        return EventCacheStats(
+            hits=entries.hits,
+            misses=entries.misses,
+            bypassed=self.bypassed,
+            invalidations=self.invalidations,
+            flushes=self.flushes,
+            size=entries.size,
+            listener_connected=bool(self._listener and self._listener.connected),
+            listener_reconnects=self._listener.reconnects if self._listener else 0,
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._task is None and self._listener is not None:
+            self._task = asyncio.create_task(self._listener.run(), name="event-cache-listen")
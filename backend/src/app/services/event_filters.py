@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from enum import Enum
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from app.models.event import EventStatus
 
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class Pagination:
@@ -28,15 +35,168 @@ class Pagination:
         return (self.page - 1) * self.limit()
 
 
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class CountStrategy(str, Enum):
+    """How ``list_events`` computes the total behind ``X-Total-Count``."""
+
+    exact = "exact"
+    estimated = "estimated"
+    cached = "cached"
+
+
+class ScheduleWindow(str, Enum):
+    """Which part of a team's schedule to list, relative to now."""
+
+    upcoming = "upcoming"
+    past = "past"
+    all = "all"
+
+
+class EventInclude(str, Enum):
+    """Related data an event listing can embed."""
+
+    participants = "participants"
+    sport = "sport"
+
+
+# Event columns a listing can be narrowed to with ``fields=``, in response order.
+EVENT_LIST_FIELDS = (
+    "id",
+    "sport_id",
+    "venue_id",
+    "title",
+    "description",
+    "starts_at",
+    "ends_at",
+    "status",
+    "ticket_url",
+)
+
+
+@dataclass(frozen=True)
+class EventFieldSet:
+    """Which columns and expansions an event listing returns; the default is the full ``EventRead``.
+
+    ``id`` is always returned. ``include`` lists the expansions: ``participants`` (with team
+    names) and ``sport`` (``sport_name``).
+    """
+
+    columns: tuple[str, ...] = EVENT_LIST_FIELDS
+    include: frozenset[EventInclude] = frozenset(EventInclude)
+
+    @classmethod
+    def parse(cls, fields: str | None, include: str | None) -> EventFieldSet:
+        """Build from comma-separated ``fields``/``include`` values; None keeps the default."""
+
+        columns = EVENT_LIST_FIELDS
+        if fields is not None:
+            requested = {name.strip() for name in fields.split(",") if name.strip()}
+            unknown = requested.difference(EVENT_LIST_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+            columns = tuple(name for name in EVENT_LIST_FIELDS if name in requested or name == "id")
+        expansions = frozenset(EventInclude)
+        if include is not None:
+            names = {name.strip() for name in include.split(",") if name.strip()}
+            try:
+                expansions = frozenset(EventInclude(name) for name in names)
+            except ValueError as exc:
+                raise ValueError(f"include accepts only: {', '.join(e.value for e in EventInclude)}.") from exc
+        return cls(columns=columns, include=expansions)
+
+    @property
+    def is_full(self) -> bool:
+        return self == EventFieldSet()
+
+    @property
+    def response_fields(self) -> frozenset[str]:
+        """``EventRead`` field names present in the response."""
+
+        fields = set(self.columns)
+        if EventInclude.participants in self.include:
+            fields.add("participants")
+        if EventInclude.sport in self.include:
+            fields.add("sport_name")
+        return frozenset(fields)
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the representation, e.g. for ETag variants."""
+
+        if self.is_full:
+            return "full"
+        return ",".join(sorted(self.response_fields))
+
+
+@dataclass(frozen=True)
+class EventCursor:
+    """Position in the ``(starts_at, id)`` ordering used for keyset pagination.
+
+    ``backward`` cursors fetch the page *before* the position instead of after it.
+    """
+
+    starts_at: datetime
+    id: UUID
+    backward: bool = False
+
+    def encode(self) -> str:
+        payload = {"s": self.starts_at.isoformat(), "i": str(self.id)}
+        if self.backward:
+            payload["b"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> EventCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            starts_at = datetime.fromisoformat(payload["s"])
+            event_id = UUID(payload["i"])
+            backward = bool(payload.get("b", 0))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Malformed cursor.") from exc
+        if starts_at.tzinfo is None:
+            raise ValueError("Malformed cursor.")
+        return cls(starts_at=starts_at, id=event_id, backward=backward)
+
+
+@dataclass(frozen=True)
+class EventScope:
+    """Where a written event shows up, for dropping cached listings that could contain it.
+
+    ``team_ids`` is None when the writer does not know the participants; status and search
+    text are never compared, so listings filtered on them are always treated as affected.
+    """
+
+    sport_id: UUID
+    venue_id: UUID | None
+    starts_at: datetime
+    id: UUID | None = None
+    team_ids: frozenset[UUID] | None = None
+
+
 @dataclass(frozen=True)
 class EventListParams:
     sport_id: UUID | None = None
     venue_id: UUID | None = None
+    # Events the team takes part in; resolved through event_participants(team_id, starts_at).
+    team_id: UUID | None = None
     status: EventStatus | None = None
     date_from: datetime | None = None
     date_to: datetime | None = None
     order_desc: bool = False
     pagination: Pagination = field(default_factory=Pagination)
+    cursor: EventCursor | None = None
+    # Full-text query; results are ranked by relevance first, then by starts_at.
+    q: str | None = None
+    # Multi-get: only these events (combined with the other filters).
+    ids: tuple[UUID, ...] | None = None
+    field_set: EventFieldSet = field(default_factory=EventFieldSet)
 
     @property
     def limit(self) -> int:
@@ -44,4 +204,51 @@ class EventListParams:
 
     @property
     def offset(self) -> int:
+        # Keyset pages seek from the cursor, so the page number is ignored.
+        if self.cursor:
+            return 0
         return self.pagination.offset()
+
+    def may_include(self, scope: EventScope) -> bool:
+        """Whether an event in ``scope`` could appear in (or vanish from) this listing."""
+
+        if self.sport_id and self.sport_id != scope.sport_id:
+            return False
+        if self.venue_id and self.venue_id != scope.venue_id:
+            return False
+        if self.team_id and scope.team_ids is not None and self.team_id not in scope.team_ids:
+            return False
+        if self.ids is not None and scope.id is not None and scope.id not in self.ids:
+            return False
+        if self.date_from and scope.starts_at < self.date_from:
+            return False
+        if self.date_to and scope.starts_at > self.date_to:
+            return False
+        return True
+
+    def filters_only(self) -> EventListParams:
+        """Same filters with ordering and paging reset; used as a key for per-filter caches."""
+
+        return replace(self, order_desc=False, pagination=Pagination(), cursor=None, field_set=EventFieldSet())
+
+
+@dataclass(frozen=True)
+class EventListingKey:
+    """Cache key of one rendered ``GET /events`` response."""
+
+    params: EventListParams
+    count: CountStrategy | None = None
+    variant: str = ""  # e.g. the read path, when it changes the bytes
+
+
+@dataclass(frozen=True)
+class EventPage(Generic[T]):
+    """One page of results plus the cursors needed to move around it.
+
+    ``items`` is usually a list of ``Event`` rows; the JSON read path stores the
+    already-encoded response body instead.
+    """
+
+    items: T
+    next_cursor: EventCursor | None = None
+    prev_cursor: EventCursor | None = None
@@ -1,15 +1,70 @@
 from __future__ import annotations
 
-from datetime import datetime
+import csv
+import io
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.event import Event, EventParticipantRole
-from app.repositories import EventRepository, TeamRepository
-from app.schemas.event import EventCreate
-from app.services.event_filters import EventListParams
-from app.services.exceptions import ValidationError
+from app.db.commit_hooks import after_commit
+from app.db.locks import try_advisory_xact_lock
+from app.models.event import Event, EventParticipantRole, EventStatus
+from app.models.team import Team
+from app.repositories import EventRepository, SportRepository, TeamRepository, VenueRepository
+from app.schemas.event import (
+    EventBulkError,
+    EventBulkResult,
+    EventCreate,
+    EventStatusError,
+    EventStatusResult,
+)
+from app.services.cache import ResponseCache, TTLCache, event_count_cache
+from app.services.event_filters import (
+    CountStrategy,
+    EventCursor,
+    EventListingKey,
+    EventListParams,
+    EventPage,
+    EventScope,
+    ExportFormat,
+    Pagination,
+    ScheduleWindow,
+)
+from app.services.exceptions import ConflictError, ValidationError
+
+EXPORT_CSV_COLUMNS = (
+    "id",
+    "sport_id",
+    "sport_name",
+    "venue_id",
+    "title",
+    "description",
+    "starts_at",
+    "ends_at",
+    "status",
+    "ticket_url",
+    "participants",
+)
+# Rows are buffered into chunks of roughly this size before being handed to the response.
+EXPORT_CHUNK_BYTES = 64 * 1024
+# Target status -> statuses an operator may move an event from. Cancelled events stay cancelled:
+# reinstating one could double-book the venue or teams it released.
+MANUAL_TRANSITIONS: dict[EventStatus, tuple[EventStatus, ...]] = {
+    EventStatus.LIVE: (EventStatus.SCHEDULED,),
+    EventStatus.FINISHED: (EventStatus.SCHEDULED, EventStatus.LIVE),
+    EventStatus.CANCELLED: (EventStatus.SCHEDULED, EventStatus.LIVE),
+}
+# Advisory lock held for the transaction of each scheduler batch, so one process advances at a time.
+STATUS_SCHEDULER_LOCK_KEY = 0x5354_4154
+
+
+@dataclass(frozen=True)
+class StatusAdvance:
+    went_live: int
+    finished: int
 
 
 class EventService:
@@ -17,9 +72,19 @@ class EventService:
         self,
         event_repository: EventRepository | None = None,
         team_repository: TeamRepository | None = None,
+        sport_repository: SportRepository | None = None,
+        venue_repository: VenueRepository | None = None,
+        count_cache: TTLCache | None = None,
+        list_cache: ResponseCache[EventListingKey, object] | None = None,
     ) -> None:
+        """``list_cache``, when given, loses the listings each committed write could change."""
+
         self._events: EventRepository = event_repository or EventRepository()
         self._teams: TeamRepository = team_repository or TeamRepository()
+        self._sports: SportRepository = sport_repository or SportRepository()
+        self._venues: VenueRepository = venue_repository or VenueRepository()
+        self._count_cache = count_cache if count_cache is not None else event_count_cache
+        self._list_cache = list_cache
 
     async def create_event(
         self,
@@ -28,9 +93,79 @@ class EventService:
     ) -> Event:
         self._validate_time_window(data.starts_at, data.ends_at)
         self._validate_participant_roles(data)
-        if data.participants:
-            await self._validate_participant_teams(session, data)
-        return await self._events.create(session, data=data)
+        teams = await self._validate_participant_teams(session, data) if data.participants else {}
+        if _is_active(data):
+            await self._events.lock_bookings(
+                session,
+                venue_ids=[data.venue_id] if data.venue_id else [],
+                team_ids=[p.team_id for p in data.participants],
+            )
+            if data.venue_id:
+                clash = await self._events.find_venue_conflict(
+                    session, venue_id=data.venue_id, starts_at=data.starts_at, ends_at=data.ends_at
+                )
+                if clash is not None:
+                    raise ConflictError(f"Venue is already booked during this time by event {clash}.")
+            if data.participants:
+                windows = [(i, p.team_id, data.starts_at, data.ends_at) for i, p in enumerate(data.participants)]
+                clashes = await self._events.find_team_conflicts(session, windows=windows)
+                if clashes:
+                    position, event_id = min(clashes.items())
+                    team = teams[data.participants[position].team_id]
+                    raise ConflictError(f"Team '{team.name}' already plays in event {event_id} during this time.")
+        event = await self._events.create(session, data=data)
+        self._invalidate_listings(session, [_scope(event.id, data)])
+        return event
+
+    async def bulk_create_events(
+        self,
+        session: AsyncSession,
+        rows: Sequence[tuple[int, EventCreate]],
+    ) -> EventBulkResult:
+        """Validate a whole batch in memory and insert the valid rows in one go.
+
+        ``rows`` pairs each payload with its position in the client's batch so errors
+        can point back at it. Reference checks take one query per table for the batch;
+        venue and team double-bookings take one probe each against the database and are
+        checked between rows of the same batch in memory.
+        """
+
+        team_ids = {p.team_id for _, data in rows for p in data.participants}
+        sport_ids = {data.sport_id for _, data in rows}
+        venue_ids = {data.venue_id for _, data in rows if data.venue_id}
+        teams = {t.id: t for t in await self._teams.get_by_ids(session, team_ids)}
+        known_sports = {s.id for s in await self._sports.get_by_ids(session, sport_ids)}
+        known_venues = {v.id for v in await self._venues.get_by_ids(session, venue_ids)}
+
+        valid: list[tuple[int, EventCreate]] = []
+        errors: list[EventBulkError] = []
+        for index, data in rows:
+            try:
+                self._validate_time_window(data.starts_at, data.ends_at)
+                self._validate_participant_roles(data)
+                if data.sport_id not in known_sports:
+                    raise ValidationError("Sport referenced by sport_id does not exist.")
+                if data.venue_id and data.venue_id not in known_venues:
+                    raise ValidationError("Venue referenced by venue_id does not exist.")
+                self._validate_unique_teams(data)
+                self._check_participant_teams(data, teams)
+            except ValidationError as exc:
+                errors.append(EventBulkError(index=index, detail=str(exc)))
+            else:
+                valid.append((index, data))
+
+        clashes = await self._find_booking_clashes(session, valid, teams)
+        if clashes:
+            errors.extend(EventBulkError(index=index, detail=detail) for index, detail in clashes.items())
+            errors.sort(key=lambda e: e.index)
+            valid = [(index, data) for index, data in valid if index not in clashes]
+
+        creates = [data for _, data in valid]
+        ids = await self._events.bulk_create(session, rows=creates) if creates else []
+        self._invalidate_listings(
+            session, [_scope(event_id, data) for event_id, data in zip(ids, creates, strict=True)]
+        )
+        return EventBulkResult(created=len(ids), ids=ids, errors=errors)
 
     async def list_events(
         self,
@@ -41,6 +176,123 @@ class EventService:
         params = params or EventListParams()
         return await self._events.list(session, params=params)
 
+    async def list_events_page(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams | None = None,
+    ) -> EventPage[list[Event]]:
+        params = params or EventListParams()
+        return await self._events.list_page(session, params=params)
+
+    async def list_team_events_page(
+        self,
+        session: AsyncSession,
+        team_id: UUID,
+        *,
+        window: ScheduleWindow = ScheduleWindow.upcoming,
+        pagination: Pagination | None = None,
+        cursor: EventCursor | None = None,
+        now: datetime | None = None,
+    ) -> EventPage[list[Event]] | None:
+        """A team's events: upcoming soonest first, past most recent first. None if the team does not exist."""
+
+        if not await self._teams.get_by_ids(session, {team_id}):
+            return None
+        now = now or datetime.now(UTC)
+        params = EventListParams(
+            team_id=team_id,
+            date_from=now if window is ScheduleWindow.upcoming else None,
+            date_to=now if window is ScheduleWindow.past else None,
+            order_desc=window is ScheduleWindow.past,
+            pagination=pagination or Pagination(),
+            cursor=cursor,
+        )
+        return await self._events.list_page(session, params=params)
+
+    async def list_events_json(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams | None = None,
+    ) -> EventPage[bytes]:
+        params = params or EventListParams()
+        return await self._events.list_json(session, params=params)
+
+    async def export_events(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams | None = None,
+        fmt: ExportFormat = ExportFormat.ndjson,
+    ) -> AsyncIterator[bytes]:
+        """Encode every event matching ``params`` (pagination ignored) as NDJSON or CSV chunks."""
+
+        params = params or EventListParams()
+        buffer = io.StringIO()
+        if fmt is ExportFormat.csv:
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(EXPORT_CSV_COLUMNS)
+            async for row in self._events.stream_rows(session, params=params):
+                writer.writerow(
+                    [
+                        row.id,
+                        row.sport_id,
+                        row.sport_name,
+                        row.venue_id or "",
+                        row.title,
+                        row.description or "",
+                        row.starts_at.isoformat(),
+                        row.ends_at.isoformat(),
+                        row.status.value,
+                        row.ticket_url or "",
+                        row.participants or "",
+                    ]
+                )
+                if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                    yield _drain(buffer)
+        else:
+            async for doc in self._events.stream_json(session, params=params):
+                buffer.write(doc)
+                buffer.write("\n")
+                if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                    yield _drain(buffer)
+        if buffer.tell():
+            yield _drain(buffer)
+
+    async def list_event_versions(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams | None = None,
+        count: CountStrategy | None = None,
+    ) -> tuple[list[tuple[UUID, datetime]], int | None]:
+        """``(id, updated_at)`` of the page rows, plus the filtered total when ``count`` is given."""
+
+        params = params or EventListParams()
+        if count is CountStrategy.exact:
+            return await self._events.list_versions_with_total(session, params=params)
+        versions = await self._events.list_versions(session, params=params)
+        total = await self.count_events(session, params=params, strategy=count) if count else None
+        return versions, total
+
+    async def count_events(
+        self,
+        session: AsyncSession,
+        *,
+        params: EventListParams | None = None,
+        strategy: CountStrategy = CountStrategy.exact,
+    ) -> int:
+        params = params or EventListParams()
+        if strategy is CountStrategy.estimated:
+            return await self._events.estimate_count(session, params=params)
+        if strategy is CountStrategy.cached:
+            return await self._count_cache.get_or_load(
+                params.filters_only(),
+                lambda: self._events.count(session, params=params),
+            )
+        return await self._events.count(session, params=params)
+
     async def get_event(
         self,
         session: AsyncSession,
@@ -48,6 +300,152 @@ class EventService:
     ) -> Event | None:
         return await self._events.get(session, event_id)
 
+    async def get_events(
+        self,
+        session: AsyncSession,
+        ids: Sequence[UUID],
+    ) -> dict[UUID, Event]:
+        return {event.id: event for event in await self._events.get_many(session, ids)}
+
+    async def get_event_documents(
+        self,
+        session: AsyncSession,
+        ids: Sequence[UUID],
+    ) -> dict[UUID, str]:
+        return await self._events.get_documents(session, ids)
+
+    async def transition_events(
+        self,
+        session: AsyncSession,
+        ids: Sequence[UUID],
+        status: EventStatus,
+    ) -> EventStatusResult:
+        """Manual override: move every event in ``ids`` that may go to ``status``; report the rest."""
+
+        sources = MANUAL_TRANSITIONS.get(status)
+        if not sources:
+            raise ValidationError(f"Events cannot be moved to '{status.value}' manually.")
+        requested = list(dict.fromkeys(ids))
+        scopes = await self._events.transition_status(session, to=status, sources=sources, ids=requested)
+        self._invalidate_listings(session, scopes)
+        moved = {scope.id for scope in scopes}
+        skipped = [event_id for event_id in requested if event_id not in moved]
+        current = await self._events.get_statuses(session, skipped)
+        return EventStatusResult(
+            updated=[event_id for event_id in requested if event_id in moved],
+            errors=[
+                EventStatusError(id=event_id, detail=_describe_refused_transition(current.get(event_id), status))
+                for event_id in skipped
+            ],
+        )
+
+    async def advance_statuses(
+        self,
+        session: AsyncSession,
+        *,
+        now: datetime,
+        batch_size: int,
+    ) -> StatusAdvance | None:
+        """One scheduler batch: finish events that have ended and start those under way.
+
+        Returns None without touching anything when another process holds the scheduler lock.
+        The lock lasts until the caller's transaction ends.
+        """
+
+        if not await try_advisory_xact_lock(session, STATUS_SCHEDULER_LOCK_KEY):
+            return None
+        finished = await self._events.transition_status(
+            session,
+            to=EventStatus.FINISHED,
+            sources=(EventStatus.SCHEDULED, EventStatus.LIVE),
+            ends_by=now,
+            limit=batch_size,
+        )
+        went_live = await self._events.transition_status(
+            session,
+            to=EventStatus.LIVE,
+            sources=(EventStatus.SCHEDULED,),
+            starts_by=now,
+            ends_after=now,
+            limit=batch_size,
+        )
+        self._invalidate_listings(session, [*finished, *went_live])
+        return StatusAdvance(went_live=len(went_live), finished=len(finished))
+
+    def _invalidate_listings(self, session: AsyncSession, scopes: Sequence[EventScope]) -> None:
+        """Drop cached listings that could show any of ``scopes`` once the transaction commits."""
+
+        cache = self._list_cache
+        if cache is None or not scopes:
+            return
+        after_commit(
+            session,
+            lambda: cache.invalidate_where(lambda key: any(key.params.may_include(scope) for scope in scopes)),
+        )
+
+    async def _find_booking_clashes(
+        self,
+        session: AsyncSession,
+        rows: Sequence[tuple[int, EventCreate]],
+        teams: Mapping[UUID, Team],
+    ) -> dict[int, str]:
+        """Batch positions that would double-book a venue or a team, mapped to the error detail."""
+
+        active = [(index, data) for index, data in rows if _is_active(data)]
+        venue_windows = [
+            (index, data.venue_id, data.starts_at, data.ends_at) for index, data in active if data.venue_id
+        ]
+        # Participant windows are keyed by their position in this list, not by batch index.
+        team_windows = [(index, p.team_id, data) for index, data in active for p in data.participants]
+        clashes: dict[int, str] = {}
+        await self._events.lock_bookings(
+            session,
+            venue_ids={venue_id for _, venue_id, *_ in venue_windows},
+            team_ids={team_id for _, team_id, _ in team_windows},
+        )
+        if venue_windows:
+            found = await self._events.find_venue_conflicts(session, windows=venue_windows)
+            for index, event_id in found.items():
+                clashes[index] = f"Venue is already booked during this time by event {event_id}."
+        if team_windows:
+            found = await self._events.find_team_conflicts(
+                session,
+                windows=[
+                    (key, team_id, data.starts_at, data.ends_at) for key, (_, team_id, data) in enumerate(team_windows)
+                ],
+            )
+            for key, event_id in sorted(found.items()):
+                index, team_id, _ = team_windows[key]
+                clashes.setdefault(
+                    index, f"Team '{teams[team_id].name}' already plays in event {event_id} during this time."
+                )
+
+        # Rows within the batch: walk them by start time, keeping for every venue and team the
+        # furthest end among accepted rows; a row starting before that end overlaps one of them.
+        furthest: dict[tuple[str, UUID], tuple[int, datetime]] = {}
+        for index, data in sorted(active, key=lambda item: (item[1].starts_at, item[0])):
+            if index in clashes:
+                continue
+            resources = [("team", p.team_id) for p in data.participants]
+            if data.venue_id:
+                resources.insert(0, ("venue", data.venue_id))
+            blocked = next(
+                (
+                    (kind, furthest[(kind, rid)][0])
+                    for kind, rid in resources
+                    if (kind, rid) in furthest and data.starts_at < furthest[(kind, rid)][1]
+                ),
+                None,
+            )
+            if blocked:
+                kind, other = blocked
+                clashes[index] = f"{kind.capitalize()} is double-booked by item {other} of this batch."
+                continue
+            for resource in resources:
+                if resource not in furthest or data.ends_at > furthest[resource][1]:
+                    furthest[resource] = (index, data.ends_at)
+        return clashes
+
     @staticmethod
     def _validate_time_window(starts_at: datetime, ends_at: datetime) -> None:
         if starts_at.tzinfo is None or ends_at.tzinfo is None:
@@ -79,18 +477,56 @@ class EventService:
         self,
         session: AsyncSession,
         data: EventCreate,
-    ) -> None:
+    ) -> dict[UUID, Team]:
+        self._validate_unique_teams(data)
+        teams = {t.id: t for t in await self._teams.get_by_ids(session, {p.team_id for p in data.participants})}
+        self._check_participant_teams(data, teams)
+        return teams
+
+    @staticmethod
+    def _validate_unique_teams(data: EventCreate) -> None:
         participant_ids = [p.team_id for p in data.participants]
-        unique_ids = set(participant_ids)
-        if len(unique_ids) != len(participant_ids):
+        if len(set(participant_ids)) != len(participant_ids):
             raise ValidationError("Duplicate participant teams are not allowed.")
 
-        teams = await self._teams.get_by_ids(session, unique_ids)
-        if len(teams) != len(unique_ids):
+    @staticmethod
+    def _check_participant_teams(data: EventCreate, teams: Mapping[UUID, Team]) -> None:
+        unique_ids = {p.team_id for p in data.participants}
+        if not unique_ids <= teams.keys():
             raise ValidationError("One or more participant teams do not exist.")
 
-        by_id = {t.id: t for t in teams}
         for team_id in unique_ids:
-            team = by_id.get(team_id)
-            if team and team.sport_id != data.sport_id:
+            team = teams[team_id]
+            if team.sport_id != data.sport_id:
                 raise ValidationError(f"Team '{team.name}' does not belong to the event sport.")
+
+
+def _is_active(data: EventCreate) -> bool:
+    """Cancelled events never hold their venue or teams."""
+
+    return data.status != EventStatus.CANCELLED
+
+
+def _scope(event_id: UUID, data: EventCreate) -> EventScope:
+    return EventScope(
+        data.sport_id,
+        data.venue_id,
+        data.starts_at,
+        id=event_id,
+        team_ids=frozenset(p.team_id for p in data.participants),
+    )
+
+
+def _describe_refused_transition(current: EventStatus | None, target: EventStatus) -> str:
+    if current is None:
+        return "Event not found."
+    if current == target:
+        return f"Event is already {target.value}."
+    return f"Event cannot move from {current.value} to {target.value}."
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
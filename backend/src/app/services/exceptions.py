@@ -4,3 +4,11 @@ class ServiceError(Exception):
 
 class ValidationError(ServiceError):
     """Validation error."""
+
+
+class ConflictError(ServiceError):
+    """The request clashes with existing data, e.g. a venue that is already booked."""
+
+
+class CapacityError(ServiceError):
+    """The service is at a configured limit and cannot take more work right now."""
@@ -0,0 +1,230 @@
+"""In-memory fan-out of event changes to live stream subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.db.notify import EVENT_CHANGES_CHANNEL, EventChange, PgListener
+from app.models.event import EventStatus
+from app.services.exceptions import CapacityError
+
+logger = logging.getLogger(__name__)
+
+DocumentLoader = Callable[[Sequence[UUID]], Awaitable[dict[UUID, str]]]
+
+
+@dataclass(frozen=True)
+class EventStreamFilter:
+    sport_id: UUID | None = None
+    venue_id: UUID | None = None
+    status: EventStatus | None = None
+
+    def matches(self, change: EventChange) -> bool:
+        return (
+            (self.sport_id is None or change.sport_id == self.sport_id)
+            and (self.venue_id is None or change.venue_id == self.venue_id)
+            and (self.status is None or change.status == self.status.value)
+        )
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    change: EventChange
+    frame: bytes  # complete SSE frame, encoded once and shared by every subscriber
+
+
+@dataclass(frozen=True)
+class BroadcasterStats:
+    subscribers: int
+    received: int
+    published: int
+    delivered: int
+    resets: int
+    listener_connected: bool
+    listener_reconnects: int
+
+
+class SubscriptionResetError(Exception):
+    """The subscriber missed messages (it fell behind, or the feed dropped) and must refetch."""
+
+
+class Subscription:
+    """One subscriber's bounded queue of pending messages."""
+
+    def __init__(self, stream_filter: EventStreamFilter, *, max_pending: int) -> None:
+        self.filter = stream_filter
+        self.reset = False
+        self._max_pending = max_pending
+        self._pending: deque[StreamMessage] = deque()
+        self._ready = asyncio.Event()
+
+    def offer(self, message: StreamMessage) -> bool:
+        """Queue ``message``; a subscriber already ``max_pending`` behind is reset instead."""
+
+        if len(self._pending) >= self._max_pending:
+            self.force_reset()
+            return False
+        self._pending.append(message)
+        self._ready.set()
+        return True
+
+    def force_reset(self) -> None:
+        self.reset = True
+        self._pending.clear()
+        self._ready.set()
+
+    async def next(self, timeout: float) -> StreamMessage | None:
+        """The next message, or None when nothing arrived within ``timeout`` seconds."""
+
+        if not self._pending and not self.reset:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return None
+        if self.reset:
+            raise SubscriptionResetError
+        return self._pending.popleft()
+
+
+class EventBroadcaster:
+    """Per-worker hub between one ``LISTEN`` connection and any number of stream subscribers.
+
+    Notifications land in an inbox; a pump task drains it in batches, renders the changed
+    events with one query per batch (skipped entirely while nobody is subscribed) and hands
+    the encoded frame to every subscriber whose filter matches. Subscribers that fall
+    ``max_pending`` messages behind are reset rather than buffered without bound.
+    """
+
+    def __init__(
+        self,
+        load_documents: DocumentLoader,
+        *,
+        listen_dsn: str | None = None,
+        max_subscribers: int = 10_000,
+        max_pending: int = 256,
+        batch_size: int = 500,
+    ) -> None:
+        self._load_documents = load_documents
+        self._listener = (
+            PgListener(listen_dsn, EVENT_CHANGES_CHANNEL, self.feed, on_reconnect=self.reset_all)
+            if listen_dsn
+            else None
+        )
+        self._max_subscribers = max_subscribers
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._subscribers: set[Subscription] = set()
+        self._inbox: deque[EventChange] = deque()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._sequence = itertools.count(1)
+        self.received = 0
+        self.published = 0
+        self.delivered = 0
+        self.resets = 0
+
+    def subscribe(self, stream_filter: EventStreamFilter) -> Subscription:
+        if len(self._subscribers) >= self._max_subscribers:
+            raise CapacityError("Too many live subscribers on this worker; retry later.")
+        self._ensure_started()
+        subscription = Subscription(stream_filter, max_pending=self._max_pending)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def feed(self, payload: str) -> None:
+        """Listener callback: queue one raw notification payload."""
+
+        try:
+            change = EventChange.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed event change notification: %.200s", payload)
+            return
+        self.received += 1
+        self._inbox.append(change)
+        self._wakeup.set()
+
+    def reset_all(self) -> None:
+        """Tell every subscriber to resynchronise, e.g. after notifications may have been lost."""
+
+        for subscription in self._subscribers:
+            subscription.force_reset()
+        self.resets += len(self._subscribers)
+        self._subscribers.clear()
+
+    def publish(self, message: StreamMessage) -> None:
+        self.published += 1
+        lagging = []
+        for subscription in self._subscribers:
+            if not subscription.filter.matches(message.change):
+                continue
+            if subscription.offer(message):
+                self.delivered += 1
+            else:
+                lagging.append(subscription)
+        for subscription in lagging:
+            self._subscribers.discard(subscription)
+        self.resets += len(lagging)
+
+    async def drain(self) -> None:
+        """Publish everything currently in the inbox, ``batch_size`` changes per query."""
+
+        while self._inbox:
+            batch = [self._inbox.popleft() for _ in range(min(len(self._inbox), self._batch_size))]
+            if not self._subscribers:
+                continue
+            documents = await self._load_documents(list(dict.fromkeys(change.id for change in batch)))
+            for change in batch:
+                document = documents.get(change.id)
+                if document is not None:
+                    self.publish(StreamMessage(change, _frame(next(self._sequence), change, document)))
+
+    def stats(self) -> BroadcasterStats:
+        return BroadcasterStats(
+            subscribers=len(self._subscribers),
+            received=self.received,
+            published=self.published,
+            delivered=self.delivered,
+            resets=self.resets,
+            listener_connected=bool(self._listener and self._listener.connected),
+            listener_reconnects=self._listener.reconnects if self._listener else 0,
+        )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self.reset_all()
+
+    def _ensure_started(self) -> None:
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._pump(), name="event-broadcaster-pump"))
+        if self._listener is not None:
+            self._tasks.append(asyncio.create_task(self._listener.run(), name="event-broadcaster-listen"))
+
+    async def _pump(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except Exception:
+                # Subscribers would silently miss whatever was in the failed batch.
+                logger.exception("Failed to publish event changes; resetting live subscribers")
+                self._inbox.clear()
+                self.reset_all()
+
+
+def _frame(sequence: int, change: EventChange, document: str) -> bytes:
+    return f"id: {sequence}\nevent: {change.kind.value}\ndata: {document}\n\n".encode()
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.sport import SportRepository
+from app.schemas.sport import SportRead
+from app.services.cache import TTLCache, reference_cache
+
+SPORTS_CACHE_KEY = "sports"
 
 
 class SportService:
-    def __init__(self, sport_repository: SportRepository | None = None) -> None:
+    def __init__(
+        self,
+        sport_repository: SportRepository | None = None,
+        cache: TTLCache | None = None,
+    ) -> None:
         self._sports = sport_repository or SportRepository()
+        self._cache = cache if cache is not None else reference_cache
+
+    async def list_sports(
+        self, open_session: Callable[[], AbstractAsyncContextManager[AsyncSession]]
+    ) -> list[SportRead]:
+        """All sports; a session is only opened when the cache has to be filled."""
+
+        async def load() -> tuple[SportRead, ...]:
+            async with open_session() as session:
+                return tuple(SportRead.model_validate(s) for s in await self._sports.list_all(session))
 
-    async def list_sports(self, session: AsyncSession):
-        return await self._sports.list_all(session)
+        return list(await self._cache.get_or_load(SPORTS_CACHE_KEY, load))
@@ -0,0 +1,87 @@
+"""Background worker that moves events to ``live`` and ``finished`` as their times pass."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.events import EventService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StatusTick:
+    went_live: int = 0
+    finished: int = 0
+    batches: int = 0
+    skipped: bool = False  # another process held the scheduler lock
+
+
+class StatusScheduler:
+    """Runs ``EventService.advance_statuses`` every ``interval`` seconds.
+
+    Each batch is its own short transaction, so row locks and the advisory lock are held
+    only for one ``UPDATE`` of at most ``batch_size`` rows per transition; a tick keeps
+    going until a batch comes back short. Any number of workers may run a scheduler: the
+    lock makes all but one skip each tick.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        interval: float = 30.0,
+        batch_size: int = 1000,
+        service: EventService | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval = interval
+        self._batch_size = batch_size
+        self._service = service or EventService()
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+
+    async def run_once(self) -> StatusTick:
+        went_live = finished = batches = 0
+        while True:
+            async with self._session_factory() as session, session.begin():
+                advance = await self._service.advance_statuses(session, now=self._clock(), batch_size=self._batch_size)
+            if advance is None:
+                return StatusTick(went_live, finished, batches, skipped=True)
+            batches += 1
+            went_live += advance.went_live
+            finished += advance.finished
+            if max(advance.went_live, advance.finished) < self._batch_size:
+                return StatusTick(went_live, finished, batches)
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                tick = await self.run_once()
+            except Exception:
+                logger.exception("Status scheduler tick failed")
+            else:
+                if tick.went_live or tick.finished:
+                    logger.info("Status scheduler: %d live, %d finished", tick.went_live, tick.finished)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run_forever(), name="status-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
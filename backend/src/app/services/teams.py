@@ -1,20 +1,65 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.team import TeamRepository
+from app.schemas.team import TeamRead
+from app.services.cache import TTLCache, reference_cache
+
+TEAMS_CACHE_KEY = "teams"
+
+
+@dataclass(frozen=True)
+class TeamIndex:
+    """All teams ordered by name, plus lookups by id and by sport."""
+
+    teams: tuple[TeamRead, ...]
+    by_id: dict[UUID, TeamRead] = field(default_factory=dict)
+    by_sport: dict[UUID, tuple[TeamRead, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, teams: tuple[TeamRead, ...]) -> TeamIndex:
+        by_sport: dict[UUID, list[TeamRead]] = {}
+        for team in teams:
+            by_sport.setdefault(team.sport_id, []).append(team)
+        return cls(
+            teams=teams,
+            by_id={team.id: team for team in teams},
+            by_sport={sport_id: tuple(items) for sport_id, items in by_sport.items()},
+        )
 
 
 class TeamService:
-    def __init__(self, team_repository: TeamRepository | None = None) -> None:
+    def __init__(
+        self,
+        team_repository: TeamRepository | None = None,
+        cache: TTLCache | None = None,
+    ) -> None:
         self._teams = team_repository or TeamRepository()
+        self._cache = cache if cache is not None else reference_cache
 
     async def list_teams(
         self,
-        session: AsyncSession,
+        open_session: Callable[[], AbstractAsyncContextManager[AsyncSession]],
         *,
         sport_id: UUID | None = None,
-    ):
-        return await self._teams.list(session, sport_id=sport_id)
+    ) -> list[TeamRead]:
+        """Teams by name, optionally of one sport; a session is only opened when the cache has to be filled."""
+
+        index = await self._index(open_session)
+        if sport_id:
+            return list(index.by_sport.get(sport_id, ()))
+        return list(index.teams)
+
+    async def _index(self, open_session: Callable[[], AbstractAsyncContextManager[AsyncSession]]) -> TeamIndex:
+        async def load() -> TeamIndex:
+            async with open_session() as session:
+                teams = await self._teams.list(session)
+            return TeamIndex.build(tuple(TeamRead.model_validate(t) for t in teams))
+
+        return await self._cache.get_or_load(TEAMS_CACHE_KEY, load)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.event import EventRepository
+from app.repositories.venue import VenueRepository
+from app.schemas.venue import BusyInterval, TimeInterval, VenueAvailability, VenueRead
+from app.services.cache import TTLCache, reference_cache
+from app.services.exceptions import ValidationError
+
+VENUES_CACHE_KEY = "venues"
+MAX_AVAILABILITY_WINDOW = timedelta(days=92)
+
+
+class VenueService:
+    def __init__(
+        self,
+        venue_repository: VenueRepository | None = None,
+        event_repository: EventRepository | None = None,
+        cache: TTLCache | None = None,
+    ) -> None:
+        self._venues = venue_repository or VenueRepository()
+        self._events = event_repository or EventRepository()
+        self._cache = cache if cache is not None else reference_cache
+
+    async def list_venues(
+        self, open_session: Callable[[], AbstractAsyncContextManager[AsyncSession]]
+    ) -> list[VenueRead]:
+        """All venues; a session is only opened when the cache has to be filled."""
+
+        async def load() -> tuple[VenueRead, ...]:
+            async with open_session() as session:
+                return tuple(VenueRead.model_validate(v) for v in await self._venues.list_all(session))
+
+        return list(await self._cache.get_or_load(VENUES_CACHE_KEY, load))
+
+    async def get_availability(
+        self,
+        session: AsyncSession,
+        venue_id: UUID,
+        *,
+        date_from: datetime,
+        date_to: datetime,
+    ) -> VenueAvailability | None:
+        """Busy and free intervals of a venue within ``[date_from, date_to)``; None if it does not exist."""
+
+        if date_from.tzinfo is None or date_to.tzinfo is None:
+            raise ValidationError("Availability bounds must be timezone-aware.")
+        if date_from >= date_to:
+            raise ValidationError("date_from must be before date_to.")
+        if date_to - date_from > MAX_AVAILABILITY_WINDOW:
+            raise ValidationError(f"Availability window cannot exceed {MAX_AVAILABILITY_WINDOW.days} days.")
+        if await self._venues.get(session, venue_id) is None:
+            return None
+
+        bookings = await self._events.list_venue_bookings(
+            session, venue_id=venue_id, starts_at=date_from, ends_at=date_to
+        )
+        busy = merge_bookings(((b.id, b.starts_at, b.ends_at) for b in bookings), date_from, date_to)
+        return VenueAvailability(
+            venue_id=venue_id,
+            date_from=date_from,
+            date_to=date_to,
+            busy=busy,
+            free=free_gaps(busy, date_from, date_to),
+        )
+
+
+def merge_bookings(
+    bookings: Iterable[tuple[UUID, datetime, datetime]],
+    date_from: datetime,
+    date_to: datetime,
+) -> list[BusyInterval]:
+    """Clip bookings (sorted by start) to the window and merge overlapping or touching ones."""
+
+    merged: list[BusyInterval] = []
+    for event_id, starts_at, ends_at in bookings:
+        starts_at, ends_at = max(starts_at, date_from), min(ends_at, date_to)
+        if starts_at >= ends_at:
+            continue
+        if merged and starts_at <= merged[-1].ends_at:
+            last = merged[-1]
+            last.ends_at = max(last.ends_at, ends_at)
+            last.event_ids.append(event_id)
+        else:
+            merged.append(BusyInterval(starts_at=starts_at, ends_at=ends_at, event_ids=[event_id]))
+    return merged
+
+
+def free_gaps(busy: Iterable[TimeInterval], date_from: datetime, date_to: datetime) -> list[TimeInterval]:
+    """Complement of merged ``busy`` intervals within ``[date_from, date_to)``."""
+
+    free: list[TimeInterval] = []
+    cursor = date_from
+    for interval in busy:
+        if interval.starts_at > cursor:
+            free.append(TimeInterval(starts_at=cursor, ends_at=interval.starts_at))
+        cursor = max(cursor, interval.ends_at)
+    if cursor < date_to:
+        free.append(TimeInterval(starts_at=cursor, ends_at=date_to))
+    return free
@@ -1,9 +1,13 @@
+import os
 from collections.abc import AsyncIterator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.main import app
+# Fail on any relationship access a query did not eager-load (must be set before models import).
+os.environ.setdefault("DB_STRICT_LOADING", "true")
+
+from app.main import app  # noqa: E402
 
 
 @pytest.fixture()
@@ -4,15 +4,17 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import pytest
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.seeds import seed_reference_data
 from app.models import Sport, Team
 from app.models.event import EventParticipantRole, EventStatus
-from app.schemas import EventCreate, EventParticipantCreate
+from app.repositories import EventRepository
+from app.schemas import EventCreate, EventParticipantCreate, EventRead
 from app.services import EventService
-from app.services.event_filters import EventListParams
+from app.services.event_filters import EventListParams, Pagination
 
 
 @pytest.mark.integration
@@ -48,6 +50,47 @@ async def test_create_and_list_events(async_db_session: AsyncSession) -> None:
     assert any(event.id == created.id for event in events)
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_json_list_path_matches_orm_path(async_db_session: AsyncSession) -> None:
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+
+    service = EventService()
+    now = datetime.now(tz=UTC)
+    for idx in range(3):
+        await service.create_event(
+            async_db_session,
+            EventCreate(
+                sport_id=sport.id,
+                title=f"Round {idx}",
+                starts_at=now + timedelta(days=idx),
+                ends_at=now + timedelta(days=idx, hours=2),
+                participants=[
+                    EventParticipantCreate(team_id=teams[0].id, role=EventParticipantRole.HOME),
+                    EventParticipantCreate(team_id=teams[1].id, role=EventParticipantRole.AWAY),
+                ],
+            ),
+        )
+
+    repository = EventRepository()
+    for order_desc in (False, True):
+        params = EventListParams(sport_id=sport.id, order_desc=order_desc, pagination=Pagination(page_size=2))
+        orm_page = await repository.list_page(async_db_session, params=params)
+        json_page = await repository.list_json(async_db_session, params=params)
+
+        from_json = TypeAdapter(list[EventRead]).validate_json(json_page.items)
+        from_orm = [EventRead.model_validate(e) for e in orm_page.items]
+        for item in (*from_json, *from_orm):
+            item.participants.sort(key=lambda p: p.role)
+        assert from_json == from_orm
+        assert from_json[0].sport_name == sport.name
+        assert all(p.team_name for p in from_json[0].participants)
+        assert json_page.next_cursor == orm_page.next_cursor
+        assert json_page.prev_cursor == orm_page.prev_cursor
+
+
 async def _get_first_sport(session: AsyncSession) -> Sport:
     result = await session.scalars(select(Sport).order_by(Sport.name))
     sport = result.first()
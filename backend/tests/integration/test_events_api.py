@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
+import json
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -8,11 +13,23 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
+from app.api.deps import (
+    get_db_session,
+    get_db_session_factory,
+    get_event_cache,
+    get_event_list_cache,
+    get_event_loader,
+    get_read_db_session,
+    get_read_db_session_factory,
+    watch_reference_changes,
+)
+from app.db.query_metrics import count_queries
 from app.db.seeds import seed_reference_data
 from app.main import app
-from app.models import Sport, Team
-from app.models.event import EventParticipantRole, EventStatus
+from app.models import Sport, Team, Venue
+from app.models.event import Event, EventParticipantRole, EventStatus
+from app.services import EventService
+from app.services.batching import BatchLoader
 
 
 @pytest.fixture()
@@ -21,12 +38,29 @@ async def api_client(async_db_session: AsyncSession) -> AsyncClient:
         yield async_db_session
 
     app.dependency_overrides[get_db_session] = _override_session
+    app.dependency_overrides[get_read_db_session] = _override_session
+    # Streaming endpoints open their own sessions; hand them the test session so they see its rows.
+    app.dependency_overrides[get_db_session_factory] = lambda: lambda: nullcontext(async_db_session)
+    app.dependency_overrides[get_read_db_session_factory] = lambda: lambda: nullcontext(async_db_session)
+    loader = BatchLoader(lambda ids: EventService().get_events(async_db_session, ids))
+    app.dependency_overrides[get_event_loader] = lambda: loader
+    # Cached listings and events would outlive the rolled-back test transaction.
+    app.dependency_overrides[get_event_list_cache] = lambda: None
+    app.dependency_overrides[get_event_cache] = lambda: None
+    app.dependency_overrides[watch_reference_changes] = lambda: None
     transport = ASGITransport(app=app)
     try:
         async with AsyncClient(transport=transport, base_url="http://test") as client:
             yield client
     finally:
         app.dependency_overrides.pop(get_db_session, None)
+        app.dependency_overrides.pop(get_db_session_factory, None)
+        app.dependency_overrides.pop(get_read_db_session, None)
+        app.dependency_overrides.pop(get_read_db_session_factory, None)
+        app.dependency_overrides.pop(get_event_loader, None)
+        app.dependency_overrides.pop(get_event_list_cache, None)
+        app.dependency_overrides.pop(get_event_cache, None)
+        app.dependency_overrides.pop(watch_reference_changes, None)
 
 
 @pytest.mark.integration
@@ -162,6 +196,517 @@ async def test_list_events_supports_filters_and_pagination(async_db_session: Asy
     assert len(date_filtered) == 2
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_list_events_keyset_cursors_walk_both_directions(
+    async_db_session: AsyncSession, api_client: AsyncClient, order: str
+):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+
+    base = datetime.now(tz=UTC)
+    for idx in range(5):
+        start = base + timedelta(hours=idx)
+        payload = {
+            "sport_id": str(sport.id),
+            "title": f"Keyset {idx}",
+            "starts_at": start.isoformat(),
+            "ends_at": (start + timedelta(hours=1)).isoformat(),
+        }
+        (await api_client.post("/api/v1/events", json=payload)).raise_for_status()
+
+    query = {"sport_id": str(sport.id), "order": order, "page_size": 2}
+    seen: list[str] = []
+    resp = await api_client.get("/api/v1/events", params=query)
+    resp.raise_for_status()
+    assert "X-Prev-Cursor" not in resp.headers
+    pages = [resp]
+    while "X-Next-Cursor" in resp.headers:
+        resp = await api_client.get("/api/v1/events", params={**query, "cursor": resp.headers["X-Next-Cursor"]})
+        resp.raise_for_status()
+        pages.append(resp)
+    for page in pages:
+        seen.extend(item["title"] for item in page.json())
+
+    expected = [f"Keyset {idx}" for idx in range(5)]
+    assert seen == (expected if order == "asc" else expected[::-1])
+
+    back = await api_client.get("/api/v1/events", params={**query, "cursor": pages[-1].headers["X-Prev-Cursor"]})
+    back.raise_for_status()
+    assert back.json() == pages[-2].json()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_events_rejects_malformed_cursor(async_db_session: AsyncSession, api_client: AsyncClient):
+    resp = await api_client.get("/api/v1/events", params={"cursor": "garbage"})
+    assert resp.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_event_reads_honour_conditional_requests(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    start = datetime.now(tz=UTC) + timedelta(days=1)
+    create = await api_client.post(
+        "/api/v1/events",
+        json={
+            "sport_id": str(sport.id),
+            "title": "Conditional",
+            "starts_at": start.isoformat(),
+            "ends_at": (start + timedelta(hours=2)).isoformat(),
+        },
+    )
+    create.raise_for_status()
+    event_id = create.json()["id"]
+
+    for url, params in ((f"/api/v1/events/{event_id}", {}), ("/api/v1/events", {"sport_id": str(sport.id)})):
+        first = await api_client.get(url, params=params)
+        first.raise_for_status()
+        etag = first.headers["ETag"]
+
+        cached = await api_client.get(url, params=params, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert not cached.content
+
+        changed = await api_client.get(url, params=params, headers={"If-None-Match": '"stale"'})
+        assert changed.status_code == 200
+
+    single = await api_client.get(f"/api/v1/events/{event_id}")
+    by_date = await api_client.get(
+        f"/api/v1/events/{event_id}", headers={"If-Modified-Since": single.headers["Last-Modified"]}
+    )
+    assert by_date.status_code == 304
+
+    # A listing's newest updated_at can stay put while its rows change, so it only has an ETag.
+    listing = await api_client.get("/api/v1/events", params={"sport_id": str(sport.id)})
+    assert "Last-Modified" not in listing.headers
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_create_accepts_json_array_and_ndjson(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    base = datetime.now(tz=UTC) + timedelta(days=3)
+
+    def _payload(idx: int, hours: int = 2) -> dict:
+        start = base + timedelta(days=idx)
+        return {
+            "sport_id": str(sport.id),
+            "title": f"Bulk {idx}",
+            "starts_at": start.isoformat(),
+            "ends_at": (start + timedelta(hours=hours)).isoformat(),
+            "participants": [
+                {"team_id": str(teams[0].id), "role": EventParticipantRole.HOME.value},
+                {"team_id": str(teams[1].id), "role": EventParticipantRole.AWAY.value},
+            ],
+        }
+
+    resp = await api_client.post("/api/v1/events/bulk", json=[_payload(0), _payload(1, hours=0), {"title": "x"}])
+    resp.raise_for_status()
+    body = resp.json()
+    assert body["created"] == 1
+    assert [err["index"] for err in body["errors"]] == [1, 2]
+
+    ndjson = "\n".join(json.dumps(_payload(idx)) for idx in range(2, 5))
+    resp = await api_client.post(
+        "/api/v1/events/bulk",
+        content=ndjson.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    resp.raise_for_status()
+    assert resp.json()["created"] == 3
+
+    created = await api_client.get(f"/api/v1/events/{resp.json()['ids'][0]}")
+    created.raise_for_status()
+    assert {p["team_name"] for p in created.json()["participants"]} == {teams[0].name, teams[1].name}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_export_streams_all_matching_events(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    base = datetime.now(tz=UTC)
+    payloads = [
+        {
+            "sport_id": str(sport.id),
+            "title": f"Export {idx}",
+            "starts_at": (base + timedelta(hours=idx)).isoformat(),
+            "ends_at": (base + timedelta(hours=idx + 1)).isoformat(),
+            "participants": [
+                {"team_id": str(teams[0].id), "role": EventParticipantRole.HOME.value},
+                {"team_id": str(teams[1].id), "role": EventParticipantRole.AWAY.value},
+            ],
+        }
+        for idx in range(25)
+    ]
+    (await api_client.post("/api/v1/events/bulk", json=payloads)).raise_for_status()
+
+    params = {"sport_id": str(sport.id), "page_size": 5}
+    resp = await api_client.get("/api/v1/events/export", params=params)
+    resp.raise_for_status()
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["title"] for line in lines] == [f"Export {idx}" for idx in range(25)]
+    assert lines[0]["sport_name"] == sport.name
+
+    resp = await api_client.get("/api/v1/events/export", params={**params, "format": "csv", "order": "desc"})
+    resp.raise_for_status()
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 25
+    assert rows[0]["title"] == "Export 24"
+    assert f"home:{teams[0].name}" in rows[0]["participants"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_events_reports_total_count(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    base = datetime.now(tz=UTC)
+    payloads = [
+        {
+            "sport_id": str(sport.id),
+            "title": f"Counted {idx}",
+            "starts_at": (base + timedelta(hours=idx)).isoformat(),
+            "ends_at": (base + timedelta(hours=idx + 1)).isoformat(),
+        }
+        for idx in range(7)
+    ]
+    (await api_client.post("/api/v1/events/bulk", json=payloads)).raise_for_status()
+
+    query = {"sport_id": str(sport.id), "page_size": 3}
+    plain = await api_client.get("/api/v1/events", params=query)
+    assert "X-Total-Count" not in plain.headers
+
+    for params in ({**query, "count": "exact"}, {**query, "count": "exact", "page": 9}, {**query, "count": "cached"}):
+        resp = await api_client.get("/api/v1/events", params=params)
+        resp.raise_for_status()
+        assert resp.headers["X-Total-Count"] == "7"
+
+    keyset = await api_client.get(
+        "/api/v1/events", params={**query, "count": "exact", "cursor": plain.headers["X-Next-Cursor"]}
+    )
+    assert keyset.headers["X-Total-Count"] == "7"
+
+    estimated = await api_client.get("/api/v1/events", params={**query, "count": "estimated"})
+    assert int(estimated.headers["X-Total-Count"]) >= 0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_events_full_text_search_ranks_and_filters(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    base = datetime.now(tz=UTC) + timedelta(days=1)
+    titles = ["City Derby", "Cup Final", "Derby Final replay", "Friendly"]
+    payload = [
+        {
+            "sport_id": str(sport.id),
+            "title": title,
+            "description": "The derby everyone waits for" if title == "Friendly" else None,
+            "starts_at": (base + timedelta(days=idx)).isoformat(),
+            "ends_at": (base + timedelta(days=idx, hours=2)).isoformat(),
+            "participants": [
+                {"team_id": str(teams[0].id), "role": EventParticipantRole.HOME.value},
+                {"team_id": str(teams[1].id), "role": EventParticipantRole.AWAY.value},
+            ],
+        }
+        for idx, title in enumerate(titles)
+    ]
+    (await api_client.post("/api/v1/events/bulk", json=payload)).raise_for_status()
+
+    resp = await api_client.get("/api/v1/events", params={"q": "derby", "sport_id": str(sport.id)})
+    resp.raise_for_status()
+    found = [event["title"] for event in resp.json()]
+    # Title matches outrank the description-only match.
+    assert set(found) == {"City Derby", "Derby Final replay", "Friendly"}
+    assert found[-1] == "Friendly"
+    assert "X-Next-Cursor" not in resp.headers
+
+    resp = await api_client.get("/api/v1/events", params={"q": "derby final", "page_size": 1})
+    resp.raise_for_status()
+    assert [event["title"] for event in resp.json()] == ["Derby Final replay"]
+
+    # Team names are indexed too, and stay current when participants are added after the event row.
+    resp = await api_client.get("/api/v1/events", params={"q": teams[0].name, "count": "exact"})
+    resp.raise_for_status()
+    assert resp.headers["X-Total-Count"] == str(len(titles))
+
+    cursor = (await api_client.get("/api/v1/events", params={"page_size": 1})).headers["X-Next-Cursor"]
+    resp = await api_client.get("/api/v1/events", params={"q": "derby", "cursor": cursor})
+    assert resp.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_events_query_budget_is_independent_of_page_size(
+    async_db_session: AsyncSession, api_client: AsyncClient
+):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    base = datetime.now(tz=UTC) + timedelta(days=1)
+    payload = [
+        {
+            "sport_id": str(sport.id),
+            "title": f"Budget {idx}",
+            "starts_at": (base + timedelta(hours=idx)).isoformat(),
+            "ends_at": (base + timedelta(hours=idx, minutes=45)).isoformat(),
+            "participants": [
+                {"team_id": str(teams[0].id), "role": EventParticipantRole.HOME.value},
+                {"team_id": str(teams[1].id), "role": EventParticipantRole.AWAY.value},
+            ],
+        }
+        for idx in range(30)
+    ]
+    (await api_client.post("/api/v1/events/bulk", json=payload)).raise_for_status()
+
+    for page_size in (5, 30):
+        with count_queries(async_db_session.bind) as log:
+            resp = await api_client.get("/api/v1/events", params={"page_size": page_size})
+        resp.raise_for_status()
+        assert len(resp.json()) == page_size
+        # version probe + page (sport joined) + participants (team joined)
+        assert log.count <= 3, log.statements
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_events_sparse_fields_skip_participants(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    start = datetime.now(tz=UTC) + timedelta(days=2)
+    payload = {
+        "sport_id": str(sport.id),
+        "title": "Sparse",
+        "description": "Long description " * 50,
+        "starts_at": start.isoformat(),
+        "ends_at": (start + timedelta(hours=2)).isoformat(),
+        "participants": [{"team_id": str(team.id)} for team in teams],
+    }
+    (await api_client.post("/api/v1/events", json=payload)).raise_for_status()
+    params = {"sport_id": str(sport.id), "date_from": start.isoformat()}
+
+    with count_queries(async_db_session.bind) as log:
+        compact = await api_client.get("/api/v1/events", params={**params, "fields": "title,starts_at", "include": ""})
+    compact.raise_for_status()
+    assert [set(e) for e in compact.json()] == [{"id", "title", "starts_at"}]
+    # version probe + page; no participant or sport loading
+    assert log.count <= 2, log.statements
+
+    full = await api_client.get("/api/v1/events", params=params)
+    assert len(compact.content) * 5 < len(full.content)
+    assert full.headers["ETag"] != compact.headers["ETag"]
+
+    with_sport = await api_client.get("/api/v1/events", params={**params, "fields": "title", "include": "sport"})
+    assert with_sport.json()[0]["sport_name"] == sport.name
+    assert "participants" not in with_sport.json()[0]
+
+    bad = await api_client.get("/api/v1/events", params={"fields": "title,secret"})
+    assert bad.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_venue_double_booking_and_availability(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    venue = (await async_db_session.scalars(select(Venue).order_by(Venue.name))).first()
+    day = (datetime.now(tz=UTC) + timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _payload(title: str, start_hour: int, hours: int, **extra) -> dict:
+        start = day + timedelta(hours=start_hour)
+        return {
+            "sport_id": str(sport.id),
+            "venue_id": str(venue.id),
+            "title": title,
+            "starts_at": start.isoformat(),
+            "ends_at": (start + timedelta(hours=hours)).isoformat(),
+            **extra,
+        }
+
+    first = await api_client.post("/api/v1/events", json=_payload("Afternoon", 14, 2))
+    first.raise_for_status()
+    clash = await api_client.post("/api/v1/events", json=_payload("Overlap", 15, 2))
+    assert clash.status_code == 409
+    assert first.json()["id"] in clash.json()["detail"]
+    (await api_client.post("/api/v1/events", json=_payload("Evening", 16, 2))).raise_for_status()
+    (await api_client.post("/api/v1/events", json=_payload("Off", 15, 1, status="cancelled"))).raise_for_status()
+
+    resp = await api_client.post("/api/v1/events/bulk", json=[_payload("Bulk clash", 13, 2), _payload("Morning", 9, 2)])
+    resp.raise_for_status()
+    assert resp.json()["created"] == 1
+    assert [err["index"] for err in resp.json()["errors"]] == [0]
+
+    resp = await api_client.get(
+        f"/api/v1/venues/{venue.id}/availability",
+        params={"date_from": day.isoformat(), "date_to": (day + timedelta(days=1)).isoformat()},
+    )
+    resp.raise_for_status()
+    body = resp.json()
+    busy = [(datetime.fromisoformat(i["starts_at"]), datetime.fromisoformat(i["ends_at"])) for i in body["busy"]]
+    assert busy == [
+        (day + timedelta(hours=9), day + timedelta(hours=11)),
+        (day + timedelta(hours=14), day + timedelta(hours=18)),
+    ]
+    assert len(body["busy"][1]["event_ids"]) == 2
+    assert len(body["free"]) == 3
+
+    missing = await api_client.get(
+        "/api/v1/venues/00000000-0000-0000-0000-000000000000/availability",
+        params={"date_from": day.isoformat(), "date_to": (day + timedelta(days=1)).isoformat()},
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_team_schedule_and_double_booking(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    home, away = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    now = datetime.now(tz=UTC)
+
+    def _payload(title: str, days: float, team_ids: list[UUID]) -> dict:
+        start = now + timedelta(days=days)
+        return {
+            "sport_id": str(sport.id),
+            "title": title,
+            "starts_at": start.isoformat(),
+            "ends_at": (start + timedelta(hours=2)).isoformat(),
+            "participants": [{"team_id": str(team_id)} for team_id in team_ids],
+        }
+
+    payload = [_payload(f"Fixture {days}", days, [home.id]) for days in (-3, -2, -1, 1, 2, 3)]
+    payload.append(_payload("Away only", 4, [away.id]))
+    (await api_client.post("/api/v1/events/bulk", json=payload)).raise_for_status()
+
+    resp = await api_client.get(f"/api/v1/teams/{home.id}/events", params={"page_size": 2})
+    resp.raise_for_status()
+    assert [e["title"] for e in resp.json()] == ["Fixture 1", "Fixture 2"]
+    resp = await api_client.get(
+        f"/api/v1/teams/{home.id}/events", params={"page_size": 2, "cursor": resp.headers["X-Next-Cursor"]}
+    )
+    assert [e["title"] for e in resp.json()] == ["Fixture 3"]
+
+    resp = await api_client.get(f"/api/v1/teams/{home.id}/events", params={"window": "past"})
+    assert [e["title"] for e in resp.json()] == ["Fixture -1", "Fixture -2", "Fixture -3"]
+    resp = await api_client.get("/api/v1/events", params={"team_id": str(away.id)})
+    assert [e["title"] for e in resp.json()] == ["Away only"]
+
+    clash = await api_client.post("/api/v1/events", json=_payload("Clash", 1.04, [away.id, home.id]))
+    assert clash.status_code == 409
+    assert home.name in clash.json()["detail"]
+
+    missing = await api_client.get("/api/v1/teams/00000000-0000-0000-0000-000000000000/events")
+    assert missing.status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_status_scheduler_and_manual_transitions(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    now = datetime.now(tz=UTC)
+
+    def _payload(title: str, starts_in: timedelta, **extra) -> dict:
+        return {
+            "sport_id": str(sport.id),
+            "title": title,
+            "starts_at": (now + starts_in).isoformat(),
+            "ends_at": (now + starts_in + timedelta(hours=2)).isoformat(),
+            **extra,
+        }
+
+    payload = [
+        _payload("Over", timedelta(hours=-3)),
+        _payload("Under way", timedelta(hours=-1)),
+        _payload("Upcoming", timedelta(hours=1)),
+        _payload("Called off", timedelta(hours=-3), status="cancelled"),
+    ]
+    resp = await api_client.post("/api/v1/events/bulk", json=payload)
+    resp.raise_for_status()
+    over, under_way, upcoming, called_off = (UUID(i) for i in resp.json()["ids"])
+
+    advance = await EventService().advance_statuses(async_db_session, now=now, batch_size=100)
+    assert advance is not None and advance.went_live >= 1 and advance.finished >= 1
+    rows = await async_db_session.execute(
+        select(Event.id, Event.status).where(Event.id.in_([over, under_way, upcoming, called_off]))
+    )
+    assert dict(rows.tuples().all()) == {
+        over: EventStatus.FINISHED,
+        under_way: EventStatus.LIVE,
+        upcoming: EventStatus.SCHEDULED,
+        called_off: EventStatus.CANCELLED,
+    }
+
+    missing = UUID("00000000-0000-0000-0000-000000000000")
+    resp = await api_client.post(
+        "/api/v1/events/status",
+        json={"ids": [str(i) for i in (upcoming, under_way, called_off, over, missing)], "status": "cancelled"},
+    )
+    resp.raise_for_status()
+    body = resp.json()
+    assert body["updated"] == [str(upcoming), str(under_way)]
+    assert {err["id"]: err["detail"] for err in body["errors"]} == {
+        str(called_off): "Event is already cancelled.",
+        str(over): "Event cannot move from finished to cancelled.",
+        str(missing): "Event not found.",
+    }
+
+    resp = await api_client.post("/api/v1/events/status", json={"ids": [str(upcoming)], "status": "scheduled"})
+    assert resp.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_multi_get_and_coalesced_single_lookups(async_db_session: AsyncSession, api_client: AsyncClient):
+    await seed_reference_data(async_db_session)
+    sport = await _get_first_sport(async_db_session)
+    teams = await _get_teams_for_sport(async_db_session, sport.id, limit=2)
+    base = datetime.now(tz=UTC) + timedelta(days=3)
+    payload = [
+        {
+            "sport_id": str(sport.id),
+            "title": f"Dashboard {idx}",
+            "starts_at": (base + timedelta(hours=idx)).isoformat(),
+            "ends_at": (base + timedelta(hours=idx, minutes=45)).isoformat(),
+            "participants": [{"team_id": str(team.id)} for team in teams],
+        }
+        for idx in range(25)
+    ]
+    resp = await api_client.post("/api/v1/events/bulk", json=payload)
+    ids = resp.json()["ids"]
+    wanted = [*ids[::2], "00000000-0000-0000-0000-000000000000"]
+
+    with count_queries(async_db_session.bind) as log:
+        resp = await api_client.get("/api/v1/events", params={"ids": wanted})
+    resp.raise_for_status()
+    assert [e["id"] for e in resp.json()] == ids[::2]
+    assert all(len(e["participants"]) == 2 for e in resp.json())
+    # version probe + one IN query for the page + participants, however many ids
+    assert log.count <= 3, log.statements
+
+    with count_queries(async_db_session.bind) as log:
+        single = await asyncio.gather(*(api_client.get(f"/api/v1/events/{event_id}") for event_id in ids[:10]))
+    assert [r.json()["id"] for r in single] == ids[:10]
+    # one batched load (events + participants) serves all ten requests
+    assert log.count <= 2, log.statements
+
+    too_many = await api_client.get("/api/v1/events", params={"ids": ids * 5})
+    assert too_many.status_code == 422
+
+
 # ----------------- helpers -----------------
 
 
@@ -10,3 +10,18 @@ async def test_readiness_probe(client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_templates(client: AsyncClient) -> None:
+    """Requests should be recorded under their route template in Prometheus text format."""
+
+    await client.get("/api/v1/health")
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'route="/api/v1/health",status="200",le="+Inf"' in body
+    assert "db_pool_checked_out" in body
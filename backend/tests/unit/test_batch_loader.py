@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.batching import BatchLoader
+
+
+class RecordingLoad:
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {key: f"event-{key}" for key in keys if key != 404}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_coalesced_into_one_batch():
+    load_many = RecordingLoad()
+    loader = BatchLoader(load_many, window=0.01)
+
+    results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 1, 404, 3)))
+
+    assert results == ["event-1", "event-2", "event-1", None, "event-3"]
+    assert load_many.batches == [[1, 2, 404, 3]]
+    stats = loader.stats()
+    assert (stats.loads, stats.keys, stats.batches) == (5, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_for_the_window():
+    load_many = RecordingLoad()
+    loader = BatchLoader(load_many, window=10.0, max_batch=2)
+
+    results = await asyncio.wait_for(asyncio.gather(loader.load(1), loader.load(2)), timeout=1)
+
+    assert results == ["event-1", "event-2"]
+    assert load_many.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_later_loads_start_a_new_batch():
+    load_many = RecordingLoad()
+    loader = BatchLoader(load_many, window=0.001)
+
+    await loader.load(1)
+    await loader.load(1)
+
+    assert load_many.batches == [[1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    loader = BatchLoader(RecordingLoad(fail=True), window=0.001)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_every_caller():
+    started = asyncio.Event()
+
+    async def hanging_load(keys):
+        started.set()
+        await asyncio.Event().wait()
+
+    loader = BatchLoader(hanging_load, window=0.001)
+    callers = asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    await started.wait()
+    for task in list(loader._tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(callers, timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
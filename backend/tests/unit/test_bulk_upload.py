@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_db_session
+from app.api.v1.endpoints import events as events_endpoint
+from app.core.config import settings
+from app.main import app
+
+
+@pytest.fixture
+async def client():
+    app.dependency_overrides[get_db_session] = lambda: None
+    app.dependency_overrides[events_endpoint.get_event_service] = lambda: None
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+        app.dependency_overrides.pop(events_endpoint.get_event_service, None)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_upload_is_refused_once_it_passes_the_row_limit(client, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "EVENT_BULK_MAX_ROWS", 2)
+    sent: list[int] = []
+
+    async def lines():
+        for index in range(1000):
+            sent.append(index)
+            yield b'{"title": "Derby"}\n'
+
+    resp = await client.post(
+        "/api/v1/events/bulk", content=lines(), headers={"Content-Type": events_endpoint.NDJSON_MEDIA_TYPE}
+    )
+
+    assert resp.status_code == 413
+    assert len(sent) < 1000
+
+
+@pytest.mark.asyncio
+async def test_json_upload_over_the_byte_limit_is_refused_before_parsing(client, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "EVENT_BULK_MAX_BYTES", 64)
+    body = json.dumps([{"title": "Derby"}] * 10).encode()
+
+    declared = await client.post("/api/v1/events/bulk", content=body, headers={"Content-Type": "application/json"})
+
+    async def chunks():
+        for start in range(0, len(body), 16):
+            yield body[start : start + 16]
+
+    streamed = await client.post("/api/v1/events/bulk", content=chunks(), headers={"Content-Type": "application/json"})
+
+    assert declared.status_code == streamed.status_code == 413
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import Request
+
+from app.api.conditional import build_validators, is_not_modified
+
+
+def _request(headers: dict[str, str], method: str = "GET") -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": method, "headers": raw, "path": "/"})
+
+
+def test_etag_changes_with_updated_at_and_variant() -> None:
+    event_id = uuid4()
+    now = datetime.now(tz=UTC)
+    base = build_validators([(event_id, now)])
+    assert base == build_validators([(event_id, now)])
+    assert base.etag != build_validators([(event_id, now + timedelta(seconds=1))]).etag
+    assert base.etag != build_validators([(event_id, now)], variant="json").etag
+    assert base.last_modified == now
+
+
+def test_collections_get_no_last_modified() -> None:
+    updated_at = datetime(2025, 11, 8, 10, tzinfo=UTC)
+    validators = build_validators([(uuid4(), updated_at)], collection=True)
+    assert validators.last_modified is None
+    assert not is_not_modified(_request({"If-Modified-Since": format_datetime(updated_at, usegmt=True)}), validators)
+
+
+def test_empty_page_has_etag_but_no_last_modified() -> None:
+    validators = build_validators([])
+    assert validators.etag.startswith('"')
+    assert validators.last_modified is None
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("{etag}", True),
+        ('"other", W/{etag}', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_if_none_match(header: str, expected: bool) -> None:
+    validators = build_validators([(uuid4(), datetime.now(tz=UTC))])
+    request = _request({"If-None-Match": header.format(etag=validators.etag)})
+    assert is_not_modified(request, validators) is expected
+
+
+def test_if_modified_since_uses_second_precision() -> None:
+    updated_at = datetime(2025, 11, 8, 10, 0, 0, 500_000, tzinfo=UTC)
+    validators = build_validators([(uuid4(), updated_at)])
+    same_second = format_datetime(updated_at.replace(microsecond=0), usegmt=True)
+    earlier = format_datetime(updated_at - timedelta(seconds=1), usegmt=True)
+    assert is_not_modified(_request({"If-Modified-Since": same_second}), validators)
+    assert not is_not_modified(_request({"If-Modified-Since": earlier}), validators)
+    assert not is_not_modified(_request({"If-Modified-Since": same_second}, method="POST"), validators)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since() -> None:
+    updated_at = datetime(2025, 11, 8, 10, tzinfo=UTC)
+    validators = build_validators([(uuid4(), updated_at)])
+    headers = {"If-None-Match": '"stale"', "If-Modified-Since": format_datetime(updated_at, usegmt=True)}
+    assert not is_not_modified(_request(headers), validators)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_event_broadcaster
+from app.db.notify import ChangeKind, EventChange, PgListener, listen_dsn
+from app.main import app
+from app.models.event import EventStatus
+from app.services.live import EventBroadcaster, EventStreamFilter, StreamMessage, SubscriptionResetError
+
+
+def _change(sport_id=None, status=EventStatus.SCHEDULED, kind=ChangeKind.created) -> EventChange:
+    return EventChange(kind, uuid4(), sport_id or uuid4(), None, status.value)
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls: list[list] = []
+
+    async def __call__(self, ids):
+        self.calls.append(list(ids))
+        return {event_id: f'{{"id":"{event_id}"}}' for event_id in ids}
+
+
+def test_event_change_payload_round_trips() -> None:
+    change = EventChange(ChangeKind.updated, uuid4(), uuid4(), uuid4(), "live")
+    assert EventChange.from_payload(change.to_payload()) == change
+    timed = EventChange(ChangeKind.created, uuid4(), uuid4(), None, "scheduled", datetime(2026, 10, 17, 18, tzinfo=UTC))
+    assert EventChange.from_payload(timed.to_payload()) == timed
+    assert len(change.to_payload()) < 8000  # NOTIFY payload limit
+
+
+class FakeConnection:
+    def __init__(self, fail_after: int):
+        self.fail_after = fail_after
+        self.callback = None
+        self.terminated = False
+
+    async def add_listener(self, channel, callback):
+        self.callback = callback
+
+    async def execute(self, sql):
+        self.fail_after -= 1
+        if self.fail_after < 0:
+            raise ConnectionResetError("gone")
+
+    def terminate(self):
+        self.terminated = True
+
+
+@pytest.mark.asyncio
+async def test_listener_dispatches_and_reconnects_after_connection_loss() -> None:
+    connections = [FakeConnection(fail_after=0), FakeConnection(fail_after=100)]
+    attempts = 0
+
+    async def connect(dsn):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OSError("connection refused")
+        return connections[attempts - 2]
+
+    payloads, reconnects = [], []
+    listener = PgListener(
+        "postgresql://db/x",
+        "event_changes",
+        payloads.append,
+        on_reconnect=lambda: reconnects.append(True),
+        keepalive=0.001,
+        min_backoff=0.001,
+        connect=connect,
+    )
+    task = asyncio.create_task(listener.run())
+    while not (listener.connected and listener.reconnects):
+        await asyncio.sleep(0.001)
+    connections[1].callback(connections[1], 1, "event_changes", "payload")
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert attempts == 3
+    assert reconnects == [True]
+    assert payloads == ["payload"]
+    assert all(connection.terminated for connection in connections)
+    assert listen_dsn("postgresql+asyncpg://u:p@db:5432/x") == "postgresql://u:p@db:5432/x"
+
+
+@pytest.mark.asyncio
+async def test_drain_loads_each_batch_once_and_fans_out_by_filter() -> None:
+    loader = CountingLoader()
+    broadcaster = EventBroadcaster(loader, batch_size=2)
+    football = uuid4()
+    everything = broadcaster.subscribe(EventStreamFilter())
+    football_only = broadcaster.subscribe(EventStreamFilter(sport_id=football))
+    live_only = broadcaster.subscribe(EventStreamFilter(status=EventStatus.LIVE))
+
+    changes = [_change(football), _change(), _change(football, EventStatus.LIVE, ChangeKind.updated)]
+    for change in changes:
+        broadcaster.feed(change.to_payload())
+    broadcaster.feed("not json")
+    await broadcaster.drain()
+
+    assert [len(ids) for ids in loader.calls] == [2, 1]
+    assert [(await everything.next(0)).change for _ in changes] == changes
+    assert [(await football_only.next(0)).change for _ in range(2)] == [changes[0], changes[2]]
+    message = await live_only.next(0)
+    assert message.frame.startswith(b"id: 3\nevent: updated\ndata: {")
+    assert await live_only.next(0) is None
+    assert broadcaster.stats().delivered == 6
+    await broadcaster.stop()
+
+
+@pytest.mark.asyncio
+async def test_drain_skips_loading_without_subscribers() -> None:
+    loader = CountingLoader()
+    broadcaster = EventBroadcaster(loader)
+    broadcaster.feed(_change().to_payload())
+    await broadcaster.drain()
+    assert loader.calls == []
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_reset_without_affecting_others() -> None:
+    broadcaster = EventBroadcaster(CountingLoader(), max_pending=2)
+    slow = broadcaster.subscribe(EventStreamFilter())
+    fast = broadcaster.subscribe(EventStreamFilter())
+
+    for _ in range(3):
+        broadcaster.feed(_change().to_payload())
+        await broadcaster.drain()
+        assert await fast.next(0) is not None
+
+    with pytest.raises(SubscriptionResetError):
+        await slow.next(0)
+    assert broadcaster.stats().subscribers == 1
+    assert broadcaster.stats().resets == 1
+    await broadcaster.stop()
+
+
+@pytest.mark.asyncio
+async def test_pump_wakes_waiting_subscriber() -> None:
+    broadcaster = EventBroadcaster(CountingLoader())
+    subscription = broadcaster.subscribe(EventStreamFilter())
+    change = _change()
+    broadcaster.feed(change.to_payload())
+    message = await subscription.next(timeout=1)
+    assert message.change == change
+    await broadcaster.stop()
+    with pytest.raises(SubscriptionResetError):
+        await subscription.next(0)
+
+
+class ScriptedSubscription:
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    async def next(self, timeout):
+        await asyncio.sleep(0)
+        if not self.messages:
+            raise SubscriptionResetError
+        return self.messages.pop(0)
+
+
+class ScriptedBroadcaster:
+    def __init__(self, subscription):
+        self.subscription = subscription
+        self.filters = []
+        self.unsubscribed = False
+
+    def subscribe(self, stream_filter):
+        self.filters.append(stream_filter)
+        return self.subscription
+
+    def unsubscribe(self, subscription):
+        self.unsubscribed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_writes_sse_frames_until_reset() -> None:
+    frame = b'id: 1\nevent: created\ndata: {"id":"x"}\n\n'
+    broadcaster = ScriptedBroadcaster(ScriptedSubscription([StreamMessage(_change(), frame), None]))
+    app.dependency_overrides[get_event_broadcaster] = lambda: broadcaster
+    sport_id = uuid4()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/api/v1/events/stream", params={"sport_id": str(sport_id), "status": "live"})
+    finally:
+        app.dependency_overrides.pop(get_event_broadcaster, None)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.content.endswith(frame + b": keep-alive\n\nevent: reset\ndata: {}\n\n")
+    assert broadcaster.filters == [EventStreamFilter(sport_id=sport_id, status=EventStatus.LIVE)]
+    assert broadcaster.unsubscribed
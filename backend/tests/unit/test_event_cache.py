@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import _open_event_session
+from app.core.config import settings
+from app.db.notify import ChangeKind, EventChange
+from app.db.session import build_read_only_engine
+from app.services.event_cache import EventCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoad:
+    def __init__(self):
+        self.calls = 0
+        self.release: asyncio.Event | None = None
+
+    async def __call__(self, event_id):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return SimpleNamespace(id=event_id, version=self.calls)
+
+
+def _payload(event_id) -> str:
+    return EventChange(ChangeKind.updated, event_id, uuid4(), None, "live").to_payload()
+
+
+@pytest.mark.asyncio
+async def test_hot_event_is_served_from_memory_until_notified() -> None:
+    clock = FakeClock()
+    cache = EventCache(ttl=30, max_entries=8, clock=clock)
+    load = CountingLoad()
+    event_id = uuid4()
+
+    assert (await cache.get(event_id, load)).version == 1
+    assert (await cache.get(event_id, load)).version == 1
+    cache.feed(_payload(event_id))
+    assert (await cache.get(event_id, load)).version == 2
+
+    clock.now = 30
+    assert (await cache.get(event_id, load)).version == 3
+    assert load.calls == 3
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_load_invalidated_while_running_is_not_kept() -> None:
+    cache = EventCache(ttl=30, max_entries=8)
+    load = CountingLoad()
+    load.release = asyncio.Event()
+    event_id = uuid4()
+
+    pending = asyncio.ensure_future(cache.get(event_id, load))
+    await asyncio.sleep(0)
+    cache.feed(_payload(event_id))
+    load.release.set()
+    assert (await pending).version == 1
+
+    assert (await cache.get(event_id, load)).version == 2
+    assert (await cache.get(event_id, load)).version == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_entries_and_running_loads() -> None:
+    cache = EventCache(ttl=30, max_entries=8)
+    load = CountingLoad()
+    cached, loading = uuid4(), uuid4()
+    await cache.get(cached, load)
+    load.release = asyncio.Event()
+    pending = asyncio.ensure_future(cache.get(loading, load))
+    await asyncio.sleep(0)
+
+    cache.flush()
+    load.release.set()
+    await pending
+
+    assert cache.stats().size == 0
+    cache.feed("not json")
+    assert cache.stats().invalidations == 0
+
+
+@pytest.mark.asyncio
+async def test_lookups_bypass_the_cache_until_the_listener_connects() -> None:
+    never = asyncio.Event()
+
+    async def connect(dsn):
+        await never.wait()
+
+    cache = EventCache(ttl=30, max_entries=8, listen_dsn="postgresql://localhost/db", connect=connect)
+    load = CountingLoad()
+    event_id = uuid4()
+    try:
+        await cache.get(event_id, load)
+        await cache.get(event_id, load)
+    finally:
+        await cache.stop()
+
+    assert load.calls == 2
+    stats = cache.stats()
+    assert (stats.bypassed, stats.size, stats.listener_connected) == (2, 0, False)
+
+
+def test_cache_fills_read_the_primary_not_a_replica(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "EVENT_CACHE_TTL_SECONDS", 30.0)
+    assert _open_event_session().bind is build_read_only_engine()
+
+    monkeypatch.setattr(settings, "EVENT_CACHE_TTL_SECONDS", 0.0)
+    assert not isinstance(_open_event_session(), AsyncSession)  # the replica-routing read session
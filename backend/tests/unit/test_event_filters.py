@@ -1,6 +1,9 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
 import pytest
 
-from app.services.event_filters import EventListParams, Pagination
+from app.services.event_filters import EventCursor, EventFieldSet, EventInclude, EventListParams, Pagination
 
 
 def test_pagination_clamps_values() -> None:
@@ -28,3 +31,76 @@ def test_event_list_params_exposes_limit_offset() -> None:
 def test_pagination_rejects_invalid_values(page: int, page_size: int, max_page_size: int) -> None:
     with pytest.raises(ValueError):
         Pagination(page=page, page_size=page_size, max_page_size=max_page_size)
+
+
+def test_event_cursor_round_trips() -> None:
+    cursor = EventCursor(starts_at=datetime(2025, 11, 8, 10, tzinfo=UTC), id=uuid4(), backward=True)
+    assert EventCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJzIjoiMjAyNS0xMS0wOFQxMDowMDowMCJ9"])
+def test_event_cursor_rejects_malformed_tokens(token: str) -> None:
+    with pytest.raises(ValueError):
+        EventCursor.decode(token)
+
+
+def test_cursor_disables_offset() -> None:
+    cursor = EventCursor(starts_at=datetime.now(tz=UTC), id=uuid4())
+    params = EventListParams(pagination=Pagination(page=5, page_size=10), cursor=cursor)
+    assert params.offset == 0
+    assert params.limit == 10
+
+
+def test_field_set_parses_fields_and_includes() -> None:
+    assert EventFieldSet.parse(None, None).is_full
+    compact = EventFieldSet.parse("starts_at, title,", "")
+    assert compact.columns == ("id", "title", "starts_at")
+    assert compact.include == frozenset()
+    assert compact.response_fields == {"id", "title", "starts_at"}
+    assert compact.key == "id,starts_at,title"
+    with_sport = EventFieldSet.parse(None, "sport")
+    assert with_sport.include == {EventInclude.sport}
+    assert "sport_name" in with_sport.response_fields and "participants" not in with_sport.response_fields
+
+
+@pytest.mark.parametrize("fields,include", [("title,secret", None), (None, "venue")])
+def test_field_set_rejects_unknown_names(fields: str | None, include: str | None) -> None:
+    with pytest.raises(ValueError):
+        EventFieldSet.parse(fields, include)
+
+
+def test_field_set_is_not_part_of_the_filter_key() -> None:
+    params = EventListParams(field_set=EventFieldSet.parse("title", ""))
+    assert params.filters_only() == EventListParams()
+
+
+def test_compact_listing_loads_only_requested_columns_in_one_statement() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories import EventRepository
+
+    params = EventListParams(field_set=EventFieldSet.parse("title", ""))
+    sql = str(EventRepository()._list_query(params).compile(dialect=postgresql.dialect()))
+    selected = sql.split("FROM")[0]
+    assert "events.title" in selected and "events.description" not in selected
+    assert "JOIN" not in sql
+
+
+def test_listing_statements_are_built_once_per_shape() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    from app.repositories import EventRepository
+    from app.repositories.event import _bind_values
+
+    repository = EventRepository()
+    derby = EventListParams(sport_id=uuid4(), q="derby", pagination=Pagination(page=2))
+    final = EventListParams(sport_id=uuid4(), q="final", pagination=Pagination(page=5))
+
+    statement = repository._list_query(derby)
+    assert repository._list_query(final) is statement
+    assert repository._list_query(EventListParams(sport_id=uuid4())) is not statement
+
+    compiled = statement.compile(dialect=postgresql.asyncpg.dialect())
+    values = compiled.construct_params(_bind_values(final, limit=21))
+    assert values["sport_id"] == final.sport_id and values["q"] == "final"
+    assert (values["offset"], values["limit"]) == (final.offset, 21)
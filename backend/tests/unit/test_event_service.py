@@ -9,7 +9,9 @@ from pytest import raises
 
 from app.models.event import EventParticipantRole, EventStatus
 from app.schemas import EventCreate, EventParticipantCreate
-from app.services import EventService, ValidationError
+from app.services import ConflictError, EventService, ValidationError
+from app.services.cache import TTLCache
+from app.services.event_filters import CountStrategy, EventListParams, Pagination, ScheduleWindow
 
 
 class DummyRepo:
@@ -27,6 +29,22 @@ class DummyRepo:
     async def get(self, *args, **kwargs):
         return None
 
+    async def bulk_create(self, session, *, rows):
+        self.bulk_rows = list(rows)
+        return [uuid4() for _ in rows]
+
+    async def lock_bookings(self, session, **kwargs):
+        self.locked = {kind: set(ids) for kind, ids in kwargs.items()}
+
+    async def find_venue_conflict(self, session, **kwargs):
+        return None
+
+    async def find_venue_conflicts(self, session, *, windows):
+        return {}
+
+    async def find_team_conflicts(self, session, *, windows):
+        return {}
+
 
 class DummyTeamRepo:
     def __init__(self, teams):
@@ -36,6 +54,16 @@ class DummyTeamRepo:
         return self.teams
 
 
+class DummyRefRepo:
+    def __init__(self, *ids):
+        self.rows = [SimpleNamespace(id=i) for i in ids]
+        self.calls = 0
+
+    async def get_by_ids(self, *_, **__):
+        self.calls += 1
+        return self.rows
+
+
 @pytest.mark.asyncio
 async def test_create_event_rejects_invalid_time():
     service = EventService(event_repository=DummyRepo(), team_repository=DummyTeamRepo([]))
@@ -108,3 +136,245 @@ async def test_create_event_calls_repository():
     result = await service.create_event(object(), data)
     assert result is repo.create_returns
     assert repo.create_called_with == data
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_errors_per_row():
+    sport_id = uuid4()
+    team = SimpleNamespace(id=uuid4(), sport_id=sport_id, name="Home Team")
+    repo = DummyRepo()
+    team_repo = DummyTeamRepo([team])
+    sports = DummyRefRepo(sport_id)
+    service = EventService(
+        event_repository=repo,
+        team_repository=team_repo,
+        sport_repository=sports,
+        venue_repository=DummyRefRepo(),
+    )
+    now = datetime.now(tz=UTC)
+    good = EventCreate(
+        sport_id=sport_id,
+        title="Good",
+        starts_at=now,
+        ends_at=now + timedelta(hours=1),
+        participants=[EventParticipantCreate(team_id=team.id, role=EventParticipantRole.HOME)],
+    )
+    bad_window = EventCreate(sport_id=sport_id, title="Bad", starts_at=now, ends_at=now)
+    unknown_team = EventCreate(
+        sport_id=sport_id,
+        title="Ghost",
+        starts_at=now,
+        ends_at=now + timedelta(hours=1),
+        participants=[EventParticipantCreate(team_id=uuid4())],
+    )
+    unknown_venue = EventCreate(
+        sport_id=sport_id, venue_id=uuid4(), title="Nowhere", starts_at=now, ends_at=now + timedelta(hours=1)
+    )
+
+    result = await service.bulk_create_events(
+        object(), [(0, good), (1, bad_window), (2, unknown_team), (5, unknown_venue)]
+    )
+
+    assert result.created == 1
+    assert repo.bulk_rows == [good]
+    assert [e.index for e in result.errors] == [1, 2, 5]
+    assert "end time" in result.errors[0].detail
+    assert sports.calls == 1
+
+
+class BookedVenueRepo(DummyRepo):
+    """Pretends one event already occupies ``venue_id`` during ``[starts_at, ends_at)``."""
+
+    def __init__(self, venue_id, starts_at, ends_at):
+        super().__init__()
+        self.booking = (venue_id, starts_at, ends_at)
+        self.booked_by = uuid4()
+        self.probed_windows = None
+
+    def _clashes(self, venue_id, starts_at, ends_at):
+        booked_venue, booked_start, booked_end = self.booking
+        return venue_id == booked_venue and starts_at < booked_end and booked_start < ends_at
+
+    async def find_venue_conflict(self, session, *, venue_id, starts_at, ends_at):
+        return self.booked_by if self._clashes(venue_id, starts_at, ends_at) else None
+
+    async def find_venue_conflicts(self, session, *, windows):
+        self.probed_windows = list(windows)
+        return {key: self.booked_by for key, *window in windows if self._clashes(*window)}
+
+
+@pytest.mark.asyncio
+async def test_create_event_rejects_double_booked_venue():
+    venue_id = uuid4()
+    now = datetime.now(tz=UTC)
+    repo = BookedVenueRepo(venue_id, now, now + timedelta(hours=2))
+    service = EventService(event_repository=repo, team_repository=DummyTeamRepo([]))
+    clash = EventCreate(
+        sport_id=uuid4(),
+        venue_id=venue_id,
+        title="Clash",
+        starts_at=now + timedelta(hours=1),
+        ends_at=now + timedelta(hours=3),
+    )
+    with raises(ConflictError):
+        await service.create_event(object(), clash)
+    assert repo.locked == {"venue_ids": {venue_id}, "team_ids": set()}
+
+    back_to_back = clash.model_copy(update={"starts_at": now + timedelta(hours=2)})
+    cancelled = clash.model_copy(update={"status": EventStatus.CANCELLED})
+    assert await service.create_event(object(), back_to_back) is repo.create_returns
+    assert await service.create_event(object(), cancelled) is repo.create_returns
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_venue_overlaps_in_db_and_within_batch():
+    sport_id = uuid4()
+    venue_id = uuid4()
+    now = datetime.now(tz=UTC)
+    repo = BookedVenueRepo(venue_id, now, now + timedelta(hours=1))
+    service = EventService(
+        event_repository=repo,
+        team_repository=DummyTeamRepo([]),
+        sport_repository=DummyRefRepo(sport_id),
+        venue_repository=DummyRefRepo(venue_id),
+    )
+
+    def at(hour: int, hours: int = 2, **extra) -> EventCreate:
+        starts_at = now + timedelta(hours=hour)
+        fields = {"sport_id": sport_id, "venue_id": venue_id, "title": f"At {hour}", **extra}
+        return EventCreate(starts_at=starts_at, ends_at=starts_at + timedelta(hours=hours), **fields)
+
+    rows = [
+        (0, at(0)),  # clashes with the stored booking
+        (1, at(4)),
+        (2, at(2)),  # ends exactly when item 1 starts
+        (3, at(5)),  # overlaps item 1
+        (4, at(5, status=EventStatus.CANCELLED)),
+        (5, at(1, hours=10, venue_id=None)),
+    ]
+    result = await service.bulk_create_events(object(), rows)
+
+    assert [(e.index, "item 1" in e.detail) for e in result.errors] == [(0, False), (3, True)]
+    assert [data.title for data in repo.bulk_rows] == ["At 4", "At 2", "At 5", "At 1"]
+    assert [key for key, *_ in repo.probed_windows] == [0, 1, 2, 3]
+    assert repo.locked == {"venue_ids": {venue_id}, "team_ids": set()}
+
+
+class BusyTeamRepo(DummyRepo):
+    """Pretends ``team_id`` already plays in an event during ``[starts_at, ends_at)``."""
+
+    def __init__(self, team_id, starts_at, ends_at):
+        super().__init__()
+        self.busy = (team_id, starts_at, ends_at)
+        self.booked_by = uuid4()
+
+    async def find_team_conflicts(self, session, *, windows):
+        team_id, starts_at, ends_at = self.busy
+        return {key: self.booked_by for key, tid, s, e in windows if tid == team_id and s < ends_at and starts_at < e}
+
+
+@pytest.mark.asyncio
+async def test_create_event_rejects_double_booked_team():
+    sport_id = uuid4()
+    home = SimpleNamespace(id=uuid4(), sport_id=sport_id, name="Home Team")
+    away = SimpleNamespace(id=uuid4(), sport_id=sport_id, name="Away Team")
+    now = datetime.now(tz=UTC)
+    repo = BusyTeamRepo(away.id, now, now + timedelta(hours=2))
+    service = EventService(event_repository=repo, team_repository=DummyTeamRepo([home, away]))
+    data = EventCreate(
+        sport_id=sport_id,
+        title="Busy",
+        starts_at=now + timedelta(hours=1),
+        ends_at=now + timedelta(hours=3),
+        participants=[
+            EventParticipantCreate(team_id=home.id, role=EventParticipantRole.HOME),
+            EventParticipantCreate(team_id=away.id, role=EventParticipantRole.AWAY),
+        ],
+    )
+    with raises(ConflictError, match="Away Team"):
+        await service.create_event(object(), data)
+    assert repo.create_called_with is None
+    assert repo.locked == {"venue_ids": set(), "team_ids": {home.id, away.id}}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_team_overlaps_in_db_and_within_batch():
+    sport_id = uuid4()
+    team = SimpleNamespace(id=uuid4(), sport_id=sport_id, name="Home Team")
+    now = datetime.now(tz=UTC)
+    repo = BusyTeamRepo(team.id, now, now + timedelta(hours=1))
+    service = EventService(
+        event_repository=repo,
+        team_repository=DummyTeamRepo([team]),
+        sport_repository=DummyRefRepo(sport_id),
+        venue_repository=DummyRefRepo(),
+    )
+
+    def at(hour: int) -> EventCreate:
+        starts_at = now + timedelta(hours=hour)
+        return EventCreate(
+            sport_id=sport_id,
+            title=f"At {hour}",
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(hours=2),
+            participants=[EventParticipantCreate(team_id=team.id)],
+        )
+
+    result = await service.bulk_create_events(object(), [(0, at(0)), (1, at(3)), (2, at(4)), (3, at(5))])
+
+    assert [(e.index, e.detail.split(" ")[0]) for e in result.errors] == [(0, "Team"), (2, "Team")]
+    assert "item 1" in result.errors[1].detail
+    assert [data.title for data in repo.bulk_rows] == ["At 3", "At 5"]
+    assert repo.locked == {"venue_ids": set(), "team_ids": {team.id}}
+
+
+class PageCapturingRepo(DummyRepo):
+    async def list_page(self, session, *, params):
+        self.params = params
+        return None
+
+
+@pytest.mark.asyncio
+async def test_team_schedule_windows_map_to_list_filters():
+    team = SimpleNamespace(id=uuid4(), sport_id=uuid4(), name="Home Team")
+    repo = PageCapturingRepo()
+    now = datetime.now(tz=UTC)
+    service = EventService(event_repository=repo, team_repository=DummyTeamRepo([team]))
+
+    await service.list_team_events_page(object(), team.id, window=ScheduleWindow.upcoming, now=now)
+    assert (repo.params.team_id, repo.params.date_from, repo.params.date_to) == (team.id, now, None)
+    assert not repo.params.order_desc
+
+    await service.list_team_events_page(object(), team.id, window=ScheduleWindow.past, now=now)
+    assert (repo.params.date_from, repo.params.date_to, repo.params.order_desc) == (None, now, True)
+
+    missing = EventService(event_repository=repo, team_repository=DummyTeamRepo([]))
+    assert await missing.list_team_events_page(object(), team.id) is None
+
+
+class CountingRepo(DummyRepo):
+    def __init__(self, total: int):
+        super().__init__()
+        self.total = total
+        self.count_calls = 0
+
+    async def count(self, session, *, params):
+        self.count_calls += 1
+        return self.total
+
+
+@pytest.mark.asyncio
+async def test_cached_count_is_shared_across_pages_and_orderings():
+    repo = CountingRepo(total=42)
+    service = EventService(event_repository=repo, count_cache=TTLCache(ttl=60, max_entries=8))
+    sport_id = uuid4()
+
+    first = EventListParams(sport_id=sport_id, pagination=Pagination(page=1))
+    later = EventListParams(sport_id=sport_id, order_desc=True, pagination=Pagination(page=7))
+    other = EventListParams(sport_id=uuid4())
+
+    assert await service.count_events(object(), params=first, strategy=CountStrategy.cached) == 42
+    assert await service.count_events(object(), params=later, strategy=CountStrategy.cached) == 42
+    assert repo.count_calls == 1
+    await service.count_events(object(), params=other, strategy=CountStrategy.cached)
+    assert repo.count_calls == 2
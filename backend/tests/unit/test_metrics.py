@@ -0,0 +1,94 @@
+import logging
+from types import SimpleNamespace
+
+from sqlalchemy import bindparam, column, create_engine, select
+
+from app.core.metrics import (
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    RequestDbStats,
+    _request_db_stats,
+)
+from app.db.query_metrics import fingerprint, install_query_metrics
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = Histogram((0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert list(histogram.cumulative()) == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+
+
+def test_statement_time_is_attributed_to_current_request() -> None:
+    registry = MetricsRegistry()
+    request = RequestDbStats()
+    token = _request_db_stats.set(request)
+    try:
+        registry.observe_statement(("abc", "SELECT ?"), 0.002)
+        registry.observe_statement(("abc", "SELECT ?"), 0.003)
+    finally:
+        _request_db_stats.reset(token)
+
+    assert request.queries == 2
+    assert registry.statements[("abc", "SELECT ?")].calls == 2
+
+    registry.observe_request("GET", "/api/v1/events", 200, 0.02, request)
+    body = registry.render()
+    assert 'http_request_db_queries_bucket{method="GET",route="/api/v1/events",le="2"} 1' in body
+    assert 'db_statement_calls_total{fingerprint="abc",statement="SELECT ?"} 2' in body
+
+
+def test_statement_series_are_bounded() -> None:
+    registry = MetricsRegistry(max_statement_series=1)
+
+    registry.observe_statement(("a", "SELECT 1"), 0.001)
+    registry.observe_statement(("b", "SELECT 2"), 0.001)
+
+    assert set(registry.statements) == {("a", "SELECT 1"), ("other", "other")}
+
+
+def test_fingerprint_collapses_in_lists_and_parameters() -> None:
+    short = fingerprint("SELECT * FROM teams WHERE teams.id IN ($1::INTEGER, $2::INTEGER)")
+    long = fingerprint("SELECT * FROM teams\n WHERE teams.id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER) LIMIT 10")
+
+    assert short[1] == "SELECT * FROM teams WHERE teams.id IN (...)"
+    assert long[1] == "SELECT * FROM teams WHERE teams.id IN (...) LIMIT ?"
+    assert short[0] != long[0]
+
+
+async def test_middleware_warns_when_request_exceeds_query_budget(caplog) -> None:
+    registry = MetricsRegistry()
+
+    async def chatty_app(scope, receive, send) -> None:
+        for _ in range(4):
+            registry.observe_statement(("abc", "SELECT ?"), 0.001)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message) -> None:
+        return None
+
+    middleware = MetricsMiddleware(chatty_app, registry, query_budget=3)
+    with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+        await middleware({"type": "http", "method": "GET"}, None, send)
+
+    assert "ran 4 SQL statements (budget 3)" in caplog.text
+    assert registry.request_queries[("GET", "unmatched")].count == 1
+
+
+def test_executions_are_counted_by_compiled_cache_outcome() -> None:
+    registry = MetricsRegistry()
+    engine = create_engine("sqlite://")
+    install_query_metrics(SimpleNamespace(sync_engine=engine), registry)
+    statement = select(column("x")).select_from(select(bindparam("x").label("x")).subquery())
+
+    with engine.connect() as conn:
+        for value in (1, 2, 3):
+            conn.execute(statement, {"x": value})
+
+    assert registry.compiled_cache == {"miss": 1, "hit": 2}
+    assert 'db_compiled_cache_total{result="hit"} 2' in registry.render()
@@ -24,3 +24,33 @@ def test_participant_unique_constraints() -> None:
         if isinstance(constraint, UniqueConstraint) and constraint.name
     }
     assert "uq_event_participants_event_id_team_id" in unique_names
+
+
+def test_events_search_vector_has_gin_index() -> None:
+    event_table = Base.metadata.tables["events"]
+    index = next(index for index in event_table.indexes if index.name == "ix_events_search_vector")
+    assert [column.name for column in index.columns] == ["search_vector"]
+    assert index.dialect_options["postgresql"]["using"] == "gin"
+
+
+def test_participants_index_team_schedule_by_start() -> None:
+    participant_table = Base.metadata.tables["event_participants"]
+    index = next(
+        index for index in participant_table.indexes if index.name == "ix_event_participants_team_id_starts_at"
+    )
+    assert [column.name for column in index.columns] == ["team_id", "starts_at", "event_id"]
+    assert participant_table.c.starts_at.server_default is not None
+
+
+def test_events_due_indexes_are_partial_on_status() -> None:
+    event_table = Base.metadata.tables["events"]
+    indexes = {index.name: index for index in event_table.indexes}
+    assert [c.name for c in indexes["ix_events_due_live"].columns] == ["starts_at"]
+    assert [c.name for c in indexes["ix_events_due_finished"].columns] == ["ends_at"]
+    assert "status" in str(indexes["ix_events_due_finished"].dialect_options["postgresql"]["where"])
+
+
+def test_events_keep_only_the_keyset_start_indexes() -> None:
+    names = {index.name for index in Base.metadata.tables["events"].indexes}
+    assert {"ix_events_starts_at_id", "ix_events_sport_id_starts_at_id"} <= names
+    assert not names & {"ix_events_starts_at", "ix_events_sport_starts_at"}
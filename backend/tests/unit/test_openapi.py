@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.main import app
+
+SNAPSHOT = Path(__file__).resolve().parents[2] / "openapi.json"
+
+
+def test_committed_schema_matches_the_app() -> None:
+    # The frontend generates its API types from this file; refresh it with every API change.
+    assert json.loads(SNAPSHOT.read_text()) == json.loads(json.dumps(app.openapi()))
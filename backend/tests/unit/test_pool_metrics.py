@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.pool_metrics import InstrumentedAsyncPool, PoolMetrics
+
+
+def make_pool(**kwargs) -> InstrumentedAsyncPool:
+    return InstrumentedAsyncPool(MagicMock, **kwargs)
+
+
+def test_pool_records_checkouts_and_overflow() -> None:
+    pool = make_pool(pool_size=1, max_overflow=1)
+
+    first = pool.connect()
+    second = pool.connect()
+    stats = pool.stats()
+
+    assert stats.checkouts == 2
+    assert stats.checked_out == 2
+    assert stats.overflow == 1
+    assert stats.overflow_checkouts == 1
+
+    first.close()
+    second.close()
+    assert pool.stats().checked_out == 0
+
+
+async def test_pool_counts_timeouts() -> None:
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=0.01)
+    held = pool.connect()
+
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    assert pool.stats().timeouts == 1
+    held.close()
+
+
+def test_metrics_survive_recreate() -> None:
+    pool = make_pool(pool_size=1, max_overflow=0)
+    pool.connect().close()
+
+    recreated = pool.recreate()
+
+    assert recreated.metrics is pool.metrics
+    assert recreated.stats().checkouts == 1
+
+
+def test_slow_checkout_threshold() -> None:
+    metrics = PoolMetrics(slow_checkout_ms=50)
+
+    assert metrics.record_wait(0.01, overflow=False) is False
+    assert metrics.record_wait(0.2, overflow=False) is True
+    assert metrics.slow_checkouts == 1
+    assert metrics.wait_max == pytest.approx(0.2)
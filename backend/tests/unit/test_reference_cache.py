@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.api.deps import _reference_change
+from app.services.cache import TTLCache, reference_cache
+from app.services.teams import TeamService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingTeamRepo:
+    def __init__(self, teams):
+        self.teams = teams
+        self.calls = 0
+
+    async def list(self, session, *, sport_id=None):
+        self.calls += 1
+        return self.teams
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(ttl=10, max_entries=4, clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_get_or_load_caches_falsy_values() -> None:
+    cache: TTLCache[str, tuple] = TTLCache(ttl=60, max_entries=2)
+    calls = 0
+
+    async def load() -> tuple:
+        nonlocal calls
+        calls += 1
+        return ()
+
+    assert await cache.get_or_load("empty", load) == ()
+    assert await cache.get_or_load("empty", load) == ()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_team_service_serves_sport_filter_from_index() -> None:
+    sport_a, sport_b = uuid4(), uuid4()
+    teams = [
+        SimpleNamespace(id=uuid4(), sport_id=sport_a, name="Alpha", abbr=None),
+        SimpleNamespace(id=uuid4(), sport_id=sport_b, name="Bravo", abbr="BRV"),
+        SimpleNamespace(id=uuid4(), sport_id=sport_a, name="Charlie", abbr=None),
+    ]
+    repo = CountingTeamRepo(teams)
+    opened = []
+
+    def open_session():
+        opened.append(True)
+        return nullcontext(object())
+
+    service = TeamService(team_repository=repo, cache=TTLCache(ttl=60, max_entries=4))
+
+    by_sport = await service.list_teams(open_session, sport_id=sport_a)
+    assert [t.name for t in by_sport] == ["Alpha", "Charlie"]
+    assert await service.list_teams(open_session, sport_id=uuid4()) == []
+    assert len(await service.list_teams(open_session)) == 3
+    assert (repo.calls, len(opened)) == (1, 1)  # cache hits never open a session
+    assert repo.calls == 1
+
+
+def test_reference_change_notification_drops_named_keys_or_everything() -> None:
+    reference_cache.set("sports", ())
+    reference_cache.set("teams", ())
+
+    _reference_change("teams")
+    assert (reference_cache.get("sports"), reference_cache.get("teams")) == ((), None)
+
+    _reference_change("")
+    assert reference_cache.get("sports") is None
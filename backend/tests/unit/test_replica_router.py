@@ -0,0 +1,80 @@
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import session as db_session
+from app.db.replicas import ReplicaRouter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_candidates_rotate_across_replicas() -> None:
+    router = ReplicaRouter(["a", "b", "c"], retry_after=10)
+
+    assert router.candidates() == ["a", "b", "c"]
+    assert router.candidates() == ["b", "c", "a"]
+    assert router.candidates() == ["c", "a", "b"]
+    assert router.candidates() == ["a", "b", "c"]
+
+
+def test_unhealthy_replica_is_skipped_until_retry_window_passes() -> None:
+    clock = FakeClock()
+    router = ReplicaRouter(["a", "b"], retry_after=10, clock=clock)
+
+    router.mark_unhealthy("a")
+    assert router.candidates() == ["b"]
+    assert [s.healthy for s in router.status()] == [False, True]
+
+    clock.now = 10.0
+    assert "a" in router.candidates()
+    assert all(s.healthy for s in router.status())
+
+
+def test_all_replicas_down_leaves_no_candidates() -> None:
+    router = ReplicaRouter(["a"], retry_after=10)
+    router.mark_unhealthy("a")
+
+    assert router.candidates() == []
+    assert not ReplicaRouter([], retry_after=10)
+
+
+async def test_unreachable_replica_falls_back_to_primary(monkeypatch) -> None:
+    replica = create_async_engine("postgresql+asyncpg://user:pw@127.0.0.1:1/replica")
+    router = ReplicaRouter([replica], retry_after=30)
+    monkeypatch.setattr(db_session, "_replica_router", router)
+
+    async with db_session.open_read_session() as session:
+        assert session.bind is db_session.build_read_only_engine()
+        assert session.bind.pool is db_session.build_engine().pool
+
+    assert router.candidates() == []
+    await replica.dispose()
+
+
+async def test_exhausted_replica_pool_falls_back_to_primary_without_marking_it_down(monkeypatch) -> None:
+    replica = create_async_engine("postgresql+asyncpg://user:pw@127.0.0.1:1/replica")
+    router = ReplicaRouter([replica], retry_after=30)
+    monkeypatch.setattr(db_session, "_replica_router", router)
+
+    def exhausted():
+        raise PoolTimeoutError("QueuePool limit of size 1 overflow 0 reached")
+
+    monkeypatch.setattr(replica.sync_engine.pool, "connect", exhausted)
+
+    async with db_session.open_read_session() as session:
+        assert session.bind is db_session.build_read_only_engine()
+
+    assert router.candidates() == [replica]
+    await replica.dispose()
+
+
+def test_read_sessions_use_one_snapshot_per_transaction() -> None:
+    options = db_session.build_read_only_engine().get_execution_options()
+
+    assert options["postgresql_readonly"] is True
+    assert options["isolation_level"] == "REPEATABLE READ"
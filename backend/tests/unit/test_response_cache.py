@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.db.notify import ChangeKind, EventChange
+from app.models.event import EventStatus
+from app.services import EventService
+from app.services.cache import ResponseCache
+from app.services.event_filters import EventListingKey, EventListParams, EventScope
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(clock=None, **overrides) -> ResponseCache[str, bytes]:
+    options = {"ttl": 10, "stale_ttl": 20, "max_entries": 8, "max_bytes": 1024, "size_of": len}
+    return ResponseCache(**{**options, **overrides}, clock=clock or FakeClock())
+
+
+def _loader(value: bytes, calls: list[bytes]):
+    async def load() -> bytes:
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load() -> None:
+    cache = _cache()
+    calls: list[bytes] = []
+
+    results = await asyncio.gather(*(cache.get_or_load("a", _loader(b"page", calls)) for _ in range(5)))
+
+    assert results == [b"page"] * 5
+    assert calls == [b"page"]
+    assert await cache.get_or_load("a", _loader(b"other", calls)) == b"page"
+    stats = cache.stats()
+    assert (stats.misses, stats.coalesced, stats.hits) == (5, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_one_refresh_runs() -> None:
+    clock = FakeClock()
+    cache = _cache(clock)
+    calls: list[bytes] = []
+    await cache.get_or_load("a", _loader(b"old", calls))
+
+    clock.now = 15
+    assert await cache.get_or_load("a", _loader(b"new", calls)) == b"old"
+    assert await cache.get_or_load("a", _loader(b"newer", calls)) == b"old"
+    await asyncio.sleep(0.01)
+    assert await cache.get_or_load("a", _loader(b"unused", calls)) == b"new"
+    assert calls == [b"old", b"new"]
+    assert cache.stats().refreshes == 1
+
+    clock.now = 100
+    assert await cache.get_or_load("a", _loader(b"reloaded", calls)) == b"reloaded"
+
+
+@pytest.mark.asyncio
+async def test_byte_cap_evicts_least_recently_used_and_skips_oversized_values() -> None:
+    cache = _cache(max_bytes=10)
+    await cache.get_or_load("a", _loader(b"aaaa", []))
+    await cache.get_or_load("b", _loader(b"bbbb", []))
+    await cache.get_or_load("a", _loader(b"", []))
+    await cache.get_or_load("c", _loader(b"cccc", []))
+
+    assert cache.stats().bytes == 8
+    assert cache.stats().evictions == 1
+    assert await cache.get_or_load("a", _loader(b"", [])) == b"aaaa"
+    assert await cache.get_or_load("b", _loader(b"reloaded", [])) == b"reloaded"
+
+    assert await cache.get_or_load("huge", _loader(b"x" * 11, [])) == b"x" * 11
+    assert cache.stats().bytes <= 10
+
+
+@pytest.mark.asyncio
+async def test_invalidation_discards_loads_already_in_flight() -> None:
+    cache = _cache()
+    release = asyncio.Event()
+
+    async def slow() -> bytes:
+        await release.wait()
+        return b"before-write"
+
+    pending = asyncio.ensure_future(cache.get_or_load("a", slow))
+    await asyncio.sleep(0)
+    await cache.get_or_load("b", _loader(b"b", []))
+
+    assert cache.invalidate_where(lambda key: True) == 1
+    release.set()
+    assert await pending == b"before-write"
+    assert await cache.get_or_load("a", _loader(b"after-write", [])) == b"after-write"
+
+
+def test_may_include_matches_on_sport_venue_team_ids_and_dates() -> None:
+    sport, venue, team = uuid4(), uuid4(), uuid4()
+    start = datetime(2026, 10, 17, 18, tzinfo=UTC)
+    written = EventScope(sport, venue, start, id=uuid4(), team_ids=frozenset({team}))
+
+    assert EventListParams().may_include(written)
+    assert EventListParams(sport_id=sport, venue_id=venue, team_id=team).may_include(written)
+    assert EventListParams(date_from=start, date_to=start + timedelta(days=1)).may_include(written)
+    assert not EventListParams(sport_id=uuid4()).may_include(written)
+    assert not EventListParams(venue_id=uuid4()).may_include(written)
+    assert not EventListParams(team_id=uuid4()).may_include(written)
+    assert not EventListParams(ids=(uuid4(),)).may_include(written)
+    assert not EventListParams(date_from=start + timedelta(seconds=1)).may_include(written)
+    assert EventListParams(team_id=uuid4()).may_include(EventScope(sport, venue, start))
+
+
+class MovingRepo:
+    def __init__(self, scope: EventScope):
+        self.scope = scope
+
+    async def transition_status(self, session, **kwargs):
+        return [self.scope]
+
+    async def get_statuses(self, session, ids):
+        return {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("commit", [True, False])
+async def test_writes_drop_matching_listings_only_after_commit(commit: bool) -> None:
+    sport = uuid4()
+    scope = EventScope(sport, None, datetime(2026, 10, 17, 18, tzinfo=UTC), id=uuid4())
+    cache: ResponseCache[EventListingKey, bytes] = ResponseCache(
+        ttl=60, stale_ttl=0, max_entries=8, max_bytes=1024, size_of=len
+    )
+    same_sport, other_sport = EventListingKey(EventListParams(sport_id=sport)), EventListingKey(
+        EventListParams(sport_id=uuid4())
+    )
+    for key in (same_sport, other_sport):
+        await cache.get_or_load(key, _loader(b"page", []))
+    service = EventService(event_repository=MovingRepo(scope), list_cache=cache)
+
+    session = AsyncSession()
+    await session.begin()
+    await service.transition_events(session, [scope.id], EventStatus.CANCELLED)
+    assert cache.stats().size == 2
+    await (session.commit() if commit else session.rollback())
+
+    assert cache.stats().size == (1 if commit else 2)
+    assert await cache.get_or_load(other_sport, _loader(b"reloaded", [])) == b"page"
+
+
+@pytest.mark.asyncio
+async def test_other_workers_writes_drop_matching_listings_via_notifications(monkeypatch) -> None:
+    sport = uuid4()
+    cache: ResponseCache[EventListingKey, bytes] = ResponseCache(
+        ttl=60, stale_ttl=0, max_entries=8, max_bytes=1024, size_of=len
+    )
+    monkeypatch.setattr(deps, "event_list_cache", cache)
+    same_sport, other_sport = EventListingKey(EventListParams(sport_id=sport)), EventListingKey(
+        EventListParams(sport_id=uuid4())
+    )
+    for key in (same_sport, other_sport):
+        await cache.get_or_load(key, _loader(b"page", []))
+
+    starts_at = datetime(2026, 10, 17, 18, tzinfo=UTC)
+    deps._listing_change(EventChange(ChangeKind.updated, uuid4(), sport, None, "live", starts_at).to_payload())
+    assert cache.stats().size == 1
+
+    deps._listing_change(EventChange(ChangeKind.updated, uuid4(), uuid4(), None, "live").to_payload())
+    assert cache.stats().size == 0
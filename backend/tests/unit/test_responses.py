@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+
+from app.api.deps import get_event_list_cache, get_read_db_session_factory
+from app.api.responses import orm_json_response
+from app.api.v1.endpoints import events as events_endpoint
+from app.api.v1.endpoints.teams import get_event_service
+from app.main import app
+from app.models.event import EventParticipantRole, EventStatus
+from app.schemas import EventRead
+from app.services.cache import ResponseCache
+from app.services.event_filters import EventCursor, EventPage
+
+START = datetime(2026, 10, 17, 18, tzinfo=UTC)
+
+
+def _orm_event(**overrides) -> SimpleNamespace:
+    fields = {
+        "id": uuid4(),
+        "sport_id": uuid4(),
+        "sport_name": "Football",
+        "venue_id": None,
+        "title": "Derby",
+        "description": None,
+        "starts_at": START,
+        "ends_at": START + timedelta(hours=2),
+        "status": EventStatus.SCHEDULED,
+        "ticket_url": "https://tickets.example.com/derby",
+        "participants": [SimpleNamespace(team_id=uuid4(), role=EventParticipantRole.HOME, team_name="Reds")],
+    }
+    return SimpleNamespace(**{**fields, **overrides})
+
+
+def test_orm_json_response_matches_response_model_encoding() -> None:
+    rows = [_orm_event(), _orm_event(title="Final", venue_id=uuid4(), ticket_url=None, participants=[])]
+
+    response = orm_json_response(TypeAdapter(list[EventRead]), rows)
+
+    expected = jsonable_encoder([EventRead.model_validate(row) for row in rows])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == expected
+
+
+class PagedEventService:
+    def __init__(self, page):
+        self.page = page
+
+    async def list_team_events_page(self, session, team_id, **kwargs):
+        return self.page
+
+
+@pytest.mark.asyncio
+async def test_endpoint_returns_encoded_body_with_headers_and_unchanged_schema() -> None:
+    event = _orm_event()
+    cursor = EventCursor(starts_at=event.starts_at, id=event.id)
+    app.dependency_overrides[get_event_service] = lambda: PagedEventService(EventPage([event], next_cursor=cursor))
+    app.dependency_overrides[get_read_db_session_factory] = lambda: lambda: nullcontext(None)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get(f"/api/v1/teams/{uuid4()}/events")
+    finally:
+        app.dependency_overrides.pop(get_event_service, None)
+        app.dependency_overrides.pop(get_read_db_session_factory, None)
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Next-Cursor"] == cursor.encode()
+    assert resp.json() == jsonable_encoder([EventRead.model_validate(event)])
+    schema = app.openapi()["paths"]["/api/v1/teams/{team_id}/events"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["items"] == {"$ref": "#/components/schemas/EventRead"}
+
+
+class CountingListService:
+    def __init__(self, event):
+        self.event = event
+        self.loads = 0
+
+    async def list_event_versions(self, session, *, params, count=None):
+        return [(self.event.id, self.event.updated_at)], 1
+
+    async def list_events_page(self, session, *, params):
+        self.loads += 1
+        return EventPage([self.event])
+
+    async def list_events_json(self, session, *, params):
+        self.loads += 1
+        return EventPage(b"[]")
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_replays_cached_listing_and_its_validators() -> None:
+    event = _orm_event(updated_at=datetime(2026, 10, 17, tzinfo=UTC))
+    service = CountingListService(event)
+    cache = ResponseCache(ttl=60, stale_ttl=0, max_entries=8, max_bytes=1 << 20, size_of=lambda listing: 1)
+    app.dependency_overrides[events_endpoint.get_event_service] = lambda: service
+    app.dependency_overrides[get_event_list_cache] = lambda: cache
+    app.dependency_overrides[get_read_db_session_factory] = lambda: lambda: nullcontext(None)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get("/api/v1/events", params={"count": "exact"})
+            second = await client.get("/api/v1/events", params={"count": "exact"})
+            revalidated = await client.get(
+                "/api/v1/events", params={"count": "exact"}, headers={"If-None-Match": first.headers["ETag"]}
+            )
+    finally:
+        app.dependency_overrides.pop(events_endpoint.get_event_service, None)
+        app.dependency_overrides.pop(get_event_list_cache, None)
+        app.dependency_overrides.pop(get_read_db_session_factory, None)
+
+    assert service.loads == 1
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["X-Total-Count"] == "1"
+    assert revalidated.status_code == 304
+
+
+class TrackedSession:
+    def __init__(self) -> None:
+        self.open = False
+
+    async def __aenter__(self) -> None:
+        self.open = True
+
+    async def __aexit__(self, *exc) -> None:
+        self.open = False
+
+
+class EncodedEvent(SimpleNamespace):
+    """An ORM-shaped event that records whether its session was still open when it was encoded."""
+
+    @property
+    def title(self) -> str:
+        self.encoded_while_open.append(self.session.open)
+        return "Derby"
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_encodes_the_page_after_the_read_session_closes() -> None:
+    session = TrackedSession()
+    fields = vars(_orm_event(updated_at=START))
+    del fields["title"]
+    event = EncodedEvent(**fields, session=session, encoded_while_open=[])
+    app.dependency_overrides[events_endpoint.get_event_service] = lambda: CountingListService(event)
+    app.dependency_overrides[get_event_list_cache] = lambda: None
+    app.dependency_overrides[get_read_db_session_factory] = lambda: lambda: session
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/api/v1/events")
+    finally:
+        app.dependency_overrides.pop(events_endpoint.get_event_service, None)
+        app.dependency_overrides.pop(get_event_list_cache, None)
+        app.dependency_overrides.pop(get_read_db_session_factory, None)
+
+    assert resp.status_code == 200
+    assert resp.json()[0]["title"] == "Derby"
+    assert event.encoded_while_open == [False]
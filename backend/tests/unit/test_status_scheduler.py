@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pytest import raises
+
+from app.models.event import EventStatus
+from app.services import EventService, ValidationError
+from app.services.event_filters import EventScope
+from app.services.events import StatusAdvance
+from app.services.status_scheduler import StatusScheduler
+
+NOW = datetime(2026, 10, 17, 12, tzinfo=UTC)
+SPORT = uuid4()
+
+
+class LockSession:
+    def __init__(self, acquired: bool = True):
+        self.acquired = acquired
+
+    async def execute(self, stmt):
+        return SimpleNamespace(scalar_one=lambda: self.acquired)
+
+
+class TransitionRepo:
+    def __init__(self, moved=(), statuses=None):
+        self.moved = list(moved)
+        self.statuses = statuses or {}
+        self.calls = []
+
+    async def transition_status(self, session, **kwargs):
+        self.calls.append(kwargs)
+        return [
+            EventScope(SPORT, None, NOW, id=event_id)
+            for event_id in self.moved
+            if event_id in kwargs.get("ids", self.moved)
+        ]
+
+    async def get_statuses(self, session, ids):
+        return {event_id: self.statuses[event_id] for event_id in ids if event_id in self.statuses}
+
+
+@pytest.mark.asyncio
+async def test_transition_events_reports_ids_that_did_not_move():
+    moved, finished, cancelled, missing = uuid4(), uuid4(), uuid4(), uuid4()
+    repo = TransitionRepo(moved=[moved], statuses={finished: EventStatus.FINISHED, cancelled: EventStatus.CANCELLED})
+    service = EventService(event_repository=repo)
+
+    result = await service.transition_events(
+        object(), [cancelled, moved, finished, missing, moved], EventStatus.CANCELLED
+    )
+
+    assert result.updated == [moved]
+    assert [(err.id, err.detail) for err in result.errors] == [
+        (cancelled, "Event is already cancelled."),
+        (finished, "Event cannot move from finished to cancelled."),
+        (missing, "Event not found."),
+    ]
+    assert repo.calls[0]["sources"] == (EventStatus.SCHEDULED, EventStatus.LIVE)
+    assert repo.calls[0]["ids"] == [cancelled, moved, finished, missing]
+
+
+@pytest.mark.asyncio
+async def test_transition_events_rejects_targets_without_manual_transitions():
+    with raises(ValidationError):
+        await EventService(event_repository=TransitionRepo()).transition_events(
+            object(), [uuid4()], EventStatus.SCHEDULED
+        )
+
+
+@pytest.mark.asyncio
+async def test_advance_statuses_finishes_then_starts_due_events():
+    repo = TransitionRepo(moved=[uuid4()])
+    advance = await EventService(event_repository=repo).advance_statuses(LockSession(), now=NOW, batch_size=50)
+
+    assert advance == StatusAdvance(went_live=1, finished=1)
+    finish, start = repo.calls
+    assert finish == {
+        "to": EventStatus.FINISHED,
+        "sources": (EventStatus.SCHEDULED, EventStatus.LIVE),
+        "ends_by": NOW,
+        "limit": 50,
+    }
+    assert start["to"] == EventStatus.LIVE and start["starts_by"] == NOW and start["ends_after"] == NOW
+
+
+@pytest.mark.asyncio
+async def test_advance_statuses_skips_when_another_process_holds_the_lock():
+    repo = TransitionRepo(moved=[uuid4()])
+    advance = await EventService(event_repository=repo).advance_statuses(
+        LockSession(acquired=False), now=NOW, batch_size=50
+    )
+
+    assert advance is None
+    assert repo.calls == []
+
+
+class ScriptedService:
+    def __init__(self, *advances):
+        self.advances = list(advances)
+        self.calls = 0
+
+    async def advance_statuses(self, session, *, now, batch_size):
+        self.calls += 1
+        return self.advances.pop(0)
+
+
+class FakeSession:
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+
+@asynccontextmanager
+async def _session():
+    yield FakeSession()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tick_repeats_batches_until_one_comes_back_short():
+    service = ScriptedService(StatusAdvance(10, 3), StatusAdvance(2, 10), StatusAdvance(0, 4))
+    scheduler = StatusScheduler(_session, batch_size=10, service=service, clock=lambda: NOW)
+
+    tick = await scheduler.run_once()
+
+    assert (tick.went_live, tick.finished, tick.batches, tick.skipped) == (12, 17, 3, False)
+    assert service.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tick_is_skipped_without_the_lock():
+    scheduler = StatusScheduler(_session, batch_size=10, service=ScriptedService(None), clock=lambda: NOW)
+
+    tick = await scheduler.run_once()
+
+    assert tick.skipped and tick.batches == 0
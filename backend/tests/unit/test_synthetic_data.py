@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from app.db.synthetic import SyntheticData, SyntheticDataSpec
+
+SPEC = SyntheticDataSpec(sports=8, teams_per_sport=24, venues=40, events=3000, seasons=2, field_size=6, seed=3)
+
+
+def event_rows(spec: SyntheticDataSpec) -> list[tuple]:
+    return list(SyntheticData(spec).events())
+
+
+def test_same_seed_yields_identical_rows_and_ids() -> None:
+    first, second = SyntheticData(SPEC), SyntheticData(SPEC)
+
+    assert first.sports == second.sports
+    assert first.teams == second.teams
+    assert first.venues == second.venues
+    assert list(first.events()) == list(second.events())
+    assert event_rows(SPEC)[0] != event_rows(replace(SPEC, seed=4))[0]
+
+
+def test_events_come_in_start_order_with_requested_counts() -> None:
+    events = event_rows(SPEC)
+
+    assert len(events) == SPEC.events
+    starts = [event[5] for event, _ in events]
+    assert starts == sorted(starts)
+    assert len({event[0] for event, _ in events}) == SPEC.events
+    assert all(event[5] < event[6] for event, _ in events)
+
+
+def test_head_to_head_events_pair_two_distinct_teams_of_their_sport() -> None:
+    data = SyntheticData(SPEC)
+    sport_of_team = {team[0]: team[1] for team in data.teams}
+
+    roles = Counter()
+    for event, participants in data.events():
+        teams = [participant[2] for participant in participants]
+        assert len(set(teams)) == len(teams)
+        assert {sport_of_team[team] for team in teams} == {event[1]}
+        kinds = [participant[3] for participant in participants]
+        assert kinds == ["home", "away"] or kinds == ["participant"] * SPEC.field_size
+        roles.update(kinds)
+
+    assert roles["home"] == roles["away"] > 0
+    assert roles["participant"] > 0
+
+
+def test_no_team_or_venue_is_double_booked() -> None:
+    teams: dict = defaultdict(list)
+    venues: dict = defaultdict(list)
+    for event, participants in event_rows(SPEC):
+        period = (event[5], event[6])
+        for participant in participants:
+            teams[participant[2]].append(period)
+        if event[2] is not None and event[7] != "cancelled":
+            venues[event[2]].append(period)
+
+    for periods in [*teams.values(), *venues.values()]:
+        periods.sort()
+        assert all(later[0] >= earlier[1] for earlier, later in zip(periods, periods[1:], strict=False))
+
+
+def test_statuses_follow_the_reference_time() -> None:
+    as_of = datetime(2025, 3, 1, tzinfo=UTC)
+    events = [event for event, _ in event_rows(replace(SPEC, as_of=as_of))]
+
+    for event in events:
+        if event[7] == "finished":
+            assert event[6] <= as_of
+        elif event[7] == "scheduled":
+            assert event[5] > as_of
+        elif event[7] == "live":
+            assert event[5] <= as_of < event[6]
+    assert {"finished", "scheduled", "cancelled"} <= {event[7] for event in events}
+
+
+def test_rejects_more_matchdays_than_a_season_can_hold() -> None:
+    with pytest.raises(ValueError, match="do not fit"):
+        SyntheticData(SyntheticDataSpec(sports=1, teams_per_sport=2, events=5000, seasons=1))
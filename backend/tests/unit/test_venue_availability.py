@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services import ValidationError, VenueService
+from app.services.venues import free_gaps, merge_bookings
+
+DAY = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def hours(n: float) -> datetime:
+    return DAY + timedelta(hours=n)
+
+
+def test_merge_bookings_clips_and_merges_overlapping_and_touching() -> None:
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    bookings = [
+        (a, hours(-3), hours(2)),  # starts before the window
+        (b, hours(1), hours(4)),
+        (c, hours(4), hours(5)),  # touches b
+        (d, hours(20), hours(30)),  # runs past the window
+    ]
+
+    busy = merge_bookings(bookings, DAY, hours(24))
+
+    assert [(i.starts_at, i.ends_at, i.event_ids) for i in busy] == [
+        (DAY, hours(5), [a, b, c]),
+        (hours(20), hours(24), [d]),
+    ]
+    free = free_gaps(busy, DAY, hours(24))
+    assert [(i.starts_at, i.ends_at) for i in free] == [(hours(5), hours(20))]
+
+
+def test_free_gaps_of_empty_schedule_is_whole_window() -> None:
+    free = free_gaps([], DAY, hours(8))
+    assert [(i.starts_at, i.ends_at) for i in free] == [(DAY, hours(8))]
+
+
+class StubVenueRepo:
+    def __init__(self, venue):
+        self.venue = venue
+
+    async def get(self, session, venue_id):
+        return self.venue
+
+
+class StubEventRepo:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    async def list_venue_bookings(self, session, **kwargs):
+        self.calls += 1
+        return self.rows
+
+
+@pytest.mark.asyncio
+async def test_get_availability_validates_window_before_querying() -> None:
+    events = StubEventRepo([])
+    service = VenueService(venue_repository=StubVenueRepo(object()), event_repository=events)
+
+    with pytest.raises(ValidationError):
+        await service.get_availability(object(), uuid4(), date_from=hours(2), date_to=hours(1))
+    with pytest.raises(ValidationError):
+        await service.get_availability(object(), uuid4(), date_from=DAY, date_to=DAY + timedelta(days=120))
+    assert events.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_get_availability_returns_none_for_unknown_venue() -> None:
+    events = StubEventRepo([])
+    service = VenueService(venue_repository=StubVenueRepo(None), event_repository=events)
+
+    assert await service.get_availability(object(), uuid4(), date_from=DAY, date_to=hours(1)) is None
+    assert events.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_get_availability_splits_window_into_busy_and_free() -> None:
+    venue_id = uuid4()
+    booking = SimpleNamespace(id=uuid4(), starts_at=hours(10), ends_at=hours(12))
+    service = VenueService(venue_repository=StubVenueRepo(object()), event_repository=StubEventRepo([booking]))
+
+    result = await service.get_availability(object(), venue_id, date_from=DAY, date_to=hours(24))
+
+    assert result.venue_id == venue_id
+    assert [(i.starts_at, i.ends_at) for i in result.busy] == [(hours(10), hours(12))]
+    assert [(i.starts_at, i.ends_at) for i in result.free] == [(DAY, hours(10)), (hours(12), hours(24))]
@@ -1,6 +1,6 @@
 import type { components, paths } from '@api/generated-schema'
 
-import { httpRequest } from './http'
+import { buildUrl, httpRequest } from './http'
 
 type EventsQuerySchema = NonNullable<paths['/api/v1/events']['get']['parameters']['query']>
 
@@ -42,3 +42,26 @@ export const createEvent = async (payload: EventCreatePayload): Promise<EventRea
 export const getEvent = async (eventId: string): Promise<EventRead> => {
   return httpRequest<EventRead>(`/events/${eventId}`)
 }
+
+export type EventStreamFilters = Pick<EventsQuery, 'sport_id' | 'venue_id' | 'status'>
+
+export interface EventStreamHandlers {
+  onChange: (event: EventRead, kind: 'created' | 'updated') => void
+  /** Messages were missed; refetch before trusting the current list again. */
+  onReset: () => void
+}
+
+/** Listen to `/events/stream`; returns a function that closes the connection. */
+export const subscribeToEvents = (
+  filters: EventStreamFilters,
+  { onChange, onReset }: EventStreamHandlers,
+): (() => void) => {
+  const source = new EventSource(buildUrl('/events/stream', filters).toString())
+  const handle = (kind: 'created' | 'updated') => (message: MessageEvent<string>) => {
+    onChange(JSON.parse(message.data) as EventRead, kind)
+  }
+  source.addEventListener('created', handle('created'))
+  source.addEventListener('updated', handle('updated'))
+  source.addEventListener('reset', () => onReset())
+  return () => source.close()
+}
@@ -17,7 +17,7 @@ const toURLSearchParams = (
   return search
 }
 
-const buildUrl = (
+export const buildUrl = (
   path: string,
   query?: Record<string, string | number | boolean | null | undefined>,
 ): URL => {
@@ -1,6 +1,12 @@
-import { useCallback, useEffect, useMemo, useState } from 'react'
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 
-import { defaultEventFilters, listEvents, type EventRead, type EventsQuery } from '@api/events'
+import {
+  defaultEventFilters,
+  listEvents,
+  subscribeToEvents,
+  type EventRead,
+  type EventsQuery,
+} from '@api/events'
 
 const isAbortError = (error: unknown): boolean =>
   error instanceof DOMException && error.name === 'AbortError'
@@ -69,6 +75,33 @@ export const useEvents = (initialFilters: Partial<EventsQuery> = {}): UseEventsR
     return () => controller.abort()
   }, [fetchEvents])
 
+  // Live status changes are patched into the current page instead of polling for them.
+  const { sport_id, venue_id, status } = normalizedFilters
+  const refreshRef = useRef(refresh)
+  useEffect(() => {
+    refreshRef.current = refresh
+  }, [refresh])
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') {
+      return undefined
+    }
+    return subscribeToEvents(
+      { sport_id, venue_id, status },
+      {
+        onChange: (changed, kind) => {
+          if (kind === 'updated') {
+            setEvents((current) =>
+              current.map((event) => (event.id === changed.id ? changed : event)),
+            )
+          }
+        },
+        onReset: () => {
+          refreshRef.current().catch(() => undefined)
+        },
+      },
+    )
+  }, [sport_id, venue_id, status])
+
   const setFilters = useCallback((patch: Partial<EventsQuery>) => {
     const shouldResetPage = Object.keys(patch).some((key) => key !== 'page')
 